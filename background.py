@@ -0,0 +1,45 @@
+"""Camera frame -> background Surface without per-frame allocations.
+
+The original path was ``cvtColor -> resize -> np.rot90 -> surfarray.make_surface``,
+which copies the frame several times and creates a new Surface every tick.
+`CameraBackground` keeps one BGR pixel buffer plus a Surface created once
+with ``pygame.image.frombuffer`` that shares its memory, so presenting a
+frame is just: mirror (and resize when the camera size differs from the
+screen) straight into that buffer, then blit. No color conversion and no
+rotation are needed because the Surface reads BGR rows directly.
+"""
+import cv2
+import numpy as np
+import pygame
+
+
+class CameraBackground:
+    """Persistent mirrored background surface fed with BGR camera frames."""
+
+    def __init__(self, size):
+        self.size = (int(size[0]), int(size[1]))
+        w, h = self.size
+        self._buf = np.empty((h, w, 3), dtype=np.uint8)
+        # shares memory with _buf: writing pixels there updates the surface
+        self.surface = pygame.image.frombuffer(self._buf, self.size, "BGR")
+        self._mirror_buf = None  # camera-sized scratch when a resize is needed
+
+    def update(self, bgr):
+        """Present `bgr` (mirrored, kanan tetap kanan) and return the surface."""
+        h, w = bgr.shape[:2]
+        if (w, h) == self.size:
+            cv2.flip(bgr, 1, dst=self._buf)
+        else:
+            # mirror at camera resolution (usually smaller), then scale into the buffer
+            if self._mirror_buf is None or self._mirror_buf.shape != bgr.shape:
+                self._mirror_buf = np.empty_like(bgr)
+            cv2.flip(bgr, 1, dst=self._mirror_buf)
+            cv2.resize(self._mirror_buf, self.size, dst=self._buf, interpolation=cv2.INTER_LINEAR)
+        return self.surface
+
+
+def legacy_frame_surface(bgr, size):
+    """The original per-frame conversion, kept for benchmarks and comparisons."""
+    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+    frame = cv2.resize(rgb, size)
+    return pygame.surfarray.make_surface(np.rot90(frame))
@@ -0,0 +1,60 @@
+"""Micro-benchmark: camera frame -> background surface, legacy vs CameraBackground.
+
+Run from the project folder:  python benchmarks/bench_background.py
+Works headless (uses the SDL dummy video driver when no display is set).
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from background import CameraBackground, legacy_frame_surface
+
+SCREEN = (800, 600)
+CAMERA_SIZES = [(640, 480), (800, 600), (1280, 720)]
+ITERATIONS = 300
+
+
+def per_frame_ms(fn, iterations=ITERATIONS):
+    fn()  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - t0) / iterations * 1000.0
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    rng = np.random.default_rng(0)
+    print(f"{'camera':>10} | {'legacy ms':>9} | {'reused ms':>9} | speedup | max px diff")
+    for cam_w, cam_h in CAMERA_SIZES:
+        frame = rng.integers(0, 256, (cam_h, cam_w, 3), dtype=np.uint8)
+        bg = CameraBackground(SCREEN)
+
+        def legacy():
+            screen.blit(legacy_frame_surface(frame, SCREEN), (0, 0))
+
+        def reused():
+            screen.blit(bg.update(frame), (0, 0))
+
+        t_legacy = per_frame_ms(legacy)
+        t_reused = per_frame_ms(reused)
+
+        # both paths must show the same mirrored image
+        legacy()
+        a = pygame.surfarray.array3d(screen).astype(np.int16)
+        reused()
+        b = pygame.surfarray.array3d(screen).astype(np.int16)
+        diff = int(np.abs(a - b).max())
+        print(f"{cam_w:>4}x{cam_h:<5} | {t_legacy:9.3f} | {t_reused:9.3f} | {t_legacy / t_reused:6.2f}x | {diff}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Micro-benchmark: point vs swept slice detection (collision.py).
+
+Run from the project folder:  python benchmarks/bench_collision.py
+
+The first table sweeps a finger straight across a row of fruits at several
+speeds (pixels per frame, i.e. how far the fingertip moves between two
+tracked frames) and counts the fruits each test would slice. The point test
+only sees the fingertip once per frame and misses fruits as soon as a step
+is wider than a fruit; the swept test checks the whole path.
+
+The second table times one frame's hit test for N objects and two players:
+`player_near` (the point test main.py used before `collision.py`) per
+object in Python versus one `collision.slicers` call.
+"""
+import math
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from collision import finger_segments, slicers
+from players import Player
+
+WIDTH = 800
+RADIUS = 40
+SPEEDS = [20, 60, 100, 160, 240]
+COUNTS = [10, 100, 1000, 5000]
+FRAMES = 60
+
+
+def player_near(players, x, y, radius):
+    """Old point test: first player whose fingertip is within `radius` of (x, y), or None."""
+    for player in players:
+        if player.has_finger() and math.hypot(x - player.finger_x, y - player.finger_y) < radius:
+            return player
+    return None
+
+
+def swipe_hits(speed, swept):
+    """Fruits sliced by one left-to-right swipe at `speed` px/frame."""
+    player = Player(0)
+    fruits = [(x, 300.0) for x in range(60, WIDTH - 40, 100)]
+    alive = [True] * len(fruits)
+    sliced = 0
+    x = 1.0
+    while x < WIDTH:
+        player.finger_x, player.finger_y = int(x), 310
+        player.trail.append((player.finger_x, player.finger_y))
+        if swept:
+            hits = slicers([player], finger_segments([player]), fruits, RADIUS)
+        else:
+            hits = [player_near([player], fx, fy, RADIUS) for fx, fy in fruits]
+        for i, hit in enumerate(hits):
+            if hit is not None and alive[i]:
+                alive[i] = False
+                sliced += 1
+        x += speed
+    return sliced, len(fruits)
+
+
+def make_players(rng):
+    players = [Player(0), Player(1)]
+    for player in players:
+        player.finger_x, player.finger_y = rng.randint(0, WIDTH), rng.randint(0, 600)
+        player.trail = [(player.finger_x - rng.randint(0, 120), player.finger_y), (player.finger_x, player.finger_y)]
+    return players
+
+
+def timed(n, swept):
+    rng = random.Random(2)
+    players = make_players(rng)
+    centers = [(rng.uniform(0, WIDTH), rng.uniform(0, 600)) for _ in range(n)]
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        if swept:
+            slicers(players, finger_segments(players), centers, RADIUS)
+        else:
+            [player_near(players, cx, cy, RADIUS) for cx, cy in centers]
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def main():
+    print(f"{'px/frame':>8} | {'point':>7} | {'swept':>7}  (fruits sliced by one swipe)")
+    for speed in SPEEDS:
+        p, total = swipe_hits(speed, swept=False)
+        s, _ = swipe_hits(speed, swept=True)
+        print(f"{speed:>8} | {p:>3}/{total:<3} | {s:>3}/{total:<3}")
+    print(f"\n{'objects':>8} | {'point ms':>8} | {'swept ms':>8}  (2 players, per frame)")
+    for n in COUNTS:
+        print(f"{n:>8} | {timed(n, False):8.3f} | {timed(n, True):8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Micro-benchmark: entity update loops, dicts vs the `__slots__` classes in entities.py.
+
+Run from the project folder:  python benchmarks/bench_entities.py
+
+Only the bookkeeping main.py does per entity and frame is timed (no
+drawing): thrown objects move, fall and are checked against the bottom
+edge; halves also age, blend their start velocity, spin and fade. "bytes"
+is the memory of one entity (object plus its field container) measured
+with tracemalloc.
+
+The second table times culling: every frame CULL_SHARE of the halves die
+and as many new ones spawn (a boom plus a combo). "remove" iterates a copy
+and calls ``list.remove`` per dead half like the old loops; "sweep" flags
+them and compacts once with `entities.sweep`.
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from entities import Half, Thrown, sweep
+
+COUNTS = [10, 100, 1000, 5000]
+FRAMES = 60
+HEIGHT = 600
+CULL_SHARE = 0.1
+
+
+def make_dicts(rng, n):
+    thrown = [{"x": rng.uniform(40, 680), "y": 640, "vx": rng.choice([-7, -5, 5, 7]), "vy": rng.randint(-30, -20),
+               "img": None, "type": "fruit"} for _ in range(n)]
+    halves = [{"x": rng.uniform(40, 680), "y": 300.0, "vx": rng.uniform(-8, 8), "vy": rng.uniform(-12, -6),
+               "img": None, "angle": 0.0, "avel": rng.uniform(-5, 5), "alpha": 255, "life": 10 ** 6,
+               "max_life": 10 ** 6, "vel_smooth_frames": 6, "target_vx": 3.0, "target_vy": -3.0} for _ in range(n)]
+    return thrown, halves
+
+
+def make_slots(rng, n):
+    thrown = [Thrown(rng.uniform(40, 680), 640, rng.choice([-7, -5, 5, 7]), rng.randint(-30, -20), None, "fruit")
+              for _ in range(n)]
+    halves = [Half(rng.uniform(40, 680), 300.0, rng.uniform(-8, 8), rng.uniform(-12, -6), None, 0.0,
+                   rng.uniform(-5, 5), 10 ** 6, vel_smooth_frames=6, target_vx=3.0, target_vy=-3.0)
+              for _ in range(n)]
+    return thrown, halves
+
+
+def update_dicts(thrown, halves):
+    """The dict-based loops main.py used before entities.py."""
+    gone = 0
+    for obj in thrown:
+        obj["x"] += obj.get("vx", 0)
+        obj["y"] += obj.get("vy", 0)
+        obj["vy"] += 1
+        if obj["y"] > HEIGHT + 80:
+            gone += 1
+    for half in halves:
+        half["age"] = half.get("age", 0) + 1
+        sf = half.get("vel_smooth_frames", 0)
+        if sf and half.get("age", 0) <= sf:
+            t = float(half.get("age", 0)) / float(sf)
+            vx_t = half.get("target_vx", half.get("vx", 0))
+            vy_t = half.get("target_vy", half.get("vy", 0))
+            half["vx"] = half.get("vx", 0) * (1.0 - t) + vx_t * t
+            half["vy"] = half.get("vy", 0) * (1.0 - t) + vy_t * t
+        half["x"] += half["vx"]
+        half["y"] += half["vy"]
+        half["vy"] += 0.8
+        half["angle"] += half.get("avel", 0)
+        half["life"] = half.get("life", 0) - 1
+        if half.get("max_life"):
+            alpha = int(255 * (half["life"] / half["max_life"]))
+        else:
+            alpha = int(255 * (half["life"] / 45))
+        half["alpha"] = max(0, min(255, alpha))
+        if half["life"] <= 0 or half["alpha"] <= 0 or half["y"] > HEIGHT + 120:
+            gone += 1
+    return gone
+
+
+def update_slots(thrown, halves):
+    gone = 0
+    for obj in thrown:
+        obj.x += obj.vx
+        obj.y += obj.vy
+        obj.vy += 1
+        if obj.y > HEIGHT + 80:
+            gone += 1
+    for half in halves:
+        half.age += 1
+        sf = half.vel_smooth_frames
+        if sf and half.age <= sf:
+            t = float(half.age) / float(sf)
+            half.vx = half.vx * (1.0 - t) + half.target_vx * t
+            half.vy = half.vy * (1.0 - t) + half.target_vy * t
+        half.x += half.vx
+        half.y += half.vy
+        half.vy += 0.8
+        half.angle += half.avel
+        half.life -= 1
+        if half.max_life:
+            alpha = int(255 * (half.life / half.max_life))
+        else:
+            alpha = int(255 * (half.life / 45))
+        half.alpha = max(0, min(255, alpha))
+        if half.life <= 0 or half.alpha <= 0 or half.y > HEIGHT + 120:
+            gone += 1
+    return gone
+
+
+def timed(make, update, n):
+    thrown, halves = make(random.Random(0), n)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        update(thrown, halves)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def bytes_per_entity(make, n=2000):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    thrown, halves = make(random.Random(0), n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / (2 * n)
+
+
+def new_half(rng):
+    return Half(rng.uniform(40, 680), 300.0, rng.uniform(-8, 8), rng.uniform(-12, -6), None, 0.0,
+                rng.uniform(-5, 5), 45)
+
+
+def cull_remove(halves, rng):
+    for half in halves[:]:
+        half.life -= 1
+        if rng.random() < CULL_SHARE:
+            if half in halves:
+                halves.remove(half)
+
+
+def cull_sweep(halves, rng):
+    for half in halves:
+        half.life -= 1
+        if rng.random() < CULL_SHARE:
+            half.dead = True
+    sweep(halves)
+
+
+def timed_cull(cull, n):
+    rng = random.Random(1)
+    halves = [new_half(rng) for _ in range(n)]
+    total = 0.0
+    for _ in range(FRAMES):
+        t0 = time.perf_counter()
+        cull(halves, rng)
+        total += time.perf_counter() - t0
+        halves.extend(new_half(rng) for _ in range(n - len(halves)))
+    return total / FRAMES * 1000.0
+
+
+def main():
+    print(f"bytes per entity (thrown + half average): dict {bytes_per_entity(make_dicts):.0f}, "
+          f"slots {bytes_per_entity(make_slots):.0f}")
+    print(f"{'entities':>8} | {'dict ms':>8} | {'slots ms':>8} | speedup  (thrown + halves each, per frame)")
+    for n in COUNTS:
+        d = timed(make_dicts, update_dicts, n)
+        s = timed(make_slots, update_slots, n)
+        print(f"{n:>8} | {d:8.3f} | {s:8.3f} | {d / s:5.2f}x")
+    print(f"\n{'halves':>8} | {'remove ms':>9} | {'sweep ms':>8} | speedup  ({CULL_SHARE:.0%} culled per frame)")
+    for n in COUNTS:
+        r = timed_cull(cull_remove, n)
+        w = timed_cull(cull_sweep, n)
+        print(f"{n:>8} | {r:9.3f} | {w:8.3f} | {r / w:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
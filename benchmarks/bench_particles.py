@@ -0,0 +1,134 @@
+"""Micro-benchmark: particle update and draw, list of dicts vs the NumPy ParticleSystem.
+
+Run from the project folder:  python benchmarks/bench_particles.py
+Works headless (uses the SDL dummy video driver when no display is set).
+
+Particles are kept at a steady count (dead ones are respawned) so every frame
+does the same amount of work. "update" is physics, homing and culling only;
+"frame" also draws every particle: a new Surface per particle for the dicts,
+cached sprites and one ``blits`` call for the ParticleSystem ("saved" is the
+Surface allocations the sprite cache avoided in the last frame).
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from particles import ParticleSystem
+
+SCREEN = (800, 600)
+COUNTS = [1000, 5000, 10000]
+FRAMES = 60
+UI_SHARE = 0.2  # share of coin particles homing to the UI
+
+
+def spawn_args(rng, n):
+    xs, ys, vxs, vys, lifes, sizes, ui = [], [], [], [], [], [], []
+    for _ in range(n):
+        xs.append(rng.uniform(100, 700))
+        ys.append(rng.uniform(200, 500))
+        vxs.append(rng.uniform(-3.0, 3.0))
+        vys.append(rng.uniform(-5.0, -1.0))
+        lifes.append(rng.randint(18, 60))
+        sizes.append(rng.randint(2, 6))
+        ui.append(rng.random() < UI_SHARE)
+    return xs, ys, vxs, vys, lifes, sizes, ui
+
+
+def old_update(particles, draw, screen):
+    """The list-of-dicts loop main.py used before particles.py (per-particle draw included)."""
+    width, height = SCREEN
+    for p in particles[:]:
+        if p.get("to_ui"):
+            target_x = width - 48 - 12
+            target_y = 12 + 12
+            dx = target_x - p["x"]
+            dy = target_y - p["y"]
+            dist = max(1.0, math.hypot(dx, dy))
+            desired_speed = max(2.0, dist * 0.08)
+            p["vx"] = p.get("vx", 0) * 0.86 + dx / dist * desired_speed * 0.14
+            p["vy"] = p.get("vy", 0) * 0.86 + dy / dist * desired_speed * 0.14
+            p["x"] += p.get("vx", 0)
+            p["y"] += p.get("vy", 0)
+            p["age"] = p.get("age", 0) + 1
+            if math.hypot(target_x - p["x"], target_y - p["y"]) < 12:
+                particles.remove(p)
+                continue
+        else:
+            p["x"] += p.get("vx", 0)
+            p["y"] += p.get("vy", 0)
+            p["vy"] = p.get("vy", 0) + 0.18
+            p["age"] = p.get("age", 0) + 1
+        ratio = max(0.0, p.get("life", 1) / float(max(1, p.get("max_life", 1))))
+        alpha = int(255 * ratio)
+        if draw:
+            sz = max(1, int(p.get("size", 3)))
+            surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+            col = p.get("color", (255, 255, 255))
+            pygame.draw.circle(surf, (col[0], col[1], col[2], alpha), (sz, sz), sz)
+            screen.blit(surf, (int(p["x"] - sz), int(p["y"] - sz)))
+        p["life"] = p.get("life", 0) - 1
+        if p["life"] <= 0 or p["y"] > height + 240 or p["x"] < -60 or p["x"] > width + 60:
+            particles.remove(p)
+
+
+def run_old(screen, count, draw):
+    rng = random.Random(0)
+    particles = []
+
+    def top_up():
+        xs, ys, vxs, vys, lifes, sizes, ui = spawn_args(rng, count - len(particles))
+        for i in range(len(xs)):
+            particles.append({"x": xs[i], "y": ys[i], "vx": vxs[i], "vy": vys[i], "color": (255, 120, 0),
+                              "life": lifes[i], "max_life": lifes[i], "size": sizes[i], "age": 0, "to_ui": ui[i]})
+
+    top_up()
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        old_update(particles, draw, screen)
+        top_up()
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def run_new(screen, count, draw):
+    rng = random.Random(0)
+    system = ParticleSystem(count)
+
+    def top_up():
+        xs, ys, vxs, vys, lifes, sizes, ui = spawn_args(rng, count - len(system))
+        system.emit(xs, ys, vxs, vys, lifes, sizes, (255, 120, 0), to_ui=ui)
+
+    top_up()
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        system.update(*SCREEN)
+        if draw:
+            system.draw(screen)
+        top_up()
+    return (time.perf_counter() - t0) / FRAMES * 1000.0, system.sprites.stats()["saved/frame"]
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    print(f"{'particles':>9} | {'dict update':>11} | {'soa update':>10} | {'dict frame':>10} | {'soa frame':>9} | "
+          f"{'saved':>5}  (ms, incl. respawn)")
+    for count in COUNTS:
+        old_update_ms = run_old(screen, count, False)
+        new_update_ms = run_new(screen, count, False)[0]
+        old_frame_ms = run_old(screen, count, True)
+        new_frame_ms, saved = run_new(screen, count, True)
+        print(f"{count:>9} | {old_update_ms:11.2f} | {new_update_ms:10.2f} | {old_frame_ms:10.2f} | "
+              f"{new_frame_ms:9.2f} | {saved:>5}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
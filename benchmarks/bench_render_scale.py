@@ -0,0 +1,96 @@
+"""Micro-benchmark: an effect-heavy world pass at several render scales.
+
+Run from the project folder:  python benchmarks/bench_render_scale.py
+Works headless (uses the SDL dummy video driver when no display is set).
+
+One frame is what main.py draws during a busy moment: the camera frame
+mirrored and resized into the background, a dozen fruits, the splash layer,
+a few hundred particles, two overlapping boom splatters and the combo flash.
+At scales below 1 everything goes into the smaller `RenderScaler` surface and
+"present" is the single upscale onto the screen (already part of the frame
+time).
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pygame
+
+from background import CameraBackground
+from particles import ParticleSystem, SplashSystem
+from render_cache import SplatterOverlay, SurfacePool
+from render_scale import RenderScaler
+
+SCREEN = (800, 600)
+CAMERA = (640, 480)
+SCALES = [1.0, 0.75, 0.5]
+FRAMES = 120
+FRUITS = 12
+
+
+def make_blobs(rng):
+    width, height = SCREEN
+    return [(rng.uniform(0, width), rng.uniform(0, height), rng.randint(6, 48), rng.randint(40, 200))
+            for _ in range(min(220, max(80, int((width * height) / 12000))))]
+
+
+def simulate(screen, scale):
+    rng = random.Random(4)
+    scaler = RenderScaler(SCREEN, scale)
+    background = CameraBackground(scaler.size)
+    pool = SurfacePool(scaler.size)
+    splatters = SplatterOverlay(scaler.size, scale=scaler.scale)
+    particles = ParticleSystem()
+    splashes = SplashSystem()
+    camera = np.random.default_rng(0).integers(0, 255, (CAMERA[1], CAMERA[0], 3), dtype=np.uint8)
+    fruit = pygame.Surface((80, 80), pygame.SRCALPHA)
+    pygame.draw.circle(fruit, (220, 60, 40, 255), (40, 40), 38)
+    fruits = [(rng.uniform(0, 720), rng.uniform(0, 520)) for _ in range(FRUITS)]
+    t0 = time.perf_counter()
+    for frame in range(FRAMES):
+        pool.begin_frame()
+        world = scaler.begin(screen)
+        world.blit(background.update(camera), (0, 0))
+        for fx, fy in fruits:
+            world.blit(scaler.image(fruit), scaler.pos(fx, fy))
+        if frame % 30 == 0:
+            splatters.add((255, 200, 60), make_blobs(rng), 90)
+        if len(splashes) < 60:
+            splashes.emit([rng.uniform(200, 600) for _ in range(20)], 300.0,
+                          [rng.uniform(-4, 4) for _ in range(20)], -4.0, 40, (255, 80, 40),
+                          [rng.uniform(0, 6) for _ in range(20)])
+        if len(particles) < 400:
+            particles.emit([rng.uniform(100, 700) for _ in range(100)], 300.0,
+                           [rng.uniform(-3, 3) for _ in range(100)], -3.0, 45, 4, (255, 160, 0))
+        surf = pool.get()
+        splashes.update()
+        splashes.draw(surf, scaler.scale)
+        world.blit(surf, (0, 0))
+        particles.update(*SCREEN)
+        particles.draw(world, scaler.scale)
+        splatters.draw(world)
+        flash = pool.get(clear=False)
+        flash.fill((255, 255, 255, 60))
+        world.blit(flash, (0, 0))
+        scaler.present(screen)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0, scaler
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    print(f"{'scale':>5} | {'world size':>10} | {'frame ms':>8} | present ms")
+    for scale in SCALES:
+        ms, scaler = simulate(screen, scale)
+        print(f"{scaler.scale:5.2f} | {scaler.stats()['size']:>10} | {ms:8.2f} | {scaler.present_ms:.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Micro-benchmark: drawing spinning fruit halves, rotate-every-frame vs RotationCache.
+
+Run from the project folder:  python benchmarks/bench_rotation.py
+Works headless (uses the SDL dummy video driver when no display is set).
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from render_cache import RotationCache
+
+SCREEN = (800, 600)
+HALF_COUNTS = [10, 40, 80]
+STEPS = [1.5, 3.0, 6.0]
+FRAMES = 240
+LIFE = 45
+
+
+def load_halves():
+    """Left/right halves of every fruit image, like `make_half_images` in main.py."""
+    halves = []
+    fruits_dir = os.path.join(ROOT, "fruits")
+    for fname in sorted(os.listdir(fruits_dir)):
+        if not fname.lower().endswith(".png"):
+            continue
+        img = pygame.transform.scale(pygame.image.load(os.path.join(fruits_dir, fname)).convert_alpha(), (80, 80))
+        halves.append(img.subsurface((0, 0, 40, 80)).copy())
+        halves.append(img.subsurface((40, 0, 40, 80)).copy())
+    return halves
+
+
+def simulate(screen, images, count, rotate):
+    """Keep `count` halves alive (respawning like a long combo) for FRAMES frames."""
+    rng = random.Random(1)
+
+    def spawn():
+        return {"img": rng.choice(images), "x": rng.uniform(0, 760), "y": rng.uniform(0, 520),
+                "angle": rng.uniform(-180, 180), "avel": rng.choice([-1, 1]) * rng.uniform(1, 6), "life": LIFE}
+
+    live = [spawn() for _ in range(count)]
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        for i, half in enumerate(live):
+            half["angle"] += half["avel"]
+            half["life"] -= 1
+            rotated = rotate(half["img"], half["angle"])
+            rotated.set_alpha(int(255 * half["life"] / LIFE))
+            screen.blit(rotated, rotated.get_rect(center=(half["x"], half["y"])).topleft)
+            if half["life"] <= 0:
+                live[i] = spawn()
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    images = load_halves()
+    print(f"{'halves':>6} | {'rotate ms':>9} | " + " | ".join(f"step {s:g}: ms  hit%   MB" for s in STEPS))
+    for count in HALF_COUNTS:
+        base = simulate(screen, images, count, pygame.transform.rotate)
+        cols = []
+        for step in STEPS:
+            cache = RotationCache(step)
+            ms = simulate(screen, images, count, cache.rotate)
+            st = cache.stats()
+            cols.append(f"{ms:11.3f} {st['hit_pct']:5.1f} {st['mb']:5.1f}")
+        print(f"{count:>6} | {base:9.3f} | " + " | ".join(cols))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
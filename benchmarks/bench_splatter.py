@@ -0,0 +1,88 @@
+"""Micro-benchmark: full-screen boom splatters, old per-splatter overlays vs SplatterOverlay.
+
+Run from the project folder:  python benchmarks/bench_splatter.py
+Works headless (uses the SDL dummy video driver when no display is set).
+
+Each splatter lives LIFE frames; a new one spawns every SPAWN_EVERY frames so
+`overlap` of them are on screen at once, like several booms sliced in a row.
+
+- redraw: the old loop, a new overlay per splatter per frame, one blit each
+- set_alpha: rasterized once per splatter, faded with ``set_alpha`` (one blit each)
+- shared: `SplatterOverlay`, one overlay for all splatters and one blit per frame
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from render_cache import SplatterOverlay
+
+SCREEN = (800, 600)
+LIFE = 90
+OVERLAPS = [1, 3, 6]
+FRAMES = 180
+COLOR = (255, 200, 60)
+
+
+def make_blobs(rng):
+    width, height = SCREEN
+    count = min(220, max(80, int((width * height) / 12000)))
+    return [(rng.uniform(0, width), rng.uniform(0, height), rng.randint(6, 48), rng.randint(40, 200))
+            for _ in range(count)]
+
+
+def rasterize(blobs, alpha_mul=1.0):
+    overlay = pygame.Surface(SCREEN, pygame.SRCALPHA)
+    for bx, by, br, balpha in blobs:
+        pygame.draw.circle(overlay, (COLOR[0], COLOR[1], COLOR[2], int(balpha * alpha_mul)),
+                           (int(bx), int(by)), int(br))
+    return overlay
+
+
+def simulate(screen, overlap, mode):
+    rng = random.Random(2)
+    spawn_every = max(1, LIFE // overlap)
+    shared = SplatterOverlay(SCREEN)
+    live = []
+    t0 = time.perf_counter()
+    for frame in range(FRAMES):
+        if frame % spawn_every == 0:
+            blobs = make_blobs(rng)
+            if mode == "shared":
+                shared.add(COLOR, blobs, LIFE)
+            else:
+                live.append({"age": 0, "blobs": blobs, "surface": rasterize(blobs) if mode == "set_alpha" else None})
+        if mode == "shared":
+            shared.draw(screen)
+            continue
+        for spl in live[:]:
+            alpha_mul = max(0.0, 1.0 - spl["age"] / float(LIFE))
+            if mode == "set_alpha":
+                spl["surface"].set_alpha(int(255 * alpha_mul))
+                screen.blit(spl["surface"], (0, 0))
+            else:
+                screen.blit(rasterize(spl["blobs"], alpha_mul), (0, 0))
+            spl["age"] += 1
+            if spl["age"] >= LIFE:
+                live.remove(spl)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    modes = ["redraw", "set_alpha", "shared"]
+    print(f"{'overlap':>7} | " + " | ".join(f"{m + ' ms':>12}" for m in modes))
+    for overlap in OVERLAPS:
+        print(f"{overlap:>7} | " + " | ".join(f"{simulate(screen, overlap, m):12.2f}" for m in modes))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
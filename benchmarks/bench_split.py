@@ -0,0 +1,61 @@
+"""Micro-benchmark: cutting a fruit into halves, per-slice cut vs SplitAtlas lookup.
+
+Run from the project folder:  python benchmarks/bench_split.py
+Works headless (uses the SDL dummy video driver when no display is set).
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from render_cache import SplitAtlas
+
+SCREEN = (800, 600)
+SLICES = 2000
+STEPS = [5.0, 10.0, 15.0]
+
+
+def load_fruits():
+    fruits_dir = os.path.join(ROOT, "fruits")
+    return [pygame.transform.scale(pygame.image.load(os.path.join(fruits_dir, f)).convert_alpha(), (80, 80))
+            for f in sorted(os.listdir(fruits_dir)) if f.lower().endswith(".png")]
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode(SCREEN)
+    images = load_fruits()
+    rng = random.Random(0)
+    cuts = [(rng.choice(images), rng.uniform(-180, 180)) for _ in range(SLICES)]
+
+    # the old split_fruit path: rotate, copy both halves, rotate back on every slice
+    direct = SplitAtlas()
+    t0 = time.perf_counter()
+    for img, ang in cuts:
+        direct._cut_now(img, ang)
+    per_cut = (time.perf_counter() - t0) / SLICES * 1000.0
+    print(f"per-slice cut: {per_cut:.3f} ms")
+
+    for step in STEPS:
+        atlas = SplitAtlas(step)
+        t0 = time.perf_counter()
+        atlas.build(images)
+        build_ms = (time.perf_counter() - t0) * 1000.0
+        t0 = time.perf_counter()
+        for img, ang in cuts:
+            atlas.cut(img, ang)
+        lookup = (time.perf_counter() - t0) / SLICES * 1000.0
+        st = atlas.stats()
+        print(f"step {step:4g}: eager build {build_ms:6.1f} ms ({st['cuts']} cuts, {st['mb']:.1f} MB), "
+              f"lookup {lookup:.4f} ms ({per_cut / lookup:.0f}x)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
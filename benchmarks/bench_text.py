@@ -0,0 +1,75 @@
+"""Micro-benchmark: combo popups, render + smoothscale every frame vs TextCache.
+
+Run from the project folder:  python benchmarks/bench_text.py
+Works headless (uses the SDL dummy video driver when no display is set).
+
+Each popup is the base text, a shadow and three glow layers, popping from
+1.9x down to 1x over its 30 frame life like in main.py.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from render_cache import TextCache
+
+SCREEN = (800, 600)
+POPUP_COUNTS = [1, 4, 8]
+TEXTS = ["Combo x3!", "Combo x4!", "Combo x5!", "+COIN"]
+LIFE = 30
+FRAMES = 120
+
+
+def layers_direct(font, text, scale):
+    base = font.render(text, True, (255, 245, 120))
+    shadow = font.render(text, True, (10, 10, 10))
+    bw, bh = base.get_size()
+    sw, sh = max(1, int(bw * scale)), max(1, int(bh * scale))
+    out = [pygame.transform.smoothscale(base, (sw, sh)).convert_alpha(),
+           pygame.transform.smoothscale(shadow, (sw, sh)).convert_alpha()]
+    for glow_i in (1, 2, 3):
+        f = 1.0 + glow_i * 0.08
+        out.append(pygame.transform.smoothscale(base, (max(1, int(sw * f)), max(1, int(sh * f)))).convert_alpha())
+    return out
+
+
+def layers_cached(cache, font, text, scale):
+    out = [cache.scaled(font, text, (255, 245, 120), scale), cache.scaled(font, text, (10, 10, 10), scale)]
+    for glow_i in (1, 2, 3):
+        out.append(cache.scaled(font, text, (255, 245, 120), scale * (1.0 + glow_i * 0.08)))
+    return out
+
+
+def simulate(screen, font, count, layers):
+    # popups spawn staggered so several animation phases are on screen at once
+    t0 = time.perf_counter()
+    for frame in range(FRAMES):
+        for i in range(count):
+            age = (frame + i * LIFE // max(1, count)) % LIFE + 1
+            scale = 1.0 + 0.9 * max(0.0, 1.0 - age / float(LIFE))
+            for surf in layers(font, TEXTS[i % len(TEXTS)], scale):
+                surf.set_alpha(200)
+                screen.blit(surf, (100 + 40 * i, 200))
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    font = pygame.font.SysFont("Comic Sans MS", 56, bold=True)
+    print(f"{'popups':>6} | {'direct ms':>9} | {'cached ms':>9} | hit%")
+    for count in POPUP_COUNTS:
+        cache = TextCache()
+        direct = simulate(screen, font, count, layers_direct)
+        cached = simulate(screen, font, count, lambda f, t, s: layers_cached(cache, f, t, s))
+        print(f"{count:>6} | {direct:9.2f} | {cached:9.2f} | {cache.stats()['hit_pct']:4.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,96 +1,286 @@
+"""Webcam opening with capture-mode negotiation, plus a diagnostics CLI.
+
+``cv2.VideoCapture(0)`` leaves resolution, pixel format, frame rate and the
+driver's buffer queue at their defaults, and drivers often pick a slow mode:
+uncompressed YUYV at a resolution USB 2 cannot carry at 30 FPS, or a queue of
+several stale frames. `open_camera()` asks for the lowest-latency mode that
+still covers the game's 800x600 background:
+
+- MJPG first (compressed, so the camera can deliver full frame rate), then
+  YUYV, then whatever the driver defaults to
+- the smallest resolution that covers the target, so no upscaling and no
+  time spent on pixels that are thrown away
+- the highest frame rate first, since a new frame waits up to ``1/fps``
+- a driver buffer of 1 frame, so ``read()`` returns the newest frame instead
+  of one queued several frames ago
+
+Each request is read back from the driver, so the returned `CameraMode` is
+what the camera actually runs. Drivers may still report a frame rate they do
+not deliver, which is what the diagnostics measure:
+
+    python camera.py                       # show the negotiated mode
+    python camera.py --diagnose            # measure each candidate mode
+    python camera.py --diagnose --modes MJPG:800x600@30,YUYV:640x480@30 --json kamera.json
+
+Force a mode in the game with ``FRUIT_CAMERA_MODE`` (same ``FOURCC:WxH@FPS``
+syntax).
+"""
+import argparse
+import json
+import sys
+import time
+
 import cv2
-import mediapipe as mp
-import pygame
-import random
-import math
-
-# --- Inisialisasi MediaPipe ---
-mp_hands = mp.solutions.hands
-mp_draw = mp.solutions.drawing_utils
-hands = mp_hands.Hands(max_num_hands=1)
-cap = cv2.VideoCapture(0)
-
-# --- Inisialisasi Pygame ---
-pygame.init()
-width, height = 800, 600
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("🍉 Fruit Slice by Misael")
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 36)
-
-# --- Kelas Buah ---
-class Fruit:
-    def __init__(self):
-        self.x = random.randint(50, width - 50)
-        self.y = height
-        self.speed = random.randint(5, 10)
-        self.size = 40
-        self.color = (random.randint(200, 255), random.randint(0, 50), random.randint(0, 50))
-        self.alive = True
-
-    def update(self):
-        self.y -= self.speed
-        if self.y < -50:
-            self.alive = False
-
-    def draw(self):
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.size)
-
-# --- Variabel Game ---
-fruits = []
-score = 0
-running = True
-
-# --- Loop Utama Game ---
-while running:
-    success, img = cap.read()
-    img = cv2.flip(img, 1)
-    rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    results = hands.process(rgb)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    # Tambah buah baru secara acak
-    if random.random() < 0.02:
-        fruits.append(Fruit())
-
-    # Deteksi jari telunjuk
-    finger_pos = None
-    if results.multi_hand_landmarks:
-        for handLms in results.multi_hand_landmarks:
-            lm = handLms.landmark[8]  # ujung jari telunjuk
-            h, w, _ = img.shape
-            finger_pos = (int(lm.x * width), int(lm.y * height))
-            mp_draw.draw_landmarks(img, handLms, mp_hands.HAND_CONNECTIONS)
-
-    # Gambar background
-    screen.fill((30, 30, 30))
-
-    # Update dan gambar semua buah
-    for fruit in fruits[:]:
-        fruit.update()
-        fruit.draw()
-
-        # Jika jari kena buah
-        if finger_pos:
-            dist = math.hypot(fruit.x - finger_pos[0], fruit.y - finger_pos[1])
-            if dist < fruit.size:
-                fruits.remove(fruit)
-                score += 1
-
-        if not fruit.alive:
-            fruits.remove(fruit)
-
-    # Tampilkan skor
-    text = font.render(f"Score: {score}", True, (255, 255, 255))
-    screen.blit(text, (10, 10))
-
-    pygame.display.flip()
-    clock.tick(30)
-
-# --- Selesai ---
-cap.release()
-cv2.destroyAllWindows()
-pygame.quit()
+
+TARGET_SIZE = (800, 600)
+# common webcam resolutions; candidate_modes() keeps those covering the target
+RESOLUTIONS = [(800, 600), (960, 720), (1024, 768), (1280, 720), (1280, 800), (1280, 960), (1920, 1080)]
+FALLBACK_RESOLUTION = (640, 480)
+FOURCCS = ["MJPG", "YUYV", ""]  # "" = driver default
+FRAME_RATES = [60, 30]
+
+
+class CameraMode:
+    """A capture configuration: FOURCC, resolution and frame rate."""
+
+    def __init__(self, fourcc="", width=0, height=0, fps=0.0):
+        self.fourcc = fourcc
+        self.width = int(width)
+        self.height = int(height)
+        self.fps = float(fps)
+
+    @classmethod
+    def parse(cls, spec):
+        """Parse ``[FOURCC:]WxH[@FPS]``, e.g. ``MJPG:800x600@30``."""
+        fourcc, _, rest = spec.strip().rpartition(":")
+        size, _, fps = rest.partition("@")
+        w, _, h = size.lower().partition("x")
+        fourcc = fourcc.upper()
+        return cls("" if fourcc == "DEFAULT" else fourcc, int(w), int(h), float(fps) if fps else 0.0)
+
+    def covers(self, size):
+        return self.width >= size[0] and self.height >= size[1]
+
+    def key(self):
+        return (self.fourcc, self.width, self.height, round(self.fps))
+
+    def __str__(self):
+        fourcc = (self.fourcc or "default") + ":"
+        fps = f"@{self.fps:g}" if self.fps > 0 else ""
+        return f"{fourcc}{self.width}x{self.height}{fps}"
+
+    def __repr__(self):
+        return f"CameraMode({self})"
+
+
+def fourcc_to_str(code):
+    code = int(code)
+    if code <= 0:
+        return ""
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ")
+
+
+def default_backend():
+    # DirectShow honours MJPG/resolution requests and opens much faster than MSMF
+    return cv2.CAP_DSHOW if sys.platform.startswith("win") else cv2.CAP_ANY
+
+
+def candidate_modes(target=TARGET_SIZE):
+    """Modes to try, most preferred (lowest latency) first."""
+    # drivers usually snap an unsupported size to a nearby one, so the first
+    # few requests normally settle it
+    sizes = sorted([r for r in RESOLUTIONS if r[0] >= target[0] and r[1] >= target[1]],
+                   key=lambda r: r[0] * r[1])
+    modes = []
+    for fourcc in FOURCCS:
+        for w, h in sizes:
+            for fps in FRAME_RATES:
+                modes.append(CameraMode(fourcc, w, h, fps))
+    # last resort for cameras without any covering mode: the background is upscaled
+    modes.append(CameraMode("", FALLBACK_RESOLUTION[0], FALLBACK_RESOLUTION[1], 30))
+    return modes
+
+
+def read_mode(cap):
+    """The mode the driver reports it is running."""
+    return CameraMode(fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)),
+                      cap.get(cv2.CAP_PROP_FRAME_WIDTH), cap.get(cv2.CAP_PROP_FRAME_HEIGHT),
+                      cap.get(cv2.CAP_PROP_FPS))
+
+
+def apply_mode(cap, mode, buffer_size=1):
+    """Request `mode` and return what the driver actually accepted."""
+    try:
+        # FOURCC before the size: V4L2 picks the size list of the current format
+        if mode.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+        if mode.fps > 0:
+            cap.set(cv2.CAP_PROP_FPS, mode.fps)
+        if buffer_size:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+    except Exception:
+        pass
+    return read_mode(cap)
+
+
+def _accepted(requested, actual, target):
+    if requested.fourcc and actual.fourcc and actual.fourcc != requested.fourcc:
+        return False
+    if (requested.width, requested.height) == FALLBACK_RESOLUTION:
+        return actual.width > 0
+    return actual.covers(target)
+
+
+def open_camera(index=0, target=TARGET_SIZE, mode=None, buffer_size=1, backend=None, verify=True):
+    """Open camera `index` in the lowest-latency mode covering `target`.
+
+    `mode` (a `CameraMode` or spec string) skips negotiation. Returns
+    ``(cap, mode)``; `mode` is None when the camera could not be opened (the
+    capture is still returned so ``cap.isOpened()`` checks keep working).
+    """
+    if backend is None:
+        backend = default_backend()
+    cap = cv2.VideoCapture(index, backend)
+    if not cap.isOpened() and backend != cv2.CAP_ANY:
+        cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        return cap, None
+    if isinstance(mode, str):
+        mode = CameraMode.parse(mode) if mode.strip() else None
+    candidates = [mode] if mode is not None else candidate_modes(target)
+    for cand in candidates:
+        actual = apply_mode(cap, cand, buffer_size)
+        if mode is None and not _accepted(cand, actual, target):
+            continue
+        # some drivers accept a mode on paper and then fail to stream it
+        if verify:
+            try:
+                ok = cap.read()[0]
+            except Exception:
+                ok = False
+            if not ok:
+                continue
+        return cap, actual
+    return cap, read_mode(cap)
+
+
+def measure_mode(index, mode, seconds=3.0, warmup=10, buffer_size=1, backend=None):
+    """Open the camera in `mode` and time ``read()`` for `seconds`.
+
+    - fps: frames actually delivered per second
+    - read_ms: time blocked in ``read()``; near zero means frames were
+      already queued, i.e. the driver handed out old frames
+    - jitter_ms: standard deviation of the interval between frames
+    """
+    cap, actual = open_camera(index, mode=mode, buffer_size=buffer_size, backend=backend, verify=False)
+    out = {"requested": str(mode), "actual": str(actual) if actual else None}
+    if actual is None:
+        out["error"] = "cannot open camera"
+        return out
+    try:
+        for _ in range(warmup):
+            cap.read()
+        reads = []
+        stamps = []
+        failed = 0
+        frame = None
+        t_end = time.perf_counter() + seconds
+        while time.perf_counter() < t_end:
+            t0 = time.perf_counter()
+            ok, frame = cap.read(frame) if frame is not None else cap.read()
+            t1 = time.perf_counter()
+            if not ok:
+                failed += 1
+                frame = None
+                continue
+            reads.append((t1 - t0) * 1000.0)
+            stamps.append(t1)
+    finally:
+        cap.release()
+    out["frames"] = len(reads)
+    out["failed_reads"] = failed
+    if len(stamps) < 2:
+        out["error"] = "no frames"
+        return out
+    intervals = [(b - a) * 1000.0 for a, b in zip(stamps, stamps[1:])]
+    mean_iv = sum(intervals) / len(intervals)
+    ordered = sorted(reads)
+    out["fps"] = (len(stamps) - 1) / (stamps[-1] - stamps[0])
+    out["read_ms"] = sum(reads) / len(reads)
+    out["read_p95_ms"] = ordered[int(len(ordered) * 0.95)]
+    out["interval_ms"] = mean_iv
+    out["jitter_ms"] = (sum((iv - mean_iv) ** 2 for iv in intervals) / len(intervals)) ** 0.5
+    if frame is not None:
+        out["frame_size"] = f"{frame.shape[1]}x{frame.shape[0]}"
+    return out
+
+
+def diagnose(index=0, modes=None, seconds=3.0, target=TARGET_SIZE):
+    """Measure every candidate mode; modes the driver maps to the same actual mode run once."""
+    results = []
+    seen = set()
+    cap, _ = open_camera(index, mode=CameraMode("", target[0], target[1]), verify=False)
+    opened = cap.isOpened()
+    cap.release()
+    if not opened:
+        print(f"Kamera {index} tidak terbuka!")
+        return results
+    print(f"{'requested':<22} {'actual':<22} results")
+    for mode in modes or candidate_modes(target):
+        cap, actual = open_camera(index, mode=mode, verify=False)
+        cap.release()
+        if actual is not None:
+            if actual.key() in seen:
+                continue
+            seen.add(actual.key())
+        res = measure_mode(index, mode, seconds=seconds)
+        results.append(res)
+        print(_format_row(res), flush=True)
+    return results
+
+
+def _format_row(res):
+    if "error" in res:
+        return f"{res['requested']:<22} {str(res.get('actual')):<22} {res['error']}"
+    return (f"{res['requested']:<22} {res['actual']:<22} {res['fps']:6.1f} fps  "
+            f"read {res['read_ms']:5.1f}/{res['read_p95_ms']:5.1f} ms  jitter {res['jitter_ms']:5.1f} ms  "
+            f"fail {res['failed_reads']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Camera mode negotiation and capture diagnostics")
+    parser.add_argument("--index", type=int, default=0, help="camera index (default 0)")
+    parser.add_argument("--diagnose", action="store_true", help="measure fps, read latency and jitter per mode")
+    parser.add_argument("--modes", default="", help="comma separated FOURCC:WxH@FPS list (default: candidates)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="measurement time per mode")
+    parser.add_argument("--json", default="", help="write the measurements to this file")
+    args = parser.parse_args(argv)
+
+    if not args.diagnose:
+        cap, mode = open_camera(args.index)
+        if mode is None:
+            print("Kamera tidak terbuka!")
+            return 1
+        print(f"camera {args.index}: {mode} (buffer {cap.get(cv2.CAP_PROP_BUFFERSIZE):g})")
+        cap.release()
+        return 0
+
+    modes = [CameraMode.parse(m) for m in args.modes.split(",") if m.strip()] or None
+    results = diagnose(args.index, modes, args.seconds)
+    usable = [r for r in results if "error" not in r]
+    covering = [r for r in usable if CameraMode.parse(r["actual"]).covers(TARGET_SIZE)]
+    usable = covering or usable
+    if usable:
+        # lowest expected wait for a fresh frame: frame interval plus its jitter
+        best = min(usable, key=lambda r: r["interval_ms"] + r["jitter_ms"])
+        print(f"lowest latency: {best['actual']} ({best['fps']:.1f} fps, jitter {best['jitter_ms']:.1f} ms)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"camera": args.index, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Threaded webcam capture with a small latest-frame ring buffer.
+
+The game loop should never wait on the camera: a background thread keeps
+calling ``cap.read()`` into preallocated slots and the loop just picks up the
+newest finished frame (or the previous one again when nothing new arrived).
+"""
+import threading
+import time
+
+import cv2
+
+from camera import open_camera
+
+
+class ThreadedCapture:
+    """Read a ``cv2.VideoCapture`` on its own thread.
+
+    Frames are written into `ring_size` preallocated numpy slots. The slot the
+    game loop is currently holding is never overwritten, so the array returned
+    by `read_latest()` stays valid until the next call.
+
+    Counters (see `stats()`):
+    - dropped: frames captured but replaced by a newer one before the game
+      loop picked them up (camera faster than the loop)
+    - stale: `read_latest()` calls that returned an already delivered frame
+      (loop faster than the camera)
+    """
+
+    def __init__(self, source=0, ring_size=3, cap=None, mode=None):
+        self.source = source
+        self.ring_size = max(3, int(ring_size))
+        self.cap = cap
+        self.requested_mode = mode
+        self.mode = None  # negotiated camera.CameraMode
+        self._slots = [None] * self.ring_size
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+        self._latest_idx = -1  # slot holding the newest finished frame
+        self._latest_seq = 0
+        self._latest_time = 0.0
+        self._held_idx = -1  # slot currently handed to the game loop
+        self._delivered_seq = 0
+
+        self.captured = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.stale = 0
+        self.failed_reads = 0
+        self._fps_ema = 0.0
+
+    def open(self):
+        """Open the device without starting the thread (the frame size is known afterwards)."""
+        if self.cap is None:
+            if isinstance(self.source, int):
+                # negotiate MJPG / resolution / fps / 1-frame driver buffer
+                self.cap, self.mode = open_camera(self.source, mode=self.requested_mode)
+                if self.mode is not None:
+                    print("Camera mode:", self.mode)
+            else:
+                self.cap = cv2.VideoCapture(self.source)
+        return self
+
+    def start(self):
+        self.open()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="camera-capture", daemon=True)
+        self._thread.start()
+        return self
+
+    def is_opened(self):
+        try:
+            return bool(self.cap is not None and self.cap.isOpened())
+        except Exception:
+            return False
+
+    def _next_write_slot(self, start):
+        # never touch the newest published frame nor the one the loop holds
+        for k in range(self.ring_size):
+            idx = (start + k) % self.ring_size
+            if idx != self._latest_idx and idx != self._held_idx:
+                return idx
+        return start % self.ring_size
+
+    def _run(self):
+        write_hint = 0
+        last_t = None
+        while self._running:
+            with self._lock:
+                idx = self._next_write_slot(write_hint)
+            slot = self._slots[idx]
+            try:
+                if slot is not None:
+                    ok, img = self.cap.read(slot)
+                else:
+                    ok, img = self.cap.read()
+            except Exception:
+                ok, img = False, None
+
+            if not ok or img is None:
+                self.failed_reads += 1
+                # back off a little so an unplugged camera doesn't spin a core
+                time.sleep(0.01)
+                continue
+
+            now = time.perf_counter()
+            if last_t is not None:
+                dt = now - last_t
+                if dt > 0:
+                    inst = 1.0 / dt
+                    self._fps_ema = inst if self._fps_ema <= 0 else self._fps_ema * 0.9 + inst * 0.1
+            last_t = now
+
+            with self._lock:
+                # the driver may hand back a new array (first frame, size change)
+                self._slots[idx] = img
+                if self._latest_seq > self._delivered_seq:
+                    self.dropped += 1
+                self._latest_idx = idx
+                self._latest_seq += 1
+                self._latest_time = now
+                self.captured += 1
+            write_hint = idx + 1
+
+    def read_latest(self):
+        """Return ``(frame, is_new)`` without blocking.
+
+        `frame` is None until the first frame arrives. When the camera has not
+        produced anything since the previous call, the previous frame is
+        returned again with ``is_new=False``.
+        """
+        with self._lock:
+            if self._latest_idx < 0:
+                return None, False
+            is_new = self._latest_seq > self._delivered_seq
+            if is_new:
+                self._held_idx = self._latest_idx
+                self._delivered_seq = self._latest_seq
+                self.delivered += 1
+            else:
+                self.stale += 1
+            return self._slots[self._held_idx], is_new
+
+    def frame_size(self):
+        """(width, height) the camera delivers, or None when it is not open."""
+        if self.mode is not None and self.mode.width > 0 and self.mode.height > 0:
+            return self.mode.width, self.mode.height
+        try:
+            w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        except Exception:
+            return None
+        return (w, h) if w > 0 and h > 0 else None
+
+    def frame_age(self):
+        """Seconds since the newest captured frame (0.0 before the first one)."""
+        if self._latest_time <= 0:
+            return 0.0
+        return max(0.0, time.perf_counter() - self._latest_time)
+
+    def stats(self):
+        return {
+            "captured": self.captured,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "stale": self.stale,
+            "failed_reads": self.failed_reads,
+            "fps": self._fps_ema,
+            "age_ms": self.frame_age() * 1000.0,
+            "mode": str(self.mode) if self.mode is not None else "-",
+        }
+
+    def release(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        try:
+            if self.cap is not None:
+                self.cap.release()
+        except Exception:
+            pass
@@ -0,0 +1,58 @@
+"""Swept slice detection: each finger's movement since the last frame against every object.
+
+The old test compared only the current fingertip with each fruit, coin
+and obstacle (kept as the baseline in ``benchmarks/bench_collision.py``). A swipe that moves further than an
+object's diameter between two frames jumped straight over it, which is why
+tracking had to run at the full frame rate. Here a player's finger path
+since the previous frame is a segment (trail[-2] -> trail[-1]) and an
+object is hit when that segment passes within its radius: a capsule test,
+i.e. point-to-segment distance. When the finger did not move (or has only
+one trail point) the segment is a point and the test is the old one.
+
+One call tests all objects of a group against all players as NumPy arrays.
+"""
+import numpy as np
+
+
+def finger_segments(players):
+    """(P, 4) array of ``ax, ay, bx, by`` per player; NaN for players without a finger."""
+    seg = np.full((len(players), 4), np.nan)
+    for i, player in enumerate(players):
+        if not player.has_finger():
+            continue
+        bx, by = player.finger_x, player.finger_y
+        ax, ay = player.trail[-2] if len(player.trail) >= 2 else (bx, by)
+        seg[i] = (ax, ay, bx, by)
+    return seg
+
+
+def segment_hits(segments, centers, radius):
+    """Index of the first segment passing within `radius` of each center, or -1.
+
+    `centers` is a sequence of (x, y); `radius` a scalar or one value per
+    center. Returns an int array with one entry per center.
+    """
+    if len(centers) == 0 or len(segments) == 0:
+        return np.full(len(centers), -1, dtype=np.intp)
+    c = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    cx = c[:, 0:1]
+    cy = c[:, 1:2]
+    r = np.asarray(radius, dtype=np.float64).reshape(-1, 1)
+    ax, ay, bx, by = (segments[:, k] for k in range(4))
+    dx = bx - ax
+    dy = by - ay
+    len2 = dx * dx + dy * dy
+    # closest point on each segment to each center (t clamped onto the segment)
+    t = ((cx - ax) * dx + (cy - ay) * dy) / np.where(len2 > 0, len2, 1.0)
+    t = np.clip(t, 0.0, 1.0)
+    px = ax + t * dx - cx
+    py = ay + t * dy - cy
+    with np.errstate(invalid="ignore"):
+        hit = px * px + py * py < r * r  # NaN rows (no finger) never hit
+    first = np.argmax(hit, axis=1)
+    return np.where(hit.any(axis=1), first, -1)
+
+
+def slicers(players, segments, centers, radius):
+    """Per center, the first player whose swipe passes within `radius`, or None."""
+    return [players[i] if i >= 0 else None for i in segment_hits(segments, centers, radius).tolist()]
@@ -0,0 +1,107 @@
+"""Fingertip smoothing and short-term prediction.
+
+Hand tracking may run slower than the game renders (e.g. inference at 15 Hz,
+rendering at 30-60 Hz). `FingertipEstimator` smooths each tracked fingertip
+with a One-Euro filter and extrapolates it with the filtered velocity, so the
+trail and slice hit tests get a plausible position on every rendered frame.
+"""
+import math
+
+
+def _alpha(cutoff, dt):
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """One-Euro filter for a single value (Casiez et al., CHI 2012).
+
+    Low speeds get a low cutoff (less jitter), fast motion raises the cutoff
+    by `beta * |velocity|` (less lag). `dx` holds the filtered velocity in
+    units per second.
+    """
+
+    def __init__(self, min_cutoff=1.2, beta=0.01, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x = None
+        self.dx = 0.0
+        self.t = None
+
+    def reset(self):
+        self.x = None
+        self.dx = 0.0
+        self.t = None
+
+    def __call__(self, value, t):
+        if self.x is None or self.t is None or t <= self.t:
+            if self.x is None:
+                self.x = float(value)
+                self.dx = 0.0
+            self.t = t
+            return self.x
+        dt = t - self.t
+        raw_dx = (value - self.x) / dt
+        a_d = _alpha(self.d_cutoff, dt)
+        self.dx = a_d * raw_dx + (1.0 - a_d) * self.dx
+        cutoff = self.min_cutoff + self.beta * abs(self.dx)
+        a = _alpha(cutoff, dt)
+        self.x = a * value + (1.0 - a) * self.x
+        self.t = t
+        return self.x
+
+
+class FingertipEstimator:
+    """Filtered, predictive 2D fingertip position.
+
+    - `update(x, y, t)` feeds a tracked position measured at time `t` (seconds)
+    - `predict(t)` extrapolates with the filtered velocity, for at most
+      `horizon` seconds past the last measurement; after that the position is
+      held
+    - `confidence(t)` is 1.0 right after a measurement and falls linearly to
+      0.0 at `lost_after` seconds, at which point the finger counts as lost
+    """
+
+    def __init__(self, min_cutoff=1.2, beta=0.01, horizon=0.12, lost_after=0.3):
+        self.fx = OneEuroFilter(min_cutoff, beta)
+        self.fy = OneEuroFilter(min_cutoff, beta)
+        self.horizon = horizon
+        self.lost_after = max(lost_after, horizon)
+        self.last_t = None
+        self.updates = 0
+
+    def reset(self):
+        self.fx.reset()
+        self.fy.reset()
+        self.last_t = None
+
+    def update(self, x, y, t):
+        self.fx(x, t)
+        self.fy(y, t)
+        self.last_t = t
+        self.updates += 1
+
+    def confidence(self, t):
+        if self.last_t is None:
+            return 0.0
+        age = max(0.0, t - self.last_t)
+        return max(0.0, 1.0 - age / self.lost_after)
+
+    def active(self, t):
+        return self.confidence(t) > 0.0
+
+    def prediction_age(self, t):
+        """How far ahead of the last measurement `predict(t)` extrapolates."""
+        if self.last_t is None:
+            return 0.0
+        return min(max(0.0, t - self.last_t), self.horizon)
+
+    def velocity(self):
+        return self.fx.dx, self.fy.dx
+
+    def predict(self, t):
+        if self.last_t is None:
+            return None
+        dt = self.prediction_age(t)
+        return self.fx.x + self.fx.dx * dt, self.fy.x + self.fy.dx * dt
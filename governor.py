@@ -0,0 +1,152 @@
+"""Adaptive hand-tracking quality governor.
+
+Watches per-inference latency and walks a ladder of MediaPipe settings
+(model complexity, input resolution, frame skip) so hand tracking stays
+inside a time budget. Level 0 is full quality; each step down is cheaper.
+A sustained overrun (or one very slow inference) steps down right away,
+while stepping back up needs a long stretch of headroom, so the settings
+don't oscillate.
+
+The ladder logic itself is `HysteresisLadder`; `quality.EffectQuality`
+configures the same controller for the effect presets.
+"""
+import time
+
+# cheapest changes first: the lite model barely affects fingertip accuracy,
+# skipping frames is the last resort because it adds visible latency
+LEVELS = [
+    {"model_complexity": 1, "input_scale": 1.0, "frame_skip": 0},
+    {"model_complexity": 0, "input_scale": 1.0, "frame_skip": 0},
+    {"model_complexity": 0, "input_scale": 0.75, "frame_skip": 0},
+    {"model_complexity": 0, "input_scale": 0.5, "frame_skip": 0},
+    {"model_complexity": 0, "input_scale": 0.5, "frame_skip": 1},
+    {"model_complexity": 0, "input_scale": 0.5, "frame_skip": 2},
+]
+
+
+class HysteresisLadder:
+    """Hysteresis controller over quality levels 0 (best) .. `n_levels` - 1 (cheapest).
+
+    `measure(ms)` feeds one cost sample (an inference, a frame) into an EMA
+    and returns True when the level changed. A sustained overrun of
+    `budget_ms` (or, with `spike_factor`, one sample that far over it)
+    steps down right away; stepping up needs `up_after` samples under
+    ``budget_ms * headroom``. A step up that has to be undone within 5 s
+    doubles that wait (up to 16x); after `relax_after` seconds without any
+    change the wait is back to `up_after`, so one bad moment does not slow
+    recovery for the rest of the session.
+    """
+
+    def __init__(self, n_levels, budget_ms, down_after, up_after, headroom, cooldown, ema_weight,
+                 warmup, spike_factor=0.0, start=0, relax_after=30.0):
+        self.n_levels = n_levels
+        self.budget_ms = float(budget_ms)
+        self.down_after = down_after
+        self.up_after = up_after
+        self.spike_factor = spike_factor
+        self.headroom = headroom
+        self.cooldown = cooldown
+        self.ema_weight = ema_weight
+        self.relax_after = relax_after
+        # the first samples include start-up work and say nothing about steady cost
+        self.warmup = warmup
+        self.observed = 0
+        self.level = start
+        self.ema_ms = 0.0
+        self._over = 0
+        self._under = 0
+        self._last_change = 0.0
+        # after a step up that immediately had to be undone, wait longer before the next try
+        self._up_wait = up_after
+        self._last_up = -1e9
+        self.decisions = []
+        self.last_decision = f"start at {self.level_name(start)}"
+
+    def level_name(self, level):
+        return f"L{level}"
+
+    def _change(self, new_level, reason, now):
+        old = self.level
+        if new_level > old and now - self._last_up < 5.0:
+            # the last step up did not hold: back off longer before trying again
+            self._up_wait = min(self._up_wait * 2, self.up_after * 16)
+        elif new_level < old:
+            self._last_up = now
+        self.level = new_level
+        self._over = 0
+        self._under = 0
+        self._last_change = now
+        self.last_decision = f"{self.level_name(old)}->{self.level_name(new_level)}: {reason}"
+        self.decisions.append((now, old, new_level, reason))
+        if len(self.decisions) > 50:
+            del self.decisions[0]
+        return True
+
+    def measure(self, ms, now=None):
+        if now is None:
+            now = time.perf_counter()
+        self.observed += 1
+        if self.observed <= self.warmup:
+            return False
+        w = self.ema_weight
+        self.ema_ms = ms if self.ema_ms <= 0 else self.ema_ms * (1.0 - w) + ms * w
+
+        if self.ema_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+        elif self.ema_ms < self.budget_ms * self.headroom:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if now - self._last_change < self.cooldown:
+            return False
+        if self._up_wait > self.up_after and now - self._last_change >= self.relax_after:
+            self._up_wait = self.up_after
+        if self.level < self.n_levels - 1:
+            spike = self.budget_ms * self.spike_factor
+            if self.spike_factor > 0 and ms > spike:
+                return self._change(self.level + 1, f"spike {ms:.0f}ms > {spike:.0f}ms", now)
+            if self._over >= self.down_after:
+                return self._change(self.level + 1, f"avg {self.ema_ms:.1f}ms > budget {self.budget_ms:.1f}ms", now)
+        if self.level > 0 and self._under >= self._up_wait:
+            return self._change(self.level - 1, f"avg {self.ema_ms:.1f}ms < {self.budget_ms * self.headroom:.1f}ms", now)
+        return False
+
+
+class TrackingGovernor(HysteresisLadder):
+    """Pick a `LEVELS` entry from observed inference times.
+
+    - `observe(infer_ms)` after every finished inference; returns the new
+      settings dict when the level changed, otherwise None
+    - `settings` is the current level's dict
+    - `decisions` keeps (time, old level, new level, reason) for the HUD/log
+    - `configured(frame_seq)` after the tracker applied new settings: results
+      of frames up to `frame_seq` ran with the old ones, and the first frame
+      after it includes rebuilding the model, so none of them is measured
+    """
+
+    def __init__(self, budget_ms, down_after=4, up_after=90, spike_factor=2.0,
+                 headroom=0.6, cooldown=1.0, ema_weight=0.2, warmup=5):
+        super().__init__(len(LEVELS), budget_ms, down_after, up_after, headroom, cooldown, ema_weight,
+                         warmup, spike_factor=spike_factor)
+        self.last_decision = "start at level 0"
+        self._settle_seq = None
+        self.discarded = 0
+
+    @property
+    def settings(self):
+        return LEVELS[self.level]
+
+    def configured(self, frame_seq):
+        self._settle_seq = frame_seq
+
+    def observe(self, infer_ms, now=None, frame_seq=None):
+        if self._settle_seq is not None and frame_seq is not None:
+            if frame_seq > self._settle_seq:
+                self._settle_seq = None
+            self.discarded += 1
+            return None
+        return self.settings if self.measure(infer_ms, now) else None
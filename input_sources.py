@@ -0,0 +1,420 @@
+"""Pluggable input sources for the game loop.
+
+A source is read once per game frame and returns ``(frame, frame_is_new,
+hands)``:
+
+- `frame`: BGR camera/video image for the background (None when the source
+  has no pictures)
+- `frame_is_new`: whether `frame` differs from the previous read
+- `hands`: a `tracking.TrackingResult` when the source already knows the
+  landmarks (log replay, synthetic swipes), otherwise None and the game runs
+  the hand tracker on `frame`
+
+Either way the landmarks end up in the same fingertip estimator /
+`finger_trail` / `finger_count` path, so a recorded or scripted session plays
+exactly like a live one. File-based sources advance one recorded frame per
+game frame and stamp their results with a frame clock (`clock()`: frames
+read / fps) instead of the wall clock, which keeps replays deterministic for
+frame-time comparisons:
+`LandmarkRecorder` writes one entry per game frame too, a "hold" entry for
+frames without a new tracking result, so a replay gets its results on the
+same frames the live session did.
+
+Select a source with ``FRUIT_INPUT``: ``webcam`` (default), ``video:<path>``,
+``landmarks:<path>`` (.jsonl or .npz) or ``synthetic[:<seed>]``.
+"""
+import json
+import math
+import os
+import random
+import time
+
+import numpy as np
+
+from capture import ThreadedCapture
+from tracking import NUM_LANDMARKS, TrackingResult
+
+
+class InputSource:
+    name = "none"
+    # True when read() returns landmarks itself (no hand tracker needed)
+    provides_landmarks = False
+
+    def open(self):
+        """Prepare the source without background threads; `frame_size()` is valid afterwards."""
+        return self
+
+    def start(self):
+        return self
+
+    def frame_size(self):
+        """(width, height) of the frames `read()` will return, None when unknown."""
+        return None
+
+    def clock(self):
+        """Time base (seconds) of the result timestamps; sample the fingertip estimator with it."""
+        return time.perf_counter()
+
+    def set_keep_out(self, rects):
+        """Screen areas scripted input should avoid; ignored by real input."""
+        pass
+
+    def read(self):
+        return None, False, None
+
+    def finished(self):
+        return False
+
+    def stats(self):
+        return {}
+
+    def release(self):
+        pass
+
+
+class WebcamSource(InputSource):
+    """Live camera through the threaded capture ring buffer."""
+
+    name = "webcam"
+
+    def __init__(self, index=0, mode=None):
+        self.capture = ThreadedCapture(index, mode=mode)
+
+    def open(self):
+        self.capture.open()
+        return self
+
+    def start(self):
+        self.capture.start()
+        return self
+
+    def frame_size(self):
+        return self.capture.frame_size()
+
+    def read(self):
+        frame, is_new = self.capture.read_latest()
+        return frame, is_new, None
+
+    def stats(self):
+        return self.capture.stats()
+
+    def release(self):
+        self.capture.release()
+
+
+class VideoFileSource(InputSource):
+    """Recorded video, one video frame per game frame; hands come from the tracker."""
+
+    name = "video"
+
+    def __init__(self, path, loop=False):
+        self.path = path
+        self.loop = loop
+        self.cap = None
+        self.frames = 0
+        self._done = False
+        self._buf = None
+
+    def open(self):
+        if self.cap is None:
+            import cv2
+            self.cap = cv2.VideoCapture(self.path)
+            if not self.cap.isOpened():
+                print("Cannot open video input:", self.path)
+                self._done = True
+        return self
+
+    def start(self):
+        return self.open()
+
+    def frame_size(self):
+        import cv2
+        if self.cap is None or self._done:
+            return None
+        w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return (w, h) if w > 0 and h > 0 else None
+
+    def read(self):
+        if self._done:
+            return None, False, None
+        ok, img = self.cap.read(self._buf) if self._buf is not None else self.cap.read()
+        if not ok and self.loop and self.frames > 0:
+            import cv2
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, img = self.cap.read()
+        if not ok or img is None:
+            self._done = True
+            return None, False, None
+        self._buf = img
+        self.frames += 1
+        return img, True, None
+
+    def finished(self):
+        return self._done
+
+    def stats(self):
+        return {"frames": self.frames}
+
+    def release(self):
+        try:
+            if self.cap is not None:
+                self.cap.release()
+        except Exception:
+            pass
+
+
+class LandmarkLogSource(InputSource):
+    """Replay landmarks recorded by `LandmarkRecorder` (.jsonl or .npz)."""
+
+    name = "landmarks"
+    provides_landmarks = True
+
+    def __init__(self, path, fps=30):
+        self.path = path
+        self.fps = float(fps)
+        self.records = []  # list of (landmarks array, handedness list), None for hold frames
+        self.index = 0
+
+    def start(self):
+        if self.path.endswith(".npz"):
+            data = np.load(self.path)
+            counts = data["counts"]
+            landmarks = data["landmarks"].astype(np.float32)
+            handedness = list(data["handedness"]) if "handedness" in data else []
+            pos = 0
+            for n in counts:
+                n = int(n)
+                if n < 0:
+                    self.records.append(None)
+                    continue
+                hd = [str(h) for h in handedness[pos:pos + n]]
+                self.records.append((landmarks[pos:pos + n], hd))
+                pos += n
+        else:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    rec = json.loads(line)
+                    if rec.get("hold"):
+                        self.records.append(None)
+                        continue
+                    hands = rec.get("hands", [])
+                    arr = np.asarray(hands, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+                    self.records.append((arr, rec.get("handedness", [])))
+        return self
+
+    def read(self):
+        if self.index >= len(self.records):
+            return None, False, None
+        rec = self.records[self.index]
+        self.index += 1
+        if rec is None:
+            return None, False, None  # no new result on this frame of the recording
+        landmarks, handedness = rec
+        res = TrackingResult(landmarks, handedness, frame_seq=self.index, timestamp=self.clock())
+        return None, False, res
+
+    def clock(self):
+        return self.index / self.fps
+
+    def finished(self):
+        return self.index >= len(self.records)
+
+    def stats(self):
+        return {"frame": self.index, "frames": len(self.records)}
+
+
+def synthetic_hand(x, y, extended=1):
+    """Landmarks of a pointing hand with the index fingertip at normalized (x, y).
+
+    The first `extended` fingers (index, middle, ring, pinky, thumb) get their
+    tip above the PIP joint, which is what `count_extended_fingers` checks.
+    """
+    hand = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    # palm below the fingertip, fingers curled unless extended
+    hand[:, 0] = x
+    hand[:, 1] = y + 0.12
+    order = [8, 12, 16, 20, 4]
+    for i, tip in enumerate(order):
+        pip = tip - 2
+        hand[pip, 1] = y + 0.06
+        hand[tip, 1] = y + (0.0 if i < extended else 0.09)
+    hand[8, 0] = x
+    hand[8, 1] = y
+    return hand
+
+
+class ScriptedSwipeSource(InputSource):
+    """Deterministic synthetic swipes for headless benchmarks and regression runs.
+
+    The fingertip sweeps between random points (seeded), pauses briefly,
+    then swipes again. Landmarks are in camera coordinates like MediaPipe's,
+    i.e. not mirrored: the game flips x just as it does for a live hand. With
+    `hands=2` a second, independent hand swipes too (handedness "Left" and
+    "Right", i.e. player 1 and player 2).
+
+    `keep_out` lists (x0, y0, x1, y1) rects in those camera coordinates that
+    no swipe may cross, e.g. the buttons that would end a benchmark run; the
+    game swaps them per screen with `set_keep_out()`, new swipes use them.
+    """
+
+    name = "synthetic"
+    provides_landmarks = True
+
+    def __init__(self, seed=0, swipe_frames=10, pause_frames=8, max_frames=0, hands=1, fps=30, keep_out=()):
+        self.rng = random.Random(seed)
+        self.fps = float(fps)
+        self.keep_out = [tuple(r) for r in keep_out]
+        self.swipe_frames = max(2, int(swipe_frames))
+        self.pause_frames = max(0, int(pause_frames))
+        self.max_frames = int(max_frames)
+        self.frames = 0
+        self.hand_labels = ["Left", "Right"][:max(1, min(2, int(hands)))]
+        self._plans = [[] for _ in self.hand_labels]
+
+    def set_keep_out(self, rects):
+        self.keep_out = [tuple(r) for r in rects]
+
+    def _crosses_keep_out(self, x0, y0, x1, y1, margin=0.03, steps=24):
+        # the fingertip estimator keeps extrapolating for a moment after the
+        # hand disappears, so check the path a bit past its end point too
+        ex = x1 + (x1 - x0) * 0.5
+        ey = y1 + (y1 - y0) * 0.5
+        for i in range(steps + 1):
+            t = i / float(steps)
+            px = x0 + (ex - x0) * t
+            py = y0 + (ey - y0) * t
+            for rx0, ry0, rx1, ry1 in self.keep_out:
+                if rx0 - margin <= px <= rx1 + margin and ry0 - margin <= py <= ry1 + margin:
+                    return True
+        return False
+
+    def _plan_swipe(self, plan):
+        for _ in range(50):
+            x0, y0 = self.rng.uniform(0.1, 0.9), self.rng.uniform(0.2, 0.8)
+            ang = self.rng.uniform(0, math.pi * 2)
+            length = self.rng.uniform(0.3, 0.6)
+            x1 = min(0.95, max(0.05, x0 + math.cos(ang) * length))
+            y1 = min(0.95, max(0.05, y0 + math.sin(ang) * length))
+            if not self._crosses_keep_out(x0, y0, x1, y1):
+                break
+        else:
+            # no clear path found: keep the hand hidden instead
+            plan.extend([None] * (self.swipe_frames + self.pause_frames))
+            return
+        for i in range(self.swipe_frames):
+            t = i / float(self.swipe_frames - 1)
+            plan.append((x0 + (x1 - x0) * t, y0 + (y1 - y0) * t))
+        # hand hidden between swipes
+        plan.extend([None] * self.pause_frames)
+
+    def read(self):
+        hands = []
+        labels = []
+        for plan, label in zip(self._plans, self.hand_labels):
+            if not plan:
+                self._plan_swipe(plan)
+            pos = plan.pop(0)
+            if pos is not None:
+                hands.append(synthetic_hand(pos[0], pos[1]))
+                labels.append(label)
+        self.frames += 1
+        if not hands:
+            res = TrackingResult(frame_seq=self.frames, timestamp=self.clock())
+        else:
+            res = TrackingResult(np.stack(hands), labels, frame_seq=self.frames, timestamp=self.clock())
+        return None, False, res
+
+    def clock(self):
+        return self.frames / self.fps
+
+    def finished(self):
+        return self.max_frames > 0 and self.frames >= self.max_frames
+
+    def stats(self):
+        return {"frames": self.frames}
+
+
+class LandmarkRecorder:
+    """Write one landmark log entry (.jsonl or .npz) per game frame.
+
+    `write(None)` records a frame without a new tracking result (a hold
+    entry: ``{"hold": true}`` / count -1), so a replay keeps the timing of
+    the live session even when tracking ran slower than the game loop.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.binary = path.endswith(".npz")
+        self._f = None if self.binary else open(path, "w", encoding="utf-8")
+        self._counts = []
+        self._landmarks = []
+        self._handedness = []
+
+    def write(self, result):
+        if result is None:
+            if self.binary:
+                self._counts.append(-1)
+            else:
+                self._f.write('{"hold": true}\n')
+            return
+        if self.binary:
+            self._counts.append(len(result.landmarks))
+            if len(result.landmarks):
+                self._landmarks.append(np.asarray(result.landmarks, dtype=np.float32))
+            hd = list(result.handedness) + [""] * (len(result.landmarks) - len(result.handedness))
+            self._handedness.extend(hd[:len(result.landmarks)])
+        else:
+            # float64 so the rounded values stay short in the JSON (float32 -> 0.7755399942398071)
+            hands = np.round(np.asarray(result.landmarks, dtype=np.float64), 5).tolist()
+            rec = {"hands": hands, "handedness": list(result.handedness)}
+            self._f.write(json.dumps(rec) + "\n")
+
+    def close(self):
+        if self.binary:
+            if self._landmarks:
+                landmarks = np.concatenate(self._landmarks)
+            else:
+                landmarks = np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32)
+            np.savez_compressed(self.path, counts=np.asarray(self._counts, dtype=np.int32),
+                                landmarks=landmarks, handedness=np.asarray(self._handedness, dtype=str))
+        elif self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+def create_input_source(spec="webcam", camera_index=0, hands=1, camera_mode=None, start=True, fps=30,
+                        keep_out=()):
+    """Build the source described by `spec` (see module docstring).
+
+    `hands` is the number of players and `keep_out` the rects its swipes
+    avoid, both used by the synthetic source; `fps` is the frame rate of
+    the frame clock of the log and synthetic sources; `camera_mode` forces
+    a webcam mode (see `camera.CameraMode.parse`).
+    With ``start=False`` the source is only opened (camera mode negotiated,
+    no capture thread yet) and the caller starts it later.
+    """
+    kind, _, arg = (spec or "webcam").partition(":")
+    kind = kind.strip().lower()
+    source = None
+    if kind == "video" and arg:
+        source = VideoFileSource(arg)
+    elif kind == "landmarks" and arg:
+        if not os.path.exists(arg):
+            print("Landmark log not found:", arg)
+        else:
+            source = LandmarkLogSource(arg, fps=fps)
+    elif kind == "synthetic":
+        try:
+            seed = int(arg) if arg else 0
+        except ValueError:
+            seed = 0
+        source = ScriptedSwipeSource(seed=seed, hands=hands, fps=fps, keep_out=keep_out)
+    if source is None:
+        if kind not in ("webcam", "camera", ""):
+            print("Unknown FRUIT_INPUT, using webcam:", spec)
+        source = WebcamSource(camera_index, camera_mode or None)
+    return source.start() if start else source.open()
@@ -1,24 +1,97 @@
-import cv2
-import mediapipe as mp
 import pygame
 import random
 import os
 import math
-import numpy as np
 import time
 import json
 
+from background import CameraBackground
+from camera import CameraMode
+from input_sources import LandmarkRecorder, create_input_source
+from tracking import create_tracker
+from players import Player, assign_hands
+from collision import finger_segments, slicers
+from entities import Half, Thrown, sweep
+from render_cache import RotationCache, SplatterOverlay, SplitAtlas, SurfacePool, TextCache
+from particles import ParticleSystem, SplashSystem
+from render_scale import RenderScaler
+from governor import TrackingGovernor
+from timestep import FixedTimestep
+from quality import EffectQuality
+from ui_layer import RetainedLayer
+
+
+# --- Startup options (set via environment variables, e.g. FRUIT_PERF_HUD=1) ---
+def env_option(name, default):
+    """Read a startup option from the environment, keeping the type of `default`."""
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    if isinstance(default, bool):
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    try:
+        return type(default)(raw)
+    except Exception:
+        return default
+
+
+camera_index = env_option("FRUIT_CAMERA", 0)
+camera_mode = env_option("FRUIT_CAMERA_MODE", "")  # e.g. MJPG:800x600@30 (default: negotiated, see camera.py)
+input_spec = env_option("FRUIT_INPUT", "webcam")  # webcam | video:<path> | landmarks:<path> | synthetic[:seed]
+record_landmarks_path = env_option("FRUIT_RECORD_LANDMARKS", "")  # .jsonl or .npz
+frame_log_path = env_option("FRUIT_FRAME_LOG", "")  # per-frame work time (CSV)
+max_frames = env_option("FRUIT_MAX_FRAMES", 0)  # quit after N frames (0 = run until closed)
+random_seed = env_option("FRUIT_SEED", -1)  # fixed seed for reproducible replays
+show_perf_hud = env_option("FRUIT_PERF_HUD", False)
+tracking_backend = env_option("FRUIT_TRACKING_BACKEND", "legacy")  # legacy (mp.solutions.hands) | tasks (HandLandmarker)
+hand_model_path = env_option("FRUIT_HAND_MODEL", "hand_landmarker.task")  # model bundle for the tasks backend
+tracking_mode = env_option("FRUIT_TRACKING", "inline")  # inline | process (legacy backend)
+player_count = 2 if env_option("FRUIT_PLAYERS", 1) == 2 else 1  # 2 = local multiplayer, one hand each
+tracking_roi = env_option("FRUIT_TRACK_ROI", False)  # crop inference around the last known hand
+tracking_hz = env_option("FRUIT_TRACK_HZ", 0.0)  # max hand inferences per second (0 = every camera frame)
+tracking_governor_on = env_option("FRUIT_TRACK_GOVERNOR", True)  # adapt tracking quality to the frame budget
+tracking_budget_ms = env_option("FRUIT_TRACK_BUDGET_MS", 0.0)  # 0 = derived from target_fps
+rotation_step_deg = env_option("FRUIT_ROT_STEP", 3.0)  # angle bucket for cached half rotations
+rotation_cache_mb = env_option("FRUIT_ROT_CACHE_MB", 32.0)  # memory cap of the rotation cache
+split_atlas_mode = env_option("FRUIT_SPLIT_ATLAS", "lazy")  # lazy | eager: when fruit halves are precut
+split_step_deg = env_option("FRUIT_SPLIT_STEP", 10.0)  # cut angle bucket for the split-half atlas
+effects_mode = env_option("FRUIT_EFFECTS", "auto")  # auto | high | medium | low: effect spawn counts and layers
+render_scale = env_option("FRUIT_RENDER_SCALE", 1.0)  # <1: draw the world smaller, upscale once (HUD stays native)
+render_fps = env_option("FRUIT_RENDER_FPS", 30)  # frame limiter; the simulation always steps at target_fps
+sim_lockstep = env_option("FRUIT_SIM_LOCKSTEP", False)  # one simulation step per rendered frame (as before)
+target_fps = 30
+
+if camera_mode:
+    try:
+        camera_mode = CameraMode.parse(camera_mode)
+    except Exception as e:
+        print("Invalid FRUIT_CAMERA_MODE, using auto negotiation:", camera_mode, e)
+        camera_mode = None
+
+# Open the input and start the tracker before pygame.init(): a tracking worker
+# process forks from a parent without SDL, the audio mixer or the camera thread
+# (the webcam is only negotiated here and starts capturing afterwards). Its
+# frame slots take the negotiated capture size, so frames are copied as is.
+width, height = 800, 600
+# synthetic swipes stay clear of the Home button while playing and of the
+# Shop / Settings / Quit buttons in the menu (camera coordinates: x mirrored),
+# so a benchmark run never leaves the game by accident
+play_keep_out = [(1.0 - 102 / width, 60 / height, 1.0 - 10 / width, 94 / height)]
+menu_keep_out = [(1.0 - 520 / width, 200 / height, 1.0 - 280 / width, 460 / height)]
+input_source = create_input_source(input_spec, camera_index, hands=player_count, camera_mode=camera_mode,
+                                   start=False, fps=target_fps, keep_out=play_keep_out)
+if input_source.provides_landmarks:
+    tracker = None  # recorded / synthetic landmarks, nothing to track
+else:
+    tracker = create_tracker(tracking_mode, frame_size=input_source.frame_size(), backend=tracking_backend,
+                             model_path=hand_model_path, max_num_hands=player_count, roi=tracking_roi)
+input_source.start()
+
 # Initialize pygame and create screen before creating fonts
 pygame.init()
-width, height = 800, 600
 screen = pygame.display.set_mode((width, height))
 pygame.display.set_caption("🍉 Fruit Slice by Keren")
 
-# Initialize MediaPipe hands
-mp_hands = mp.solutions.hands
-mp_draw = mp.solutions.drawing_utils
-hands = mp_hands.Hands(max_num_hands=1)
-
 font = pygame.font.SysFont("Comic Sans MS", 32)
 small_font = pygame.font.SysFont("Comic Sans MS", 20)
 tiny_font = pygame.font.SysFont("Comic Sans MS", 16)
@@ -28,8 +101,11 @@ card_title_font = pygame.font.SysFont("Comic Sans MS", 28)
 card_desc_font = pygame.font.SysFont("Comic Sans MS", 18)
 clock = pygame.time.Clock()
 
+if random_seed >= 0:
+    random.seed(random_seed)
+
 # --- UI / Game state ---
-game_state = "menu"  # menu | playing | settings
+game_state = env_option("FRUIT_START_STATE", "menu")  # menu | playing | settings
 music_on = True
 sfx_on = True
 
@@ -44,13 +120,14 @@ quit_hold_frames = 0
 quit_hold_required = 15  # frames to confirm quit (~0.5s at 30fps)
 
 # helper to count extended fingers (simple tip vs pip test)
-def count_extended_fingers(handLms, img_h):
+def count_extended_fingers(hand, img_h):
+    # hand: (21, 3) landmark array from tracking.TrackingResult
     # landmarks: tip indices [4,8,12,16,20], compare tip.y < pip.y (tip above pip)
     tips = [4, 8, 12, 16, 20]
     count = 0
     for tip in tips:
-        tip_y = handLms.landmark[tip].y * img_h
-        pip_y = handLms.landmark[tip - 2].y * img_h
+        tip_y = hand[tip, 1] * img_h
+        pip_y = hand[tip - 2, 1] * img_h
         if tip_y < pip_y:
             count += 1
     return count
@@ -216,8 +293,6 @@ for name in ("berhasilbeli.mp3", "berhasilbeli.wav"):
 
 lightning_threshold = 40  # px/frame
 lightning_duration = 6  # frames to show lightning after a fast move
-lightning_timer = 0
-_lightning_was_fast = False
 
 # --- Muat gambar buah ---
 def load_image(name_or_path):
@@ -247,6 +322,13 @@ try:
 except Exception as e:
     print("Error listing fruits directory:", e)
 
+# fruit halves per image and cut angle, cut once instead of on every slice
+split_atlas = SplitAtlas(split_step_deg)
+if split_atlas_mode == "eager":
+    t_atlas = time.perf_counter()
+    split_atlas.build([img for img, _ in fruit_images])
+    print(f"Split atlas: {split_atlas.stats()['cuts']} cuts in {(time.perf_counter() - t_atlas) * 1000:.0f} ms")
+
 # --- Load anomaly (obstacle) assets ---
 boom_img = None
 boom_sound = None
@@ -430,7 +512,6 @@ achievements = globals().get("achievements", set())
 events = globals().get("events", {})
 customization = globals().get("customization", {"background": "default", "slice_sound": "default"})
 challenge_mode = globals().get("challenge_mode", False)
-current_streak = 0
 best_streak = globals().get("best_streak", 0)
 
 # Game-over / failure state
@@ -441,10 +522,11 @@ game_over_active = False
 # --- Variabel Game ---
 fruits = []
 halves = []  # potongan buah setelah terbelah
-splashes = []  # juice splash particles
-particles = []  # small spark / fruit particles for explosion
+splashes = SplashSystem()  # juice splash streaks (particles.py, arrays per field)
+particles = ParticleSystem()  # small spark / fruit particles, coin particles to the UI
 slice_effects = []  # quick per-slice visual overlays (fading cut lines)
-score = 0
+# per-player fingertip, trail, score, combo and streak (players.py)
+players = [Player(0), Player(1)]
 # Coins (shop-coin)
 coins = []  # coin entities thrown rarely like fruits
 coin_count = 0
@@ -457,22 +539,24 @@ selected_trail = "default"  # options: default, neon, rainbow
 shop_msg = None
 # Shop UI scroll offset (pixels)
 shop_scroll = 0
-# Combo system
-combo_count = 0
-last_slice_time = 0.0
-multiplier = 1
+# Combo system (combo_count / multiplier live on each Player)
 combo_popups = []  # active combo popup animations
+text_cache = TextCache()  # combo popup / GAME OVER text, rendered and scaled once per size
 # camera shake and combo lightning
 camera_shake_timer = 0
 camera_shake_intensity = 0
 combo_lightning_timer = 0
-last_forced_coin_time = time.time()  # coins timer for forced spawn
+last_forced_coin_time = 0.0  # coins timer for forced spawn (sim_clock.time)
 
 # Obstacles (anomali)
 obstacles = []  # dicts with x,y,vx,vy,img,type
 explosion_flash_timer = 0
-shockwaves = []
-screen_splatters = []  # full-screen splatter overlays (list of dicts)
+# world pass (background, fruits, effects) drawn at render_scale, upscaled once per frame
+render_scaler = RenderScaler((width, height), render_scale)
+screen_splatters = SplatterOverlay(render_scaler.size, scale=render_scaler.scale)  # full-screen boom splatters, one shared overlay
+overlay_pool = SurfacePool(render_scaler.size)  # reused full-screen scratch surfaces for effects (world size)
+screen_pool = SurfacePool((width, height))  # native-size fills drawn over the HUD (game-over tint)
+ui_layer = RetainedLayer((width, height))  # cached menu / settings / shop UI, redrawn only on change
 
 def spawn_fruit(count=1, include_obstacle=False):
     """Spawn `count` fruits in a small cluster (default 1).
@@ -493,7 +577,7 @@ def spawn_fruit(count=1, include_obstacle=False):
         vy = random.randint(-30, -20)  # a bit stronger upward velocity
 
         img, ftype = random.choice(fruit_images)
-        fruits.append({"x": x, "y": y, "vx": vx, "vy": vy, "img": img, "type": ftype})
+        fruits.append(Thrown(x, y, vx, vy, img, ftype))
 
         # play throw sound when a fruit is spawned (if available)
         try:
@@ -509,7 +593,7 @@ def spawn_fruit(count=1, include_obstacle=False):
             obs_y = y
             obs_vx = random.randint(-6, 6)
             obs_vy = random.randint(-26, -16)
-            obstacles.append({"x": obs_x, "y": obs_y, "vx": obs_vx, "vy": obs_vy, "img": boom_img, "type": "boom"})
+            obstacles.append(Thrown(obs_x, obs_y, obs_vx, obs_vy, boom_img, "boom"))
             # play throw sound for obstacle as well
             try:
                 if boom_timer_sound and sfx_on:
@@ -532,7 +616,7 @@ def spawn_obstacle():
     vx = random.randint(-6, 6)
     vy = random.randint(-26, -16)
     img = boom_img
-    obstacles.append({"x": x, "y": y, "vx": vx, "vy": vy, "img": img, "type": "boom"})
+    obstacles.append(Thrown(x, y, vx, vy, img, "boom"))
     # optional throw sound for obstacles (re-use throw_sound if boom sound not present)
     try:
         # play timer sound when obstacle is thrown
@@ -560,7 +644,7 @@ def spawn_coin():
     vx = random.choice([-7, -5, -3, 3, 5, 7])
     vy = random.randint(-30, -20)
     img = coin_img
-    coins.append({"x": x, "y": y, "vx": vx, "vy": vy, "img": img, "type": "coin"})
+    coins.append(Thrown(x, y, vx, vy, img, "coin"))
     try:
         if throw_sound and sfx_on:
             throw_sound.play()
@@ -571,33 +655,23 @@ def spawn_coin():
 def make_half_images(img):
     """Return (left_img, right_img) from a full fruit image (assumed 80x80).
 
-    Each half is 40x80 with transparent background.
+    Each half is 40x80 with transparent background; cut once per image and
+    shared through `split_atlas`.
     """
-    w, h = img.get_width(), img.get_height()
-    half_w = w // 2
-
-    left = pygame.Surface((half_w, h), pygame.SRCALPHA)
-    right = pygame.Surface((half_w, h), pygame.SRCALPHA)
-
-    # blit the left half (0..half_w)
-    left.blit(img, (0, 0), (0, 0, half_w, h))
-    # blit the right half (half_w..w)
-    right.blit(img, (0, 0), (half_w, 0, half_w, h))
+    return split_atlas.vertical(img)
 
-    return left, right
 
-
-def split_fruit(fruit, slice_angle=None, slice_speed=None):
+def split_fruit(fruit, slice_angle=None, slice_speed=None, pos=None):
     """Replace a fruit with two animated halves.
 
     If `slice_angle` is provided (degrees, direction of the swipe), the fruit
     will be split along the swipe line so the two halves separate perpendicular
     to the swipe (i.e. a horizontal swipe -> top/bottom halves). This creates
-    a more natural split that follows the player's gesture.
+    a more natural split that follows the player's gesture. `pos` is the
+    top-left the fruit was drawn at this frame (default: its step position).
     """
-    img = fruit.get("img")
-    fx = fruit.get("x", 0)
-    fy = fruit.get("y", 0)
+    img = fruit.img
+    fx, fy = pos if pos is not None else (fruit.x, fruit.y)
 
     life = 45  # frames until removed (~1.5s at 30fps)
 
@@ -606,80 +680,58 @@ def split_fruit(fruit, slice_angle=None, slice_speed=None):
             # fallback to the old vertical half-split when no angle is known
             left_img, right_img = make_half_images(img)
 
-            halves.append({
-                "x": fx,
-                "y": fy,
-                "vx": random.uniform(-8.0, -4.0),
-                "vy": random.uniform(-12.0, -6.0),
-                "img": left_img,
-                "angle": random.uniform(-10, 10),
-                "avel": random.uniform(-5, -1),
-                "alpha": 255,
-                "life": life,
-                "max_life": life,
-            })
-
-            halves.append({
-                "x": fx + left_img.get_width(),
-                "y": fy,
-                "vx": random.uniform(4.0, 8.0),
-                "vy": random.uniform(-12.0, -6.0),
-                "img": right_img,
-                "angle": random.uniform(-10, 10),
-                "avel": random.uniform(1, 5),
-                "alpha": 255,
-                "life": life,
-                "max_life": life,
-            })
+            halves.append(Half(
+                x=fx,
+                y=fy,
+                vx=random.uniform(-8.0, -4.0),
+                vy=random.uniform(-12.0, -6.0),
+                img=left_img,
+                angle=random.uniform(-10, 10),
+                avel=random.uniform(-5, -1),
+                life=life,
+            ))
+
+            halves.append(Half(
+                x=fx + left_img.get_width(),
+                y=fy,
+                vx=random.uniform(4.0, 8.0),
+                vy=random.uniform(-12.0, -6.0),
+                img=right_img,
+                angle=random.uniform(-10, 10),
+                avel=random.uniform(1, 5),
+                life=life,
+            ))
             return
 
-        # Split along the line defined by the swipe direction.
-        # Rotate the fruit so the swipe (cut) aligns horizontally, split top/bottom,
-        # then rotate halves back to original orientation.
-        ang = float(slice_angle)
-        theta = math.radians(ang)
-
-        # rotate so swipe direction aligns with +x axis
-        rotated = pygame.transform.rotate(img, -ang)
-        rw, rh = rotated.get_width(), rotated.get_height()
-
-        # split rotated image into top and bottom halves (cut line horizontal)
-        y_mid = rh // 2
+        # Split along the line defined by the swipe direction: the halves for
+        # this fruit image and (quantized) cut angle come precut from the atlas.
         try:
-            top_rot = rotated.subsurface((0, 0, rw, y_mid)).copy()
-            bottom_rot = rotated.subsurface((0, y_mid, rw, rh - y_mid)).copy()
+            top_final, bottom_final, rh, ang = split_atlas.cut(img, slice_angle)
         except Exception:
-            # fallback: vertical halves if subsurface fails
+            # fallback: vertical halves if cutting fails
             left_img, right_img = make_half_images(img)
-            halves.append({
-                "x": fx,
-                "y": fy,
-                "vx": random.uniform(-8.0, -4.0),
-                "vy": random.uniform(-12.0, -6.0),
-                "img": left_img,
-                "angle": random.uniform(-10, 10),
-                "avel": random.uniform(-5, -1),
-                "alpha": 255,
-                "life": life,
-                "max_life": life,
-            })
-            halves.append({
-                "x": fx + left_img.get_width(),
-                "y": fy,
-                "vx": random.uniform(4.0, 8.0),
-                "vy": random.uniform(-12.0, -6.0),
-                "img": right_img,
-                "angle": random.uniform(-10, 10),
-                "avel": random.uniform(1, 5),
-                "alpha": 255,
-                "life": life,
-                "max_life": life,
-            })
+            halves.append(Half(
+                x=fx,
+                y=fy,
+                vx=random.uniform(-8.0, -4.0),
+                vy=random.uniform(-12.0, -6.0),
+                img=left_img,
+                angle=random.uniform(-10, 10),
+                avel=random.uniform(-5, -1),
+                life=life,
+            ))
+            halves.append(Half(
+                x=fx + left_img.get_width(),
+                y=fy,
+                vx=random.uniform(4.0, 8.0),
+                vy=random.uniform(-12.0, -6.0),
+                img=right_img,
+                angle=random.uniform(-10, 10),
+                avel=random.uniform(1, 5),
+                life=life,
+            ))
             return
-
-        # rotate halves back to match original orientation
-        top_final = pygame.transform.rotate(top_rot, ang)
-        bottom_final = pygame.transform.rotate(bottom_rot, ang)
+        theta = math.radians(ang)
 
         # compute center offsets: in rotated coords the centers are +/- rh/4 in Y
         offset_top_rot = (0.0, - (rh * 0.25))
@@ -717,137 +769,231 @@ def split_fruit(fruit, slice_angle=None, slice_speed=None):
             except Exception:
                 pass
 
-        halves.append({
-            "x": top_cx - top_final.get_width() / 2,
-            "y": top_cy - top_final.get_height() / 2,
-            "vx": (-nx) * sp_base1 + random.uniform(-0.9, 0.9),
-            "vy": (-ny) * sp_base1 + random.uniform(-4.0, -1.5),
-            "img": top_final,
-            "angle": math.degrees(math.atan2(-ny, -nx)) + random.uniform(-12, 12),
-            "avel": random.uniform(-6, -2),
-            "alpha": 255,
-            "life": life,
-            "max_life": life,
-            # smoothing fields for first frames
-            "vel_smooth_frames": 6,
-            "target_vx": (-nx) * sp_base1,
-            "target_vy": (-ny) * sp_base1,
-        })
-
-        halves.append({
-            "x": bot_cx - bottom_final.get_width() / 2,
-            "y": bot_cy - bottom_final.get_height() / 2,
-            "vx": (nx) * sp_base2 + random.uniform(-0.9, 0.9),
-            "vy": (ny) * sp_base2 + random.uniform(-4.0, -1.5),
-            "img": bottom_final,
-            "angle": math.degrees(math.atan2(ny, nx)) + random.uniform(-12, 12),
-            "avel": random.uniform(2, 6),
-            "alpha": 255,
-            "life": life,
-            "max_life": life,
-            "vel_smooth_frames": 6,
-            "target_vx": (nx) * sp_base2,
-            "target_vy": (ny) * sp_base2,
-        })
+        halves.append(Half(
+            x=top_cx - top_final.get_width() / 2,
+            y=top_cy - top_final.get_height() / 2,
+            vx=(-nx) * sp_base1 + random.uniform(-0.9, 0.9),
+            vy=(-ny) * sp_base1 + random.uniform(-4.0, -1.5),
+            img=top_final,
+            angle=math.degrees(math.atan2(-ny, -nx)) + random.uniform(-12, 12),
+            avel=random.uniform(-6, -2),
+            life=life,
+            vel_smooth_frames=6,
+            target_vx=(-nx) * sp_base1,
+            target_vy=(-ny) * sp_base1,
+        ))
+
+        halves.append(Half(
+            x=bot_cx - bottom_final.get_width() / 2,
+            y=bot_cy - bottom_final.get_height() / 2,
+            vx=(nx) * sp_base2 + random.uniform(-0.9, 0.9),
+            vy=(ny) * sp_base2 + random.uniform(-4.0, -1.5),
+            img=bottom_final,
+            angle=math.degrees(math.atan2(ny, nx)) + random.uniform(-12, 12),
+            avel=random.uniform(2, 6),
+            life=life,
+            vel_smooth_frames=6,
+            target_vx=(nx) * sp_base2,
+            target_vy=(ny) * sp_base2,
+        ))
     except Exception:
         # defensive fallback: use simple vertical halves
         try:
             left_img, right_img = make_half_images(img)
-            halves.append({
-                "x": fx,
-                "y": fy,
-                "vx": random.uniform(-8.0, -4.0),
-                "vy": random.uniform(-12.0, -6.0),
-                "img": left_img,
-                "angle": random.uniform(-10, 10),
-                "avel": random.uniform(-5, -1),
-                "alpha": 255,
-                "life": life,
-                "max_life": life,
-            })
-            halves.append({
-                "x": fx + left_img.get_width(),
-                "y": fy,
-                "vx": random.uniform(4.0, 8.0),
-                "vy": random.uniform(-12.0, -6.0),
-                "img": right_img,
-                "angle": random.uniform(-10, 10),
-                "avel": random.uniform(1, 5),
-                "alpha": 255,
-                "life": life,
-                "max_life": life,
-            })
+            halves.append(Half(
+                x=fx,
+                y=fy,
+                vx=random.uniform(-8.0, -4.0),
+                vy=random.uniform(-12.0, -6.0),
+                img=left_img,
+                angle=random.uniform(-10, 10),
+                avel=random.uniform(-5, -1),
+                life=life,
+            ))
+            halves.append(Half(
+                x=fx + left_img.get_width(),
+                y=fy,
+                vx=random.uniform(4.0, 8.0),
+                vy=random.uniform(-12.0, -6.0),
+                img=right_img,
+                angle=random.uniform(-10, 10),
+                avel=random.uniform(1, 5),
+                life=life,
+            ))
         except Exception:
             pass
 
-cap = cv2.VideoCapture(0)
+def draw_perf_hud(lines):
+    """Draw small diagnostic lines at the bottom-left (FRUIT_PERF_HUD=1)."""
+    if not lines:
+        return
+    try:
+        rendered = [tiny_font.render(line, True, (220, 255, 220)) for line in lines]
+        box_w = max(r.get_width() for r in rendered) + 12
+        box_h = sum(r.get_height() for r in rendered) + 8
+        box = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        box.fill((0, 0, 0, 150))
+        y = 4
+        for r in rendered:
+            box.blit(r, (6, y))
+            y += r.get_height()
+        screen.blit(box, (6, height - box_h - 6))
+    except Exception:
+        pass
+
+
+def format_stats(stats):
+    parts = []
+    for k, v in stats.items():
+        parts.append(f"{k} {v:.1f}" if isinstance(v, float) else f"{k} {v}")
+    return " ".join(parts)
+
+
+def set_player_count(count):
+    """Switch between single player and local multiplayer (settings toggle)."""
+    global player_count
+    player_count = count
+    for player in players:
+        player.lose_finger()
+    # one inference pass finds both hands; the tracker just looks for more of them
+    if tracker is not None:
+        try:
+            tracker.configure(max_num_hands=count)
+        except Exception:
+            pass
+
+
+landmark_recorder = LandmarkRecorder(record_landmarks_path) if record_landmarks_path else None
+frame_log = open(frame_log_path, "w", encoding="utf-8") if frame_log_path else None
+if frame_log:
+    frame_log.write("frame,work_ms\n")
+frame_times = []
+frame_index = 0
+
+# inline tracking shares the frame with simulation and drawing, so it only gets
+# half of it; a worker process or the async tasks backend may use the whole frame interval
+tracking_governor = None
+if tracker is not None and tracking_governor_on:
+    budget = tracking_budget_ms
+    if budget <= 0:
+        budget = (1000.0 / target_fps) * (1.0 if tracker.name in ("process", "tasks") else 0.5)
+    tracking_governor = TrackingGovernor(budget)
+# effect counts / layers follow the whole frame's work time (auto) or a fixed preset
+effect_quality = EffectQuality(effects_mode, 1000.0 / max(1, render_fps))
+# physics and timers step at target_fps whatever the render rate; recorded / synthetic
+# inputs advance one sample per frame, so replays keep one step per frame to stay reproducible
+sim_clock = FixedTimestep(target_fps, lockstep=sim_lockstep or input_source.provides_landmarks)
+camera_frames_skipped = 0
 
 running = True
 spawn_timer = 0
-finger_trail = []  # posisi jari sebelumnya (untuk efek garis slice)
+camera_background = CameraBackground(render_scaler.size)
+# sliced halves spin through the same angles: rotate once per (image, angle bucket)
+rotation_cache = RotationCache(rotation_step_deg, int(rotation_cache_mb * 1024 * 1024))
+frame_surface = None
+frame_seq = 0
+last_track_submit = 0.0
+# player 1's fingertip also drives the menus (finger taps on buttons)
+finger_x, finger_y = None, None
+finger_count = 0
+players_toggle_held = False
 
 while running:
-    ret, frame = cap.read()
-    if not ret:
-        break
+    frame_start = time.perf_counter()
+    # fixed simulation steps due this frame, and how far we are into the next one
+    sim_steps = sim_clock.advance(frame_start)
+    sim_alpha = sim_clock.alpha
+    overlay_pool.begin_frame()
+    screen_pool.begin_frame()
+    # ambil frame terbaru dari sumber input (webcam: thread kamera, tanpa menunggu)
+    input_source.set_keep_out(menu_keep_out if game_state == "menu" else play_keep_out)
+    frame, frame_is_new, source_hands = input_source.read()
+
+    if frame is not None and frame_is_new:
+        frame_seq += 1
+        # inline: runs now; worker process: queued, result picked up by poll() later
+        now_t = time.perf_counter()
+        frame_skip = tracking_governor.settings["frame_skip"] if tracking_governor else 0
+        if camera_frames_skipped < frame_skip:
+            camera_frames_skipped += 1
+        elif tracker is not None and (tracking_hz <= 0 or now_t - last_track_submit >= 1.0 / tracking_hz):
+            camera_frames_skipped = 0
+            last_track_submit = now_t
+            tracker.submit(frame, frame_seq)
+        # Non-mirror (kanan tetap kanan): mirrored into one reused surface, no per-frame allocation
+        frame_surface = camera_background.update(frame)
+
+    # newest finished landmarks; while inference is in flight the last known ones stay in use
+    if source_hands is not None:
+        tracking, tracking_is_new = source_hands, True
+    elif tracker is not None:
+        tracking, tracking_is_new = tracker.poll()
+        if tracker.name == "process" and not tracker.alive():
+            print("Tracking worker stopped, switching to inline tracking")
+            tracker.close()
+            tracker = create_tracker("inline", max_num_hands=player_count, roi=tracking_roi)
+    else:
+        tracking_is_new = False
+    if landmark_recorder is not None:
+        # one entry per frame (a hold when nothing new arrived) so replays keep the timing
+        landmark_recorder.write(tracking if tracking_is_new else None)
+    if tracking_is_new and tracking_governor is not None:
+        new_settings = tracking_governor.observe(tracking.infer_ms, frame_seq=tracking.frame_seq)
+        if new_settings is not None:
+            print("Tracking governor:", tracking_governor.last_decision, new_settings)
+            tracker.configure(**new_settings)
+            # the first inference on the rebuilt model is slow, keep it out of the average
+            tracking_governor.configured(frame_seq)
+
+    # world pass target: the screen, or the smaller offscreen surface in render-scale mode
+    world = render_scaler.begin(screen)
+    hud = render_scaler.hud
 
-    # Non-mirror (kanan tetap kanan)
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = hands.process(rgb)
-    frame = cv2.resize(rgb, (width, height))
-    frame_surface = pygame.surfarray.make_surface(np.rot90(frame))
     # apply camera shake offset when active
-    if camera_shake_timer > 0:
+    if frame_surface is None:
+        # no camera frame yet (or camera unplugged): keep the game running on a plain background
+        world.fill((20, 20, 24))
+        if camera_shake_timer > 0:
+            camera_shake_timer = max(0, camera_shake_timer - sim_steps)
+    elif camera_shake_timer > 0:
         ox = random.randint(-camera_shake_intensity, camera_shake_intensity)
         oy = random.randint(-camera_shake_intensity, camera_shake_intensity)
-        screen.blit(frame_surface, (ox, oy))
-        camera_shake_timer -= 1
+        world.blit(frame_surface, render_scaler.pos(ox, oy))
+        camera_shake_timer = max(0, camera_shake_timer - sim_steps)
     else:
-        screen.blit(frame_surface, (0, 0))
-
-    finger_x, finger_y = None, None
-    finger_count = 0
-    if results.multi_hand_landmarks:
-        for handLms in results.multi_hand_landmarks:
-            h, w, c = frame.shape
-            finger = handLms.landmark[8]
+        world.blit(frame_surface, (0, 0))
+
+    # feed new tracking results into each player's fingertip estimator; both
+    # players' hands come from the same inference pass
+    active_players = players[:player_count]
+    if tracking_is_new:
+        hand_slots = assign_hands(tracking, player_count)
+        for player, hand_i in zip(active_players, hand_slots):
+            if hand_i is None:
+                player.estimator.reset()
+                continue
+            tip = tracking.tips[hand_i]
             # Balik posisi X biar sesuai non-mirror
-            finger_x = width - int(finger.x * width)
-            finger_y = int(finger.y * height)
-
-            # Simpan posisi jari
-            finger_trail.append((finger_x, finger_y))
-            if len(finger_trail) > 5:
-                finger_trail.pop(0)
-
-            # Deteksi gerakan cepat untuk efek lightning
-            if len(finger_trail) > 1:
-                x1, y1 = finger_trail[-2]
-                x2, y2 = finger_trail[-1]
-                d = math.hypot(x2 - x1, y2 - y1)
-                fast = d > lightning_threshold
-                if fast and not _lightning_was_fast:
-                    # mulai flash singkat dan mainkan suara sekali
-                    lightning_timer = lightning_duration
-                    # hanya tampilkan efek visual untuk lightning; jangan mainkan suara split di sini
-                    # (split sound akan dimainkan hanya saat buah benar-benar terbelah)
-                    pass
-                elif fast:
-                    # perpanjang sedikit bila masih cepat
-                    lightning_timer = max(lightning_timer, lightning_duration)
-                _lightning_was_fast = fast
+            player.estimator.update(width - tip[0] * width, tip[1] * height, tracking.timestamp)
             # hitung jumlah jari yang terentang untuk gesture quit
             try:
-                finger_count = count_extended_fingers(handLms, height)
+                player.finger_count = count_extended_fingers(tracking.landmarks[hand_i], height)
             except Exception:
-                finger_count = 0
-
-    else:
-        finger_trail.clear()
+                player.finger_count = 0
+
+    # fingertips for this rendered frame: filtered, extrapolated up to the prediction horizon
+    # (sampled on the source's clock: the wall clock live, the frame clock in replays)
+    now_t = input_source.clock()
+    for player in active_players:
+        player.track(now_t, lightning_threshold, lightning_duration)
+    finger_x, finger_y = players[0].finger_x, players[0].finger_y
+    finger_count = max(p.finger_count for p in active_players)
+    # each finger's path since the last frame, for the swept slice tests below
+    finger_segs = finger_segments(active_players)
 
     # update quit-by-5-fingers
     if finger_count == 5:
-        quit_hold_frames += 1
+        quit_hold_frames += sim_steps
     else:
         quit_hold_frames = 0
     if quit_hold_frames >= quit_hold_required:
@@ -860,58 +1006,67 @@ while running:
     # (fist-scroll removed)
 
     # Efek garis slice (trail neon)
-    if len(finger_trail) > 1:
-        # support multiple trail styles: default, neon (blue), rainbow
-        def hsv_to_rgb(h, s, v):
-            # h in [0,1], s,v in [0,1]
-            i = int(h * 6.0)
-            f = (h * 6.0) - i
-            p = v * (1.0 - s)
-            q = v * (1.0 - f * s)
-            t = v * (1.0 - (1.0 - f) * s)
-            i = i % 6
-            if i == 0:
-                r, g, b = v, t, p
-            elif i == 1:
-                r, g, b = q, v, p
-            elif i == 2:
-                r, g, b = p, v, t
-            elif i == 3:
-                r, g, b = p, q, v
-            elif i == 4:
-                r, g, b = t, p, v
-            else:
-                r, g, b = v, p, q
-            return int(r * 255), int(g * 255), int(b * 255)
+    def hsv_to_rgb(h, s, v):
+        # h in [0,1], s,v in [0,1]
+        i = int(h * 6.0)
+        f = (h * 6.0) - i
+        p = v * (1.0 - s)
+        q = v * (1.0 - f * s)
+        t = v * (1.0 - (1.0 - f) * s)
+        i = i % 6
+        if i == 0:
+            r, g, b = v, t, p
+        elif i == 1:
+            r, g, b = q, v, p
+        elif i == 2:
+            r, g, b = p, v, t
+        elif i == 3:
+            r, g, b = p, q, v
+        elif i == 4:
+            r, g, b = t, p, v
+        else:
+            r, g, b = v, p, q
+        return int(r * 255), int(g * 255), int(b * 255)
 
-        for i in range(len(finger_trail) - 1):
-            start = finger_trail[i]
-            end = finger_trail[i + 1]
+    for player in active_players:
+        trail = player.trail
+        if len(trail) < 2:
+            continue
+        # support multiple trail styles: default, neon (blue), rainbow
+        for i in range(len(trail) - 1):
+            start = trail[i]
+            end = trail[i + 1]
             # compute base thickness
             thickness = max(1, 6 - i)
             if globals().get("selected_trail", "default") == "neon":
                 color = (30, 200, 255)
             elif globals().get("selected_trail", "default") == "rainbow":
                 # hue varies along the trail
-                h = (i / max(1, len(finger_trail) - 1))
+                h = (i / max(1, len(trail) - 1))
                 # rotate hue a bit over time for animated rainbow
-                h = (h + (time.time() * 0.08)) % 1.0
+                h = (h + (sim_clock.time * 0.08)) % 1.0
                 color = hsv_to_rgb(h, 0.95, 0.95)
-            else:
+            elif player.index == 0:
                 color = (0, 255, max(60, 255 - i * 40))
-            pygame.draw.line(screen, color, start, end, thickness)
+            else:
+                # player 2 gets a warm trail so the two swipes stay distinguishable
+                color = (255, max(60, 200 - i * 30), 40)
+            pygame.draw.line(world, color, render_scaler.pos(*start), render_scaler.pos(*end), render_scaler.length(thickness))
 
     # Crosshair keren (target)
-    if finger_x and finger_y:
-        pygame.draw.circle(screen, (255, 255, 255), (finger_x, finger_y), 15, 2)
-        pygame.draw.circle(screen, (0, 255, 255), (finger_x, finger_y), 5)
-        pygame.draw.line(screen, (0, 255, 255), (finger_x - 20, finger_y), (finger_x + 20, finger_y), 1)
-        pygame.draw.line(screen, (0, 255, 255), (finger_x, finger_y - 20), (finger_x, finger_y + 20), 1)
+    for player in active_players:
+        if player.has_finger():
+            fx_c, fy_c = render_scaler.pos(player.finger_x, player.finger_y)
+            arm = render_scaler.length(20)
+            pygame.draw.circle(world, (255, 255, 255), (fx_c, fy_c), render_scaler.length(15), render_scaler.length(2))
+            pygame.draw.circle(world, player.color, (fx_c, fy_c), render_scaler.length(5))
+            pygame.draw.line(world, player.color, (fx_c - arm, fy_c), (fx_c + arm, fy_c), 1)
+            pygame.draw.line(world, player.color, (fx_c, fy_c - arm), (fx_c, fy_c + arm), 1)
 
     # Jika di menu atau settings, tampilkan UI dan jangan spawn buah
     if game_state == "playing":
         # Spawn buah tiap 60 frame (slower spawn rate to reduce crowding)
-        spawn_timer += 1
+        spawn_timer += sim_steps
         if spawn_timer > 60:
             # Make most spawns single fruits; occasionally spawn a small group (2-3)
             if random.random() < 0.70:
@@ -921,9 +1076,9 @@ while running:
             # small chance to spawn an obstacle (boom) instead of fruits
             # forced coin spawn every 1 minute 25 seconds (85s)
             try:
-                if time.time() - last_forced_coin_time >= 85:
+                if sim_clock.time - last_forced_coin_time >= 85:
                     spawn_coin()
-                    last_forced_coin_time = time.time()
+                    last_forced_coin_time = sim_clock.time
             except Exception:
                 pass
 
@@ -944,9 +1099,9 @@ while running:
         try:
             # move home button a bit lower for easier tapping
             home_rect = pygame.Rect(10, 60, 92, 34)
-            pygame.draw.rect(screen, (40, 40, 40), home_rect, border_radius=8)
-            home_txt = tiny_font.render("Home", True, (255, 255, 255))
-            screen.blit(home_txt, (home_rect.x + (home_rect.w - home_txt.get_width()) // 2, home_rect.y + (home_rect.h - home_txt.get_height()) // 2))
+            hud.rect((40, 40, 40), home_rect, border_radius=8)
+            home_txt = text_cache.render(tiny_font, "Home", (255, 255, 255))
+            hud.blit(home_txt, (home_rect.x + (home_rect.w - home_txt.get_width()) // 2, home_rect.y + (home_rect.h - home_txt.get_height()) // 2))
 
             # detect click or finger tap on Home
             mx, my = pygame.mouse.get_pos()
@@ -954,7 +1109,8 @@ while running:
             if (finger_x and finger_y and home_rect.collidepoint(finger_x, finger_y)) or (home_rect.collidepoint(mx, my) and mouse_pressed):
                 # go back to menu and clear gameplay lists (leaderboard removed)
                 game_state = "menu"
-                finger_trail.clear()
+                for player in players:
+                    player.trail.clear()
                 fruits.clear()
                 halves.clear()
                 splashes.clear()
@@ -971,24 +1127,34 @@ while running:
             pass
         # Draw score and multiplier while playing (top-left) so menu remains clean
         try:
-            score_txt = font.render(f"Score: {score}", True, (255, 255, 255))
-            screen.blit(score_txt, (12, 12))
-            if multiplier > 1:
-                mul_txt = small_font.render(f"x{multiplier}", True, (255, 200, 60))
-                screen.blit(mul_txt, (12 + score_txt.get_width() + 8, 16))
+            if player_count == 1:
+                score_txt = text_cache.render(font, f"Score: {players[0].score}", (255, 255, 255))
+                hud.blit(score_txt, (12, 12))
+                if players[0].multiplier > 1:
+                    mul_txt = text_cache.render(small_font, f"x{players[0].multiplier}", (255, 200, 60))
+                    hud.blit(mul_txt, (12 + score_txt.get_width() + 8, 16))
+            else:
+                # one line per player, colored like their crosshair; Home sits below at y=60
+                # (cached: the lines only change when a score or multiplier does)
+                for player in active_players:
+                    score_txt = text_cache.render(small_font, f"{player.label}: {player.score}", player.color)
+                    sy = 8 + player.index * 26
+                    hud.blit(score_txt, (12, sy))
+                    if player.multiplier > 1:
+                        mul_txt = text_cache.render(tiny_font, f"x{player.multiplier}", (255, 200, 60))
+                        hud.blit(mul_txt, (12 + score_txt.get_width() + 8, sy + 4))
         except Exception:
             pass
     else:
-        # Gambar menu / pengaturan
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        screen.blit(overlay, (0, 0))
+        # Gambar menu / pengaturan / shop: UI statis ada di ui_layer (digambar ulang
+        # hanya saat hover / toggle / pembelian / scroll berubah), lalu satu blit
+        if game_state not in ("menu", "settings", "shop"):
+            world.blit(overlay_pool.solid((0, 0, 0, 160)), (0, 0))
 
         if game_state == "menu":
             # Responsive layout: title centered, buttons in the middle column
             title_y = 48
-            title = font.render("Fruit Slice 🎮", True, (255, 255, 255))
-            screen.blit(title, ((width - title.get_width()) // 2, title_y))
+            title = text_cache.render(font, "Fruit Slice 🎮", (255, 255, 255))
 
             # compute safe areas and spacing
             margin = 14
@@ -999,10 +1165,11 @@ while running:
 
             # (leaderboard removed; main menu occupies center column)
 
-            # Draw main menu buttons in the center column using the computed coordinates
+            # main menu buttons in the center column using the computed coordinates
             labels = ["Play", "Shop", "Settings", "Quit"]
             mouse_pressed = pygame.mouse.get_pressed()[0]
             mx, my = pygame.mouse.get_pos()
+            menu_buttons = []
             for i, lbl in enumerate(labels):
                 ry = local_btn_y_start + i * (btn_h + btn_gap)
                 rect = pygame.Rect(local_btn_x, ry, btn_w, btn_h)
@@ -1011,12 +1178,20 @@ while running:
                     inside = True
                 if rect.collidepoint(mx, my) and mouse_pressed:
                     inside = True
-
-                color = (40, 120, 220) if inside else (30, 30, 30)
-                pygame.draw.rect(screen, color, rect, border_radius=8)
-                txt = font.render(lbl, True, (255, 255, 255))
-                screen.blit(txt, (rect.x + (rect.w - txt.get_width()) // 2, rect.y + (rect.h - txt.get_height()) // 2))
-
+                menu_buttons.append((lbl, rect, inside))
+
+            # redraw the menu layer only when the highlighted button changes
+            if ui_layer.begin(("menu", tuple(inside for _, _, inside in menu_buttons))):
+                ui_layer.fill((0, 0, 0, 160))
+                ui_layer.blit(title, ((width - title.get_width()) // 2, title_y))
+                for lbl, rect, inside in menu_buttons:
+                    color = (40, 120, 220) if inside else (30, 30, 30)
+                    pygame.draw.rect(ui_layer.surface, color, rect, border_radius=8)
+                    txt = font.render(lbl, True, (255, 255, 255))
+                    ui_layer.blit(txt, (rect.x + (rect.w - txt.get_width()) // 2, rect.y + (rect.h - txt.get_height()) // 2))
+            ui_layer.draw(hud)
+
+            for lbl, rect, inside in menu_buttons:
                 # handle selection (finger point or mouse click)
                 if inside:
                     if lbl == "Play":
@@ -1027,7 +1202,8 @@ while running:
                         except Exception:
                             pass
                         game_state = "playing"
-                        finger_trail.clear()
+                        for player in players:
+                            player.trail.clear()
                         fruits.clear()
                         halves.clear()
                         spawn_timer = 0
@@ -1066,32 +1242,29 @@ while running:
                         running = False
 
         elif game_state == "settings":
-            title = font.render("Settings", True, (255, 255, 255))
-            screen.blit(title, ((width - title.get_width()) // 2, 60))
-
-            # music toggle - use smaller font and center text to avoid overflow
-            music_txt = small_font.render(f"Music: {'On' if music_on else 'Off'}", True, (255, 255, 255))
             music_rect = pygame.Rect(btn_x, btn_y_start, btn_w, btn_h)
-            pygame.draw.rect(screen, (40, 40, 40), music_rect, border_radius=8)
-            screen.blit(music_txt, (music_rect.x + (music_rect.w - music_txt.get_width()) // 2, music_rect.y + (music_rect.h - music_txt.get_height()) // 2))
-
-            # sfx toggle - smaller font centered
-            sfx_txt = small_font.render(f"SFX: {'On' if sfx_on else 'Off'}", True, (255, 255, 255))
             sfx_rect = pygame.Rect(btn_x, btn_y_start + btn_h + btn_gap, btn_w, btn_h)
-            pygame.draw.rect(screen, (40, 40, 40), sfx_rect, border_radius=8)
-            screen.blit(sfx_txt, (sfx_rect.x + (sfx_rect.w - sfx_txt.get_width()) // 2, sfx_rect.y + (sfx_rect.h - sfx_txt.get_height()) // 2))
-
-            # challenge mode toggle (harder, faster fruits/obstacles) - use small font and allow label to wrap visually
-            challenge_txt = small_font.render(f"Challenge Mode: {'On' if globals().get('challenge_mode', False) else 'Off'}", True, (255, 255, 255))
             challenge_rect = pygame.Rect(btn_x, btn_y_start + 2 * (btn_h + btn_gap), btn_w, btn_h)
-            pygame.draw.rect(screen, (40, 40, 40), challenge_rect, border_radius=8)
-            screen.blit(challenge_txt, (challenge_rect.x + (challenge_rect.w - challenge_txt.get_width()) // 2, challenge_rect.y + (challenge_rect.h - challenge_txt.get_height()) // 2))
-
-            # back button (moved down because of Challenge Mode toggle)
-            back_rect = pygame.Rect(btn_x, btn_y_start + 3 * (btn_h + btn_gap), btn_w, btn_h)
-            pygame.draw.rect(screen, (80, 80, 80), back_rect, border_radius=8)
-            back_txt = small_font.render("Back", True, (255, 255, 255))
-            screen.blit(back_txt, (back_rect.x + (back_rect.w - back_txt.get_width()) // 2, back_rect.y + (back_rect.h - back_txt.get_height()) // 2))
+            # players toggle: 1 player or local multiplayer (two hands, one tracking pass)
+            players_rect = pygame.Rect(btn_x, btn_y_start + 3 * (btn_h + btn_gap), btn_w, btn_h)
+            # back button (moved down because of Challenge Mode / Players toggles)
+            back_rect = pygame.Rect(btn_x, btn_y_start + 4 * (btn_h + btn_gap), btn_w, btn_h)
+
+            challenge_on = globals().get('challenge_mode', False)
+            if ui_layer.begin(("settings", music_on, sfx_on, challenge_on, player_count)):
+                ui_layer.fill((0, 0, 0, 160))
+                title = font.render("Settings", True, (255, 255, 255))
+                ui_layer.blit(title, ((width - title.get_width()) // 2, 60))
+                # toggles use the smaller font, centered, to avoid overflow
+                for rect, label, color in ((music_rect, f"Music: {'On' if music_on else 'Off'}", (40, 40, 40)),
+                                           (sfx_rect, f"SFX: {'On' if sfx_on else 'Off'}", (40, 40, 40)),
+                                           (challenge_rect, f"Challenge Mode: {'On' if challenge_on else 'Off'}", (40, 40, 40)),
+                                           (players_rect, f"Players: {player_count}", (40, 40, 40)),
+                                           (back_rect, "Back", (80, 80, 80))):
+                    pygame.draw.rect(ui_layer.surface, color, rect, border_radius=8)
+                    txt = small_font.render(label, True, (255, 255, 255))
+                    ui_layer.blit(txt, (rect.x + (rect.w - txt.get_width()) // 2, rect.y + (rect.h - txt.get_height()) // 2))
+            ui_layer.draw(hud)
 
             # handle toggles via finger or mouse
             mx, my = pygame.mouse.get_pos()
@@ -1135,6 +1308,18 @@ while running:
                 except Exception:
                     pass
 
+            # only toggle when the finger/click enters the button: changing the
+            # hand count restarts the tracker, which must not happen every frame
+            players_hover = (finger_x and finger_y and players_rect.collidepoint(finger_x, finger_y)) or (players_rect.collidepoint(mx, my) and clicked)
+            if players_hover and not players_toggle_held:
+                try:
+                    if menu_select_sound and sfx_on:
+                        menu_select_sound.play()
+                except Exception:
+                    pass
+                set_player_count(2 if player_count == 1 else 1)
+            players_toggle_held = bool(players_hover)
+
             if (finger_x and finger_y and back_rect.collidepoint(finger_x, finger_y)) or (back_rect.collidepoint(mx, my) and clicked):
                 try:
                     if menu_select_sound and sfx_on:
@@ -1189,50 +1374,61 @@ while running:
             area_bottom = area_top + visible_h
             cx = (width - card_w) // 2
 
-            # flatten list, render category headers when category changes
+            # flatten list, category headers when category changes (layout only, drawn below)
             y = area_top - shop_scroll
             last_cat = None
+            shop_rows = []  # ("header", surf, pos) / ("card", item, rect, btn_rect), in draw order
             for idx, item in enumerate(shop_items):
-                # draw category header when needed
                 cat = item.get("category", None)
                 if cat and cat != last_cat:
-                    hdr = small_font.render(cat, True, (255, 230, 180))
+                    hdr = text_cache.render(small_font, cat, (255, 230, 180))
                     hdr_y = y - 18
                     # only draw category header if it falls within the visible scroll area
-                    try:
-                        if hdr_y + hdr.get_height() >= area_top and hdr_y <= area_bottom:
-                            screen.blit(hdr, (cx, hdr_y))
-                    except Exception:
-                        # fallback: draw normally
-                        screen.blit(hdr, (cx, hdr_y))
+                    if hdr_y + hdr.get_height() >= area_top and hdr_y <= area_bottom:
+                        shop_rows.append(("header", hdr, (cx, hdr_y)))
                     y += hdr.get_height() + 6
                     last_cat = cat
 
                 rect = pygame.Rect(cx, y, card_w, card_h)
                 # only draw if within visible area (simple culling)
                 if rect.bottom >= area_top and rect.top <= area_bottom:
-                    # shadow (soft offset)
-                    try:
-                        shadow_surf = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-                        pygame.draw.rect(shadow_surf, (0, 0, 0, 90), shadow_surf.get_rect(), border_radius=12)
-                        screen.blit(shadow_surf, (rect.x + 4, rect.y + 6))
-                    except Exception:
-                        pass
+                    # combined price+button, vertically centered on the card
+                    content_cy = rect.y + rect.h // 2
+                    btn_w_local = 96
+                    btn_h_local = 36
+                    btn_rect = pygame.Rect(rect.right - 12 - btn_w_local, content_cy - (btn_h_local // 2), btn_w_local, btn_h_local)
+                    shop_rows.append(("card", item, rect, btn_rect))
 
-                    # card panel
-                    try:
-                        panel_surf = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-                        pygame.draw.rect(panel_surf, (28, 30, 34), panel_surf.get_rect(), border_radius=12)
-                        # subtle inner highlight
-                        try:
-                            inner = panel_surf.get_rect().inflate(-6, -6)
-                            pygame.draw.rect(panel_surf, (36, 38, 42), inner, border_radius=10)
-                        except Exception:
-                            pass
-                        screen.blit(panel_surf, rect.topleft)
-                    except Exception:
-                        pygame.draw.rect(screen, (30, 30, 30), rect, border_radius=8)
+                # advance y for next item
+                y += card_h + spacing
 
+            # back button at bottom
+            back_rect = pygame.Rect(btn_x, height - 92, btn_w, btn_h)
+
+            # the cards are only drawn again when the scroll offset or a purchase changes them
+            if ui_layer.begin(("shop", shop_scroll, tuple(sorted(purchased_items)))):
+                ui_layer.fill((0, 0, 0, 160))
+                ui = ui_layer.surface
+
+                # shadow (soft offset) and card panel, shared by every card
+                shadow_surf = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+                pygame.draw.rect(shadow_surf, (0, 0, 0, 90), shadow_surf.get_rect(), border_radius=12)
+                panel_surf = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+                pygame.draw.rect(panel_surf, (28, 30, 34), panel_surf.get_rect(), border_radius=12)
+                # subtle inner highlight
+                try:
+                    inner = panel_surf.get_rect().inflate(-6, -6)
+                    pygame.draw.rect(panel_surf, (36, 38, 42), inner, border_radius=10)
+                except Exception:
+                    pass
+
+                for row in shop_rows:
+                    if row[0] == "header":
+                        ui_layer.blit(row[1], row[2])
+                        continue
+                    _, item, rect, btn_rect = row
+                    ui_layer.blit(shadow_surf, (rect.x + 4, rect.y + 6))
+                    ui_layer.blit(panel_surf, rect.topleft)
 
                     # icon placeholder (filled circle) on left with initials
                     icon_r = 30
@@ -1240,9 +1436,9 @@ while running:
                     icon_y = rect.y + (rect.h // 2)
                     try:
                         # outer circle (border)
-                        pygame.draw.circle(screen, (40, 40, 40), (icon_x + icon_r, icon_y), icon_r + 2)
+                        pygame.draw.circle(ui, (40, 40, 40), (icon_x + icon_r, icon_y), icon_r + 2)
                         # filled inner circle
-                        pygame.draw.circle(screen, (80, 80, 80), (icon_x + icon_r, icon_y), icon_r)
+                        pygame.draw.circle(ui, (80, 80, 80), (icon_x + icon_r, icon_y), icon_r)
                         # draw initials (1-2 letters) centered
                         name = item.get("name", "")
                         initials = "".join([w[0] for w in name.split()[:2]]).upper()
@@ -1251,7 +1447,7 @@ while running:
                         init_surf = card_title_font.render(initials, True, (220, 220, 220))
                         ix = icon_x + icon_r - init_surf.get_width() // 2
                         iy = icon_y - init_surf.get_height() // 2
-                        screen.blit(init_surf, (ix, iy))
+                        ui_layer.blit(init_surf, (ix, iy))
                     except Exception:
                         pass
 
@@ -1263,20 +1459,17 @@ while running:
                     it_x = rect.x + 16 + (icon_r * 2) + 12
                     # nudge title slightly up and description a bit lower to avoid overlap
                     it_y = content_cy - 18
-                    screen.blit(it_name, (it_x, it_y))
+                    ui_layer.blit(it_name, (it_x, it_y))
                     it_desc = card_desc_font.render(item.get("desc", ""), True, (200, 200, 200))
-                    screen.blit(it_desc, (it_x, content_cy + 10))
+                    ui_layer.blit(it_desc, (it_x, content_cy + 10))
 
                     # combined price+button: show price and Buy/Select in one compact control
                     owned = (item["id"] in purchased_items)
-                    btn_w_local = 96
-                    btn_h_local = 36
-                    btn_rect = pygame.Rect(rect.right - 12 - btn_w_local, content_cy - (btn_h_local // 2), btn_w_local, btn_h_local)
                     btn_color = (40, 160, 40) if owned else (80, 80, 180)
                     try:
-                        pygame.draw.rect(screen, btn_color, btn_rect, border_radius=10)
+                        pygame.draw.rect(ui, btn_color, btn_rect, border_radius=10)
                     except Exception:
-                        pygame.draw.rect(screen, btn_color, btn_rect)
+                        pygame.draw.rect(ui, btn_color, btn_rect)
 
                     # render price inside the button (left) and label on right
                     try:
@@ -1285,55 +1478,69 @@ while running:
                         # price at left inside button with small padding
                         px = btn_rect.x + 8
                         py = btn_rect.y + (btn_rect.h - price_txt.get_height()) // 2
-                        screen.blit(price_txt, (px, py))
+                        ui_layer.blit(price_txt, (px, py))
                         # label at right inside button with padding
                         lx = btn_rect.x + btn_rect.w - label_txt.get_width() - 8
                         ly = btn_rect.y + (btn_rect.h - label_txt.get_height()) // 2
-                        screen.blit(label_txt, (lx, ly))
+                        ui_layer.blit(label_txt, (lx, ly))
                     except Exception:
                         pass
 
-                    # handle touch/click (mouse or finger)
-                    if (finger_x and finger_y and btn_rect.collidepoint(finger_x, finger_y)) or (btn_rect.collidepoint(mx, my) and clicked):
-                        if not owned:
+                # draw Shop title on top so it never gets covered by cards
+                try:
+                    title = font.render("Shop", True, (255, 255, 255))
+                    ui_layer.blit(title, ((width - title.get_width()) // 2, 40))
+                except Exception:
+                    pass
+
+                pygame.draw.rect(ui, (80, 80, 80), back_rect, border_radius=8)
+                back_txt = font.render("Back", True, (255, 255, 255))
+                ui_layer.blit(back_txt, (back_rect.x + (back_rect.w - back_txt.get_width()) // 2, back_rect.y + 12))
+            ui_layer.draw(hud)
+
+            for row in shop_rows:
+                if row[0] != "card":
+                    continue
+                _, item, rect, btn_rect = row
+                owned = (item["id"] in purchased_items)
+                # handle touch/click (mouse or finger)
+                if (finger_x and finger_y and btn_rect.collidepoint(finger_x, finger_y)) or (btn_rect.collidepoint(mx, my) and clicked):
+                    if not owned:
+                        try:
+                            if menu_select_sound and sfx_on:
+                                menu_select_sound.play()
+                        except Exception:
+                            pass
+                        if coin_count >= item["price"]:
+                            coin_count -= item["price"]
+                            purchased_items.add(item["id"])
                             try:
-                                if menu_select_sound and sfx_on:
-                                    menu_select_sound.play()
+                                save_coin_count()
+                            except Exception:
+                                pass
+                            shop_msg = {"text": f"Bought {item['name']}!", "age": 0, "life": 90}
+                            try:
+                                if berhasilbeli_sound and sfx_on:
+                                    berhasilbeli_sound.play()
                             except Exception:
                                 pass
-                            if coin_count >= item["price"]:
-                                coin_count -= item["price"]
-                                purchased_items.add(item["id"])
-                                try:
-                                    save_coin_count()
-                                except Exception:
-                                    pass
-                                shop_msg = {"text": f"Bought {item['name']}!", "age": 0, "life": 90}
-                                try:
-                                    if berhasilbeli_sound and sfx_on:
-                                        berhasilbeli_sound.play()
-                                except Exception:
-                                    pass
-                            else:
-                                shop_msg = {"text": "Not enough coins", "age": 0, "life": 60}
                         else:
+                            shop_msg = {"text": "Not enough coins", "age": 0, "life": 60}
+                    else:
+                        try:
+                            if menu_select_sound and sfx_on:
+                                menu_select_sound.play()
+                        except Exception:
+                            pass
+                        if item["id"].startswith("trail_"):
+                            globals()["selected_trail"] = item["id"].replace("trail_", "")
                             try:
-                                if menu_select_sound and sfx_on:
-                                    menu_select_sound.play()
+                                save_coin_count()
                             except Exception:
                                 pass
-                            if item["id"].startswith("trail_"):
-                                globals()["selected_trail"] = item["id"].replace("trail_", "")
-                                try:
-                                    save_coin_count()
-                                except Exception:
-                                    pass
-                                shop_msg = {"text": f"Selected {item['name']}", "age": 0, "life": 60}
-                            else:
-                                shop_msg = {"text": f"Owned: {item['name']}", "age": 0, "life": 60}
-
-                # advance y for next item
-                y += card_h + spacing
+                            shop_msg = {"text": f"Selected {item['name']}", "age": 0, "life": 60}
+                        else:
+                            shop_msg = {"text": f"Owned: {item['name']}", "age": 0, "life": 60}
 
             # clamp shop_scroll so user can't scroll past content bottom
             try:
@@ -1343,18 +1550,6 @@ while running:
             except Exception:
                 shop_scroll = max(0, shop_scroll)
 
-            # draw Shop title on top so it never gets covered by cards
-            try:
-                title = font.render("Shop", True, (255, 255, 255))
-                screen.blit(title, ((width - title.get_width()) // 2, 40))
-            except Exception:
-                pass
-
-            # back button at bottom
-            back_rect = pygame.Rect(btn_x, height - 92, btn_w, btn_h)
-            pygame.draw.rect(screen, (80, 80, 80), back_rect, border_radius=8)
-            back_txt = font.render("Back", True, (255, 255, 255))
-            screen.blit(back_txt, (back_rect.x + (back_rect.w - back_txt.get_width()) // 2, back_rect.y + 12))
             if (finger_x and finger_y and back_rect.collidepoint(finger_x, finger_y)) or (back_rect.collidepoint(mx, my) and clicked):
                 try:
                     if menu_select_sound and sfx_on:
@@ -1366,759 +1561,595 @@ while running:
         # (scrolling UI removed)
 
     # Update dan gambar buah
-    for fruit in fruits[:]:
-        fruit["x"] += fruit["vx"]
-        fruit["y"] += fruit["vy"]
-        fruit["vy"] += 1  # gravitasi
-
-        screen.blit(fruit["img"], (fruit["x"], fruit["y"]))
-
-        # Deteksi slice
-        if finger_x and finger_y:
-            fx, fy = fruit["x"] + 40, fruit["y"] + 40
-            dist = math.hypot(fx - finger_x, fy - finger_y)
-            if dist < 40:
-                # compute a smoothed slice angle and approximate speed from recent finger positions
+    for fruit in fruits:
+        for _ in range(sim_steps):
+            fruit.step(1)  # gravitasi
+    # swept slice test for every fruit at once (pemain pertama yang jarinya melewati buah)
+    # tested at the interpolated positions drawn this frame, so a slice hits what the player sees
+    fruit_pos = [f.draw_pos(sim_alpha) for f in fruits]
+    fruit_slicers = slicers(active_players, finger_segs, [(x + 40, y + 40) for x, y in fruit_pos], 40)
+    for fruit, (dx_f, dy_f), slicer in zip(fruits, fruit_pos, fruit_slicers):
+        world.blit(render_scaler.image(fruit.img), render_scaler.pos(dx_f, dy_f))
+
+        fx, fy = dx_f + 40, dy_f + 40
+        if slicer is not None:
+            slice_trail = slicer.trail
+            # compute a smoothed slice angle and approximate speed from recent finger positions
+            slice_ang = None
+            slice_spd = None
+            try:
+                if len(slice_trail) >= 2:
+                    # use up to last 5 points to reduce noise
+                    n = min(5, len(slice_trail))
+                    x_first, y_first = slice_trail[-n]
+                    x_last, y_last = slice_trail[-1]
+                    dx = x_last - x_first
+                    dy = y_last - y_first
+                    slice_ang = math.degrees(math.atan2(dy, dx))
+                    # estimate speed as average per-frame distance across the sampled segment
+                    total_dist = 0.0
+                    for i in range(-n + 1, 0):
+                        x_a, y_a = slice_trail[i - 1]
+                        x_b, y_b = slice_trail[i]
+                        total_dist += math.hypot(x_b - x_a, y_b - y_a)
+                    avg_per_frame = total_dist / max(1, (n - 1))
+                    # normalize speed into a usable multiplier (clamp)
+                    slice_spd = max(0.5, min(6.0, avg_per_frame * 0.5))
+            except Exception:
                 slice_ang = None
                 slice_spd = None
+            # mainkan suara split (hanya saat buah benar-benar terbelah)
+            try:
+                if split_sound and sfx_on:
+                    split_sound.play()
+                elif slash_sound and sfx_on:
+                    # fallback jika split_sound tidak tersedia
+                    slash_sound.play()
+            except Exception:
+                pass
+            # buat efek cipratan jus sesuai jenis buah
+            try:
+                # sample a representative color from the fruit image (center area)
                 try:
-                    if len(finger_trail) >= 2:
-                        # use up to last 5 points to reduce noise
-                        n = min(5, len(finger_trail))
-                        x_first, y_first = finger_trail[-n]
-                        x_last, y_last = finger_trail[-1]
-                        dx = x_last - x_first
-                        dy = y_last - y_first
-                        slice_ang = math.degrees(math.atan2(dy, dx))
-                        # estimate speed as average per-frame distance across the sampled segment
-                        total_dist = 0.0
-                        for i in range(-n + 1, 0):
-                            x_a, y_a = finger_trail[i - 1]
-                            x_b, y_b = finger_trail[i]
-                            total_dist += math.hypot(x_b - x_a, y_b - y_a)
-                        avg_per_frame = total_dist / max(1, (n - 1))
-                        # normalize speed into a usable multiplier (clamp)
-                        slice_spd = max(0.5, min(6.0, avg_per_frame * 0.5))
-                except Exception:
-                    slice_ang = None
-                    slice_spd = None
-                # mainkan suara split (hanya saat buah benar-benar terbelah)
-                try:
-                    if split_sound and sfx_on:
-                        split_sound.play()
-                    elif slash_sound and sfx_on:
-                        # fallback jika split_sound tidak tersedia
-                        slash_sound.play()
-                except Exception:
-                    pass
-                # buat efek cipratan jus sesuai jenis buah
-                try:
-                    # sample a representative color from the fruit image (center area)
-                    try:
-                        img_surf = fruit.get("img")
-                        if img_surf:
-                            iw, ih = img_surf.get_width(), img_surf.get_height()
-                            # sample a small patch around the center to average (robust to borders)
-                            sx = max(0, iw // 2 - 3)
-                            sy = max(0, ih // 2 - 3)
-                            sw = min(6, iw - sx)
-                            sh = min(6, ih - sy)
+                    img_surf = fruit.img
+                    if img_surf:
+                        iw, ih = img_surf.get_width(), img_surf.get_height()
+                        # sample a small patch around the center to average (robust to borders)
+                        sx = max(0, iw // 2 - 3)
+                        sy = max(0, ih // 2 - 3)
+                        sw = min(6, iw - sx)
+                        sh = min(6, ih - sy)
+                        try:
+                            patch = img_surf.subsurface((sx, sy, sw, sh)).copy()
+                            arr = pygame.surfarray.array3d(patch)
+                            avg = arr.mean(axis=(0, 1)).astype(int)
+                            c = (int(avg[0]), int(avg[1]), int(avg[2]))
+                        except Exception:
+                            # fallback to center pixel if surfarray/subsurface fails
                             try:
-                                patch = img_surf.subsurface((sx, sy, sw, sh)).copy()
-                                arr = pygame.surfarray.array3d(patch)
-                                avg = arr.mean(axis=(0, 1)).astype(int)
-                                c = (int(avg[0]), int(avg[1]), int(avg[2]))
+                                r, g, b, a = img_surf.get_at((min(iw-1, iw//2), min(ih-1, ih//2)))
+                                c = (r, g, b)
                             except Exception:
-                                # fallback to center pixel if surfarray/subsurface fails
-                                try:
-                                    r, g, b, a = img_surf.get_at((min(iw-1, iw//2), min(ih-1, ih//2)))
-                                    c = (r, g, b)
-                                except Exception:
-                                    c = random.choice([(255, 0, 0), (255, 255, 0), (0, 255, 0), (255, 128, 0)])
-                        else:
-                            c = random.choice([(255, 0, 0), (255, 255, 0), (0, 255, 0), (255, 128, 0)])
-                    except Exception:
-                        # final fallback
+                                c = random.choice([(255, 0, 0), (255, 255, 0), (0, 255, 0), (255, 128, 0)])
+                    else:
                         c = random.choice([(255, 0, 0), (255, 255, 0), (0, 255, 0), (255, 128, 0)])
-                    fx = fruit["x"] + 40
-                    fy = fruit["y"] + 40
-                    # spawn several streak particles (radial) for a nicer splash
-                    for _ in range(18):
-                        ang = random.uniform(0, math.pi * 2)
-                        speed = random.uniform(2.5, 8.0)
-                        vx = math.cos(ang) * speed
-                        vy = math.sin(ang) * speed - random.uniform(0.5, 2.5)
-                        life = random.randint(12, 22)
-                        x0 = fx + random.uniform(-6, 6)
-                        y0 = fy + random.uniform(-6, 6)
-                        splashes.append({
-                            "x": x0,
-                            "y": y0,
-                            "vx": vx,
-                            "vy": vy,
-                            "color": c,
-                            "life": life,
-                            "max_life": life,
-                            # trail points for flowing look (newest first)
-                            "trail": [(x0, y0)],
-                            "seed": random.uniform(0, 10),
-                            "age": 0,
-                        })
-                    # spawn small glittery particles (spark / fruit bits)
-                    try:
-                        for _ in range(20):
-                            pvx = random.uniform(-3.0, 3.0)
-                            pvy = random.uniform(-5.0, -1.0)
-                            life = random.randint(18, 36)
-                            size = random.randint(2, 6)
-                            particles.append({
-                                "x": fx + random.uniform(-6, 6),
-                                "y": fy + random.uniform(-6, 6),
-                                "vx": pvx,
-                                "vy": pvy,
-                                "color": c,
-                                "life": life,
-                                "max_life": life,
-                                "size": size,
-                                "age": 0,
-                            })
-                    except Exception:
-                        pass
+                except Exception:
+                    # final fallback
+                    c = random.choice([(255, 0, 0), (255, 255, 0), (0, 255, 0), (255, 128, 0)])
+                fx = dx_f + 40
+                fy = dy_f + 40
+                # spawn several streak particles (radial) for a nicer splash
+                sx, sy, svx, svy, slife, sseed = [], [], [], [], [], []
+                for _ in range(effect_quality.settings["splash_streaks"]):
+                    ang = random.uniform(0, math.pi * 2)
+                    speed = random.uniform(2.5, 8.0)
+                    svx.append(math.cos(ang) * speed)
+                    svy.append(math.sin(ang) * speed - random.uniform(0.5, 2.5))
+                    slife.append(random.randint(12, 22))
+                    sx.append(fx + random.uniform(-6, 6))
+                    sy.append(fy + random.uniform(-6, 6))
+                    sseed.append(random.uniform(0, 10))
+                splashes.emit(sx, sy, svx, svy, slife, c, sseed)
+                # spawn small glittery particles (spark / fruit bits)
+                try:
+                    px_, py_, pvx_, pvy_, plife, psize = [], [], [], [], [], []
+                    for _ in range(effect_quality.count(20)):
+                        pvx_.append(random.uniform(-3.0, 3.0))
+                        pvy_.append(random.uniform(-5.0, -1.0))
+                        plife.append(random.randint(18, 36))
+                        psize.append(random.randint(2, 6))
+                        px_.append(fx + random.uniform(-6, 6))
+                        py_.append(fy + random.uniform(-6, 6))
+                    particles.emit(px_, py_, pvx_, pvy_, plife, psize, c)
                 except Exception:
                     pass
-                # buat potongan buah dan tambahkan skor
-                split_fruit(fruit, slice_angle=slice_ang, slice_speed=slice_spd)
-                if fruit in fruits:
-                    fruits.remove(fruit)
-
-                # Combo / multiplier logic
-                now = time.time()
-                if (now - last_slice_time) <= 0.5:
-                    combo_count += 1
-                else:
-                    combo_count = 1
-                last_slice_time = now
-
-                # multiplier rule: start rewarding from 3+ combos
-                if combo_count >= 3:
-                    multiplier = 2
-                else:
-                    multiplier = 1
+            except Exception:
+                pass
+            # buat potongan buah dan tambahkan skor
+            split_fruit(fruit, slice_angle=slice_ang, slice_speed=slice_spd, pos=(dx_f, dy_f))
+            fruit.dead = True
 
-                # add score with multiplier
-                score += 1 * multiplier
+            # Combo / multiplier logic (per player)
+            slicer.register_slice(sim_clock.time)
 
-                # --- Events & Achievements: update daily progress and streaks ---
-                try:
-                    # daily slices counter (reset per day)
-                    today = time.strftime("%Y-%m-%d")
-                    ev = globals().get("events", {}) or {}
-                    if ev.get("last_date") != today:
-                        ev["last_date"] = today
-                        ev["slices_today"] = 0
-                        ev["rewarded_100"] = False
-                    ev["slices_today"] = ev.get("slices_today", 0) + 1
-                    globals()["events"] = ev
-                    # reward for 100 slices today
-                    if ev.get("slices_today", 0) >= 100 and not ev.get("rewarded_100", False):
-                        try:
-                            globals()["coin_count"] = globals().get("coin_count", 0) + 10
-                            ev["rewarded_100"] = True
-                            shop_msg = {"text": "Daily reward: +10 coins!", "age": 0, "life": 120}
-                        except Exception:
-                            pass
+            # add score with multiplier
+            slicer.score += 1 * slicer.multiplier
 
-                    # streaks / achievements
-                    globals()["current_streak"] = globals().get("current_streak", 0) + 1
-                    if globals().get("current_streak", 0) > globals().get("best_streak", 0):
-                        globals()["best_streak"] = globals().get("current_streak", 0)
-                    # award achievement badges for streaks
-                    try:
-                        ach = globals().get("achievements", set())
-                        if globals().get("current_streak", 0) >= 25 and "streak25" not in ach:
-                            ach.add("streak25")
-                            shop_msg = {"text": "Achievement: 25 streak!", "age": 0, "life": 120}
-                        if globals().get("current_streak", 0) >= 50 and "streak50" not in ach:
-                            ach.add("streak50")
-                            globals()["coin_count"] = globals().get("coin_count", 0) + 5
-                            shop_msg = {"text": "Achievement: 50 streak! +5 coins", "age": 0, "life": 140}
-                        globals()["achievements"] = ach
-                    except Exception:
-                        pass
+            # --- Events & Achievements: update daily progress and streaks ---
+            try:
+                # daily slices counter (reset per day)
+                today = time.strftime("%Y-%m-%d")
+                ev = globals().get("events", {}) or {}
+                if ev.get("last_date") != today:
+                    ev["last_date"] = today
+                    ev["slices_today"] = 0
+                    ev["rewarded_100"] = False
+                ev["slices_today"] = ev.get("slices_today", 0) + 1
+                globals()["events"] = ev
+                # reward for 100 slices today
+                if ev.get("slices_today", 0) >= 100 and not ev.get("rewarded_100", False):
                     try:
-                        save_coin_count()
+                        globals()["coin_count"] = globals().get("coin_count", 0) + 10
+                        ev["rewarded_100"] = True
+                        shop_msg = {"text": "Daily reward: +10 coins!", "age": 0, "life": 120}
                     except Exception:
                         pass
-                except Exception:
-                    pass
 
-                # spawn a combo popup ONLY on specific combo milestones: 3,7,11,... (3 + 4n)
+                # streaks / achievements
+                slicer.current_streak += 1
+                if slicer.current_streak > globals().get("best_streak", 0):
+                    globals()["best_streak"] = slicer.current_streak
+                # award achievement badges for streaks
                 try:
-                    if combo_count >= 3 and ((combo_count - 3) % 4) == 0:
-                        combo_popups.append({
-                            "text": f"COMBO x{combo_count}",
-                            "x": fx,
-                            "y": fy - 10,
-                            "age": 0,
-                            "life": 45,
-                        })
-                        # camera shake and combo lightning for extra impact
-                        camera_shake_timer = 14
-                        camera_shake_intensity = 8
-                        combo_lightning_timer = 14
-                        # play thunder/combo sound if available
-                        try:
-                            if combo_sound and sfx_on:
-                                combo_sound.play()
-                        except Exception:
-                            pass
+                    ach = globals().get("achievements", set())
+                    if slicer.current_streak >= 25 and "streak25" not in ach:
+                        ach.add("streak25")
+                        shop_msg = {"text": "Achievement: 25 streak!", "age": 0, "life": 120}
+                    if slicer.current_streak >= 50 and "streak50" not in ach:
+                        ach.add("streak50")
+                        globals()["coin_count"] = globals().get("coin_count", 0) + 5
+                        shop_msg = {"text": "Achievement: 50 streak! +5 coins", "age": 0, "life": 140}
+                    globals()["achievements"] = ach
                 except Exception:
                     pass
-
-                # spawn a quick slice visual effect (fading line) using the last two finger trail points
                 try:
-                    if len(finger_trail) >= 2:
-                        x1, y1 = finger_trail[-2]
-                        x2, y2 = finger_trail[-1]
-                        dx = x2 - x1
-                        dy = y2 - y1
-                        ang = math.degrees(math.atan2(dy, dx))
-                        midx = int((x1 + x2) / 2)
-                        midy = int((y1 + y2) / 2)
-                        # sample color from fruit center (or fallback)
-                        try:
-                            img_surf = fruit.get("img")
-                            if img_surf:
-                                iw, ih = img_surf.get_width(), img_surf.get_height()
-                                r, g, b, a = img_surf.get_at((min(iw-1, iw//2), min(ih-1, ih//2)))
-                                col = (r, g, b)
-                            else:
-                                col = (255, 255, 255)
-                        except Exception:
-                            col = (255, 255, 255)
-                        slice_effects.append({
-                            "x": midx,
-                            "y": midy,
-                            "angle": ang,
-                            "life": 18,
-                            "max_life": 18,
-                            "color": col,
-                            "length": int(max(40, math.hypot(dx, dy) * 1.8)),
-                        })
+                    save_coin_count()
                 except Exception:
                     pass
+            except Exception:
+                pass
+
+            # spawn a combo popup ONLY on specific combo milestones: 3,7,11,... (3 + 4n)
+            try:
+                if slicer.combo_count >= 3 and ((slicer.combo_count - 3) % 4) == 0:
+                    combo_popups.append({
+                        "text": (f"{slicer.label} " if player_count > 1 else "") + f"COMBO x{slicer.combo_count}",
+                        "x": fx,
+                        "y": fy - 10,
+                        "age": 0,
+                        "life": 45,
+                    })
+                    # camera shake and combo lightning for extra impact
+                    camera_shake_timer = 14
+                    camera_shake_intensity = 8
+                    combo_lightning_timer = 14
+                    # play thunder/combo sound if available
+                    try:
+                        if combo_sound and sfx_on:
+                            combo_sound.play()
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+
+            # spawn a quick slice visual effect (fading line) using the last two finger trail points
+            try:
+                if len(slice_trail) >= 2:
+                    x1, y1 = slice_trail[-2]
+                    x2, y2 = slice_trail[-1]
+                    dx = x2 - x1
+                    dy = y2 - y1
+                    ang = math.degrees(math.atan2(dy, dx))
+                    midx = int((x1 + x2) / 2)
+                    midy = int((y1 + y2) / 2)
+                    # sample color from fruit center (or fallback)
+                    try:
+                        img_surf = fruit.img
+                        if img_surf:
+                            iw, ih = img_surf.get_width(), img_surf.get_height()
+                            r, g, b, a = img_surf.get_at((min(iw-1, iw//2), min(ih-1, ih//2)))
+                            col = (r, g, b)
+                        else:
+                            col = (255, 255, 255)
+                    except Exception:
+                        col = (255, 255, 255)
+                    slice_effects.append({
+                        "x": midx,
+                        "y": midy,
+                        "angle": ang,
+                        "life": 18,
+                        "max_life": 18,
+                        "color": col,
+                        "length": int(max(40, math.hypot(dx, dy) * 1.8)),
+                    })
+            except Exception:
+                pass
 
         # Hilangkan buah di bawah layar
-        if fruit["y"] > height + 80:
+        if fruit.y > height + 80:
             try:
                 # missing this fruit -> reset current streak
-                globals()["current_streak"] = 0
+                for player in active_players:
+                    player.current_streak = 0
             except Exception:
                 pass
-            if fruit in fruits:
-                fruits.remove(fruit)
+            fruit.dead = True
 
     # Update dan gambar koin (rare coins)
-    for coin in coins[:]:
-        coin["x"] += coin.get("vx", 0)
-        coin["y"] += coin.get("vy", 0)
-        coin["vy"] += 1  # gravity
-
+    for coin in coins:
+        for _ in range(sim_steps):
+            coin.step(1)  # gravity
+    coin_pos = [c.draw_pos(sim_alpha) for c in coins]
+    coin_slicers = slicers(active_players, finger_segs,
+                           [(x + (c.img.get_width() // 2 if c.img else 16),
+                             y + (c.img.get_height() // 2 if c.img else 16)) for c, (x, y) in zip(coins, coin_pos)], 36)
+    for coin, (dx_c, dy_c), slicer in zip(coins, coin_pos, coin_slicers):
         # draw coin
-        if coin.get("img"):
+        if coin.img:
             try:
-                screen.blit(coin["img"], (coin["x"], coin["y"]))
+                world.blit(render_scaler.image(coin.img), render_scaler.pos(dx_c, dy_c))
             except Exception:
-                pygame.draw.circle(screen, (255, 215, 0), (int(coin["x"] + 16), int(coin["y"] + 16)), 14)
+                pygame.draw.circle(world, (255, 215, 0), render_scaler.pos(dx_c + 16, dy_c + 16), render_scaler.length(14))
         else:
-            pygame.draw.circle(screen, (255, 215, 0), (int(coin["x"] + 16), int(coin["y"] + 16)), 14)
+            pygame.draw.circle(world, (255, 215, 0), render_scaler.pos(dx_c + 16, dy_c + 16), render_scaler.length(14))
 
         # detect slice
-        if finger_x and finger_y:
-            cx = coin["x"] + (coin.get("img").get_width() // 2 if coin.get("img") else 16)
-            cy = coin["y"] + (coin.get("img").get_height() // 2 if coin.get("img") else 16)
-            d = math.hypot(cx - finger_x, cy - finger_y)
-            if d < 36:
-                # play split or coin-specific sound
-                try:
-                    if split_sound and sfx_on:
-                        split_sound.play()
-                except Exception:
-                    pass
+        cx = dx_c + (coin.img.get_width() // 2 if coin.img else 16)
+        cy = dy_c + (coin.img.get_height() // 2 if coin.img else 16)
+        if slicer is not None:
+            # play split or coin-specific sound
+            try:
+                if split_sound and sfx_on:
+                    split_sound.play()
+            except Exception:
+                pass
 
-                # sample a representative color from the coin image
-                try:
-                    img_surf = coin.get("img")
-                    if img_surf:
-                        iw, ih = img_surf.get_width(), img_surf.get_height()
-                        sx = max(0, iw // 2 - 2)
-                        sy = max(0, ih // 2 - 2)
-                        sw = min(4, iw - sx)
-                        sh = min(4, ih - sy)
-                        try:
-                            patch = img_surf.subsurface((sx, sy, sw, sh)).copy()
-                            arr = pygame.surfarray.array3d(patch)
-                            avg = arr.mean(axis=(0, 1)).astype(int)
-                            cc = (int(avg[0]), int(avg[1]), int(avg[2]))
-                        except Exception:
-                            r, g, b, a = img_surf.get_at((min(iw - 1, iw // 2), min(ih - 1, ih // 2)))
-                            cc = (r, g, b)
-                    else:
-                        cc = (255, 215, 0)
-                except Exception:
+            # sample a representative color from the coin image
+            try:
+                img_surf = coin.img
+                if img_surf:
+                    iw, ih = img_surf.get_width(), img_surf.get_height()
+                    sx = max(0, iw // 2 - 2)
+                    sy = max(0, ih // 2 - 2)
+                    sw = min(4, iw - sx)
+                    sh = min(4, ih - sy)
+                    try:
+                        patch = img_surf.subsurface((sx, sy, sw, sh)).copy()
+                        arr = pygame.surfarray.array3d(patch)
+                        avg = arr.mean(axis=(0, 1)).astype(int)
+                        cc = (int(avg[0]), int(avg[1]), int(avg[2]))
+                    except Exception:
+                        r, g, b, a = img_surf.get_at((min(iw - 1, iw // 2), min(ih - 1, ih // 2)))
+                        cc = (r, g, b)
+                else:
                     cc = (255, 215, 0)
+            except Exception:
+                cc = (255, 215, 0)
+
+            # spawn several particles that travel toward the coin UI (top-right)
+            target_x = width - 48 - 12
+            target_y = 12 + 12
+            ui_x, ui_y, ui_vx, ui_vy, ui_life, ui_size = [], [], [], [], [], []
+            for _ in range(effect_quality.count(14)):
+                # start near the coin center
+                px = cx + random.uniform(-6, 6)
+                py = cy + random.uniform(-6, 6)
+                # compute direction toward UI target
+                dx = target_x - px
+                dy = target_y - py
+                dist = max(1.0, math.hypot(dx, dy))
+                # initial velocity toward target plus some jitter
+                speed = random.uniform(4.0, 9.0)
+                pvx = (dx / dist) * speed + random.uniform(-1.5, 1.5)
+                pvy = (dy / dist) * speed + random.uniform(-1.5, 1.5)
+                life = random.randint(28, 48)
+                size = random.randint(2, 6)
+                ui_x.append(px)
+                ui_y.append(py)
+                ui_vx.append(pvx)
+                ui_vy.append(pvy)
+                ui_life.append(life)
+                ui_size.append(size)
+            # visual-only: these particles head to UI; coin count already incremented
+            particles.emit(ui_x, ui_y, ui_vx, ui_vy, ui_life, ui_size, cc, to_ui=True)
+
+            # play coin pickup sound if available
+            try:
+                if getkoin_sound and sfx_on:
+                    getkoin_sound.play()
+            except Exception:
+                pass
 
-                # spawn several particles that travel toward the coin UI (top-right)
-                target_x = width - 48 - 12
-                target_y = 12 + 12
-                for _ in range(14):
-                    # start near the coin center
-                    px = cx + random.uniform(-6, 6)
-                    py = cy + random.uniform(-6, 6)
-                    # compute direction toward UI target
-                    dx = target_x - px
-                    dy = target_y - py
-                    dist = max(1.0, math.hypot(dx, dy))
-                    # initial velocity toward target plus some jitter
-                    speed = random.uniform(4.0, 9.0)
-                    pvx = (dx / dist) * speed + random.uniform(-1.5, 1.5)
-                    pvy = (dy / dist) * speed + random.uniform(-1.5, 1.5)
-                    life = random.randint(28, 48)
-                    size = random.randint(2, 6)
-                    particles.append({
-                        "x": px,
-                        "y": py,
-                        "vx": pvx,
-                        "vy": pvy,
-                        "color": cc,
-                        "life": life,
-                        "max_life": life,
-                        "size": size,
-                        "age": 0,
-                        # visual-only: these particles head to UI; coin count already incremented
-                        "to_ui": True,
-                    })
-
-                # play coin pickup sound if available
+            # increment coin counter and give a score bonus that respects the
+            # current multiplier. Coins double the base slice value.
+            try:
+                coin_count += 1
+                # persist immediately so closing the game keeps progress
                 try:
-                    if getkoin_sound and sfx_on:
-                        getkoin_sound.play()
+                    save_coin_count()
                 except Exception:
                     pass
-
-                # increment coin counter and give a score bonus that respects the
-                # current multiplier. Coins double the base slice value.
-                try:
-                    coin_count += 1
-                    # persist immediately so closing the game keeps progress
-                    try:
-                        save_coin_count()
-                    except Exception:
-                        pass
-                except Exception:
-                    coin_count = coin_count if 'coin_count' in globals() else 0
-                    coin_count += 1
-                    try:
-                        save_coin_count()
-                    except Exception:
-                        pass
+            except Exception:
+                coin_count = coin_count if 'coin_count' in globals() else 0
+                coin_count += 1
                 try:
-                    # base slice point is 1; coin gives 2x that, and multiplier applies
-                    coin_score = int(1 * 2 * max(1, multiplier))
-                    score += coin_score
+                    save_coin_count()
                 except Exception:
                     pass
+            try:
+                # base slice point is 1; coin gives 2x that, and multiplier applies
+                coin_score = int(1 * 2 * max(1, slicer.multiplier))
+                slicer.score += coin_score
+            except Exception:
+                pass
 
-                # update events/streaks for coin slice as well
-                try:
-                    today = time.strftime("%Y-%m-%d")
-                    ev = globals().get("events", {}) or {}
-                    if ev.get("last_date") != today:
-                        ev["last_date"] = today
-                        ev["slices_today"] = 0
-                        ev["rewarded_100"] = False
-                    ev["slices_today"] = ev.get("slices_today", 0) + 1
-                    globals()["events"] = ev
-                    if ev.get("slices_today", 0) >= 100 and not ev.get("rewarded_100", False):
-                        try:
-                            globals()["coin_count"] = globals().get("coin_count", 0) + 10
-                            ev["rewarded_100"] = True
-                            shop_msg = {"text": "Daily reward: +10 coins!", "age": 0, "life": 120}
-                        except Exception:
-                            pass
-                    globals()["current_streak"] = globals().get("current_streak", 0) + 1
-                    if globals().get("current_streak", 0) > globals().get("best_streak", 0):
-                        globals()["best_streak"] = globals().get("current_streak", 0)
-                    # small achievement rewards
-                    try:
-                        ach = globals().get("achievements", set())
-                        if globals().get("current_streak", 0) >= 25 and "streak25" not in ach:
-                            ach.add("streak25")
-                            shop_msg = {"text": "Achievement: 25 streak!", "age": 0, "life": 120}
-                        globals()["achievements"] = ach
-                    except Exception:
-                        pass
+            # update events/streaks for coin slice as well
+            try:
+                today = time.strftime("%Y-%m-%d")
+                ev = globals().get("events", {}) or {}
+                if ev.get("last_date") != today:
+                    ev["last_date"] = today
+                    ev["slices_today"] = 0
+                    ev["rewarded_100"] = False
+                ev["slices_today"] = ev.get("slices_today", 0) + 1
+                globals()["events"] = ev
+                if ev.get("slices_today", 0) >= 100 and not ev.get("rewarded_100", False):
                     try:
-                        save_coin_count()
+                        globals()["coin_count"] = globals().get("coin_count", 0) + 10
+                        ev["rewarded_100"] = True
+                        shop_msg = {"text": "Daily reward: +10 coins!", "age": 0, "life": 120}
                     except Exception:
                         pass
+                slicer.current_streak += 1
+                if slicer.current_streak > globals().get("best_streak", 0):
+                    globals()["best_streak"] = slicer.current_streak
+                # small achievement rewards
+                try:
+                    ach = globals().get("achievements", set())
+                    if slicer.current_streak >= 25 and "streak25" not in ach:
+                        ach.add("streak25")
+                        shop_msg = {"text": "Achievement: 25 streak!", "age": 0, "life": 120}
+                    globals()["achievements"] = ach
                 except Exception:
                     pass
-
-                # optional visual popup near UI (small transient)
                 try:
-                    combo_popups.append({
-                        "text": f"+COIN",
-                        "x": target_x,
-                        "y": target_y + 12,
-                        "age": 0,
-                        "life": 30,
-                    })
+                    save_coin_count()
                 except Exception:
                     pass
+            except Exception:
+                pass
+
+            # optional visual popup near UI (small transient)
+            try:
+                combo_popups.append({
+                    "text": f"+COIN",
+                    "x": target_x,
+                    "y": target_y + 12,
+                    "age": 0,
+                    "life": 30,
+                })
+            except Exception:
+                pass
 
-                # remove coin safely
-                if coin in coins:
-                    coins.remove(coin)
+            # remove coin (swept after the update loops)
+            coin.dead = True
 
         # remove coin if it falls below the screen
-        if coin["y"] > height + 120:
-            if coin in coins:
-                coins.remove(coin)
+        if coin.y > height + 120:
+            coin.dead = True
 
     # Update dan gambar obstacles (anomali)
-    for obs in obstacles[:]:
-        obs["x"] += obs["vx"]
-        obs["y"] += obs["vy"]
-        obs["vy"] += 1  # gravity
-
+    for obs in obstacles:
+        for _ in range(sim_steps):
+            obs.step(1)  # gravity
+    obstacle_pos = [o.draw_pos(sim_alpha) for o in obstacles]
+    obstacle_slicers = slicers(active_players, finger_segs,
+                               [(x + (o.img.get_width() // 2 if o.img else 16),
+                                 y + (o.img.get_height() // 2 if o.img else 16))
+                                for o, (x, y) in zip(obstacles, obstacle_pos)], 36)
+    for obs, (dx_o, dy_o), slicer in zip(obstacles, obstacle_pos, obstacle_slicers):
         # draw obstacle (use image if available)
-        if obs.get("img"):
+        if obs.img:
             try:
-                screen.blit(obs["img"], (obs["x"], obs["y"]))
+                world.blit(render_scaler.image(obs.img), render_scaler.pos(dx_o, dy_o))
             except Exception:
                 # fallback to simple circle
-                pygame.draw.circle(screen, (220, 80, 80), (int(obs["x"] + 16), int(obs["y"] + 16)), 18)
+                pygame.draw.circle(world, (220, 80, 80), render_scaler.pos(dx_o + 16, dy_o + 16), render_scaler.length(18))
         else:
-            pygame.draw.circle(screen, (220, 80, 80), (int(obs["x"] + 16), int(obs["y"] + 16)), 18)
+            pygame.draw.circle(world, (220, 80, 80), render_scaler.pos(dx_o + 16, dy_o + 16), render_scaler.length(18))
 
         # detect slice by finger
-        if finger_x and finger_y:
-            ox_c = obs["x"] + (obs.get("img").get_width() // 2 if obs.get("img") else 16)
-            oy_c = obs["y"] + (obs.get("img").get_height() // 2 if obs.get("img") else 16)
-            d = math.hypot(ox_c - finger_x, oy_c - finger_y)
-            if d < 36:
-                # sample color from obstacle image if possible
-                try:
-                    img_surf = obs.get("img")
-                    if img_surf:
-                        iw, ih = img_surf.get_width(), img_surf.get_height()
-                        sx = max(0, iw // 2 - 3)
-                        sy = max(0, ih // 2 - 3)
-                        sw = min(6, iw - sx)
-                        sh = min(6, ih - sy)
-                        try:
-                            patch = img_surf.subsurface((sx, sy, sw, sh)).copy()
-                            arr = pygame.surfarray.array3d(patch)
-                            avg = arr.mean(axis=(0, 1)).astype(int)
-                            oc = (int(avg[0]), int(avg[1]), int(avg[2]))
-                        except Exception:
-                            r, g, b, a = img_surf.get_at((min(iw-1, iw//2), min(ih-1, ih//2)))
-                            oc = (r, g, b)
-                    else:
-                        oc = (255, 200, 60)
-                except Exception:
+        ox_c = dx_o + (obs.img.get_width() // 2 if obs.img else 16)
+        oy_c = dy_o + (obs.img.get_height() // 2 if obs.img else 16)
+        if slicer is not None:
+            # sample color from obstacle image if possible
+            try:
+                img_surf = obs.img
+                if img_surf:
+                    iw, ih = img_surf.get_width(), img_surf.get_height()
+                    sx = max(0, iw // 2 - 3)
+                    sy = max(0, ih // 2 - 3)
+                    sw = min(6, iw - sx)
+                    sh = min(6, ih - sy)
+                    try:
+                        patch = img_surf.subsurface((sx, sy, sw, sh)).copy()
+                        arr = pygame.surfarray.array3d(patch)
+                        avg = arr.mean(axis=(0, 1)).astype(int)
+                        oc = (int(avg[0]), int(avg[1]), int(avg[2]))
+                    except Exception:
+                        r, g, b, a = img_surf.get_at((min(iw-1, iw//2), min(ih-1, ih//2)))
+                        oc = (r, g, b)
+                else:
                     oc = (255, 200, 60)
+            except Exception:
+                oc = (255, 200, 60)
+
+
+            # spawn local explosion particles that scatter (non-sticky)
+            local_life = 60  # local particles live ~2s
+            ex, ey, evx, evy, elife, esize = [], [], [], [], [], []
+            for _ in range(effect_quality.count(80)):
+                ang = random.uniform(0, math.pi * 2)
+                spd = random.uniform(3.0, 14.0)
+                evx.append(math.cos(ang) * spd)
+                evy.append(math.sin(ang) * spd - random.uniform(0.5, 4.0))
+                elife.append(random.randint(int(local_life * 0.7), int(local_life * 1.2)))
+                esize.append(random.randint(2, 8))
+                ex.append(ox_c + random.uniform(-8, 8))
+                ey.append(oy_c + random.uniform(-8, 8))
+            particles.emit(ex, ey, evx, evy, elife, esize, oc)
+
+            # spawn a single precomputed full-screen splatter overlay (3 seconds)
+            try:
+                spl_life = 90  # 3 seconds at 30fps
+                blobs = []
+                # choose number of blobs proportional to screen area but cap for perf (and quality),
+                # then keep the preset's share of them
+                blob_count = min(220, max(80, int((width * height) / 12000)))
+                blob_count = max(1, int(blob_count * effect_quality.settings["splatter_share"]))
+                for _b in range(blob_count):
+                    bx = random.uniform(0, width)
+                    by = random.uniform(0, height)
+                    br = random.randint(6, 48)
+                    balpha = random.randint(40, 200)
+                    blobs.append((bx, by, br, balpha))
+                screen_splatters.add(oc, blobs, spl_life)
+            except Exception:
+                pass
 
+            # flash
+            explosion_flash_timer = 12
 
-                # spawn local explosion particles that scatter (non-sticky)
-                local_life = 60  # local particles live ~2s
-                for _ in range(80):
-                    ang = random.uniform(0, math.pi * 2)
-                    spd = random.uniform(3.0, 14.0)
-                    pvx = math.cos(ang) * spd
-                    pvy = math.sin(ang) * spd - random.uniform(0.5, 4.0)
-                    life = random.randint(int(local_life * 0.7), int(local_life * 1.2))
-                    size = random.randint(2, 8)
-                    px = ox_c + random.uniform(-8, 8)
-                    py = oy_c + random.uniform(-8, 8)
-                    particles.append({
-                        "x": px,
-                        "y": py,
-                        "vx": pvx,
-                        "vy": pvy,
-                        "color": oc,
-                        "life": life,
-                        "max_life": life,
-                        "size": size,
-                        "age": 0,
-                    })
-
-                # spawn a single precomputed full-screen splatter overlay (3 seconds)
-                try:
-                    spl_life = 90  # 3 seconds at 30fps
-                    blobs = []
-                    # choose number of blobs proportional to screen area but cap for perf
-                    blob_count = min(220, max(80, int((width * height) / 12000)))
-                    for _b in range(blob_count):
-                        bx = random.uniform(0, width)
-                        by = random.uniform(0, height)
-                        br = random.randint(6, 48)
-                        balpha = random.randint(40, 200)
-                        blobs.append((bx, by, br, balpha))
-                    screen_splatters.append({"age": 0, "life": spl_life, "color": oc, "blobs": blobs})
-                except Exception:
-                    pass
-
-                # add shockwave and flash
-                shockwaves.append({"x": ox_c, "y": oy_c, "age": 0, "life": 30, "max_r": 240})
-                explosion_flash_timer = 12
-
-                # camera shake to emphasize the explosion
-                camera_shake_timer = 45
-                camera_shake_intensity = 14
+            # camera shake to emphasize the explosion
+            camera_shake_timer = 45
+            camera_shake_intensity = 14
 
-                # if player's score is low, hitting a boom causes immediate game over
-                try:
-                    if globals().get("score", 0) < 10:
-                        try:
-                            # prefer an explicit gameover sound if present
-                            if gameover_sound and sfx_on:
+            # if player's score is low, hitting a boom causes immediate game over
+            try:
+                if slicer.score < 10:
+                    try:
+                        # prefer an explicit gameover sound if present
+                        if gameover_sound and sfx_on:
+                            try:
+                                gameover_sound.set_volume(0.9)
+                            except Exception:
+                                pass
+                            try:
+                                gameover_sound.play()
+                            except Exception:
+                                pass
+                        else:
+                            # fallback to boom/explosion audio if no dedicated gameover sound
+                            if boom_explosion_sound and sfx_on:
                                 try:
-                                    gameover_sound.set_volume(0.9)
+                                    boom_explosion_sound.play()
                                 except Exception:
                                     pass
+                            elif boom_sound and sfx_on:
                                 try:
-                                    gameover_sound.play()
+                                    boom_sound.play()
                                 except Exception:
                                     pass
-                            else:
-                                # fallback to boom/explosion audio if no dedicated gameover sound
-                                if boom_explosion_sound and sfx_on:
-                                    try:
-                                        boom_explosion_sound.play()
-                                    except Exception:
-                                        pass
-                                elif boom_sound and sfx_on:
-                                    try:
-                                        boom_sound.play()
-                                    except Exception:
-                                        pass
-                            # set fixed 5 second animation duration (user requested)
-                            game_over_duration = 5.0
-                        except Exception:
-                            pass
-
-                        # trigger game-over visual state synchronized to the sound
-                        game_over_start_time = time.time()
-                        game_over_active = True
-                        game_state = "gameover"
-                    else:
-                        # normal explosion sound and penalty when score is sufficient
-                        try:
-                            if boom_explosion_sound and sfx_on:
-                                boom_explosion_sound.play()
-                            elif boom_sound and sfx_on:
-                                boom_sound.play()
-                        except Exception:
-                            pass
-
-                        # deduct score penalty for slicing a boom
-                        try:
-                            score -= 10
-                        except Exception:
-                            # should not happen, but ignore if score not writable in scope
-                            pass
-                except Exception:
-                    pass
-
-                # remove obstacle safely
-                if obs in obstacles:
-                    obstacles.remove(obs)
+                        # set fixed 5 second animation duration (user requested)
+                        game_over_duration = 5.0
+                    except Exception:
+                        pass
 
-        # remove obstacle if off-screen
-        if obs["y"] > height + 120:
-            if obs in obstacles:
-                obstacles.remove(obs)
+                    # trigger game-over visual state synchronized to the sound
+                    game_over_start_time = sim_clock.time
+                    game_over_active = True
+                    game_state = "gameover"
+                else:
+                    # normal explosion sound and penalty when score is sufficient
+                    try:
+                        if boom_explosion_sound and sfx_on:
+                            boom_explosion_sound.play()
+                        elif boom_sound and sfx_on:
+                            boom_sound.play()
+                    except Exception:
+                        pass
 
-    # Update dan gambar potongan buah (halves)
-    for half in halves[:]:
-        # age for smoothing and lifecycle
-        half["age"] = half.get("age", 0) + 1
-
-        # velocity smoothing for initial frames (lerp towards target_vx/target_vy)
-        sf = half.get("vel_smooth_frames", 0)
-        if sf and half.get("age", 0) <= sf:
-            t = float(half.get("age", 0)) / float(sf)
-            try:
-                vx_t = half.get("target_vx", half.get("vx", 0))
-                vy_t = half.get("target_vy", half.get("vy", 0))
-                vx_init = half.get("vx", 0)
-                vy_init = half.get("vy", 0)
-                half["vx"] = vx_init * (1.0 - t) + vx_t * t
-                half["vy"] = vy_init * (1.0 - t) + vy_t * t
+                    # deduct score penalty for slicing a boom
+                    try:
+                        slicer.score -= 10
+                    except Exception:
+                        pass
             except Exception:
                 pass
 
-        half["x"] += half["vx"]
-        half["y"] += half["vy"]
-        # lighter gravity for sliced halves
-        half["vy"] += 0.8
-
-        # rotation and lifetime updates
-        half["angle"] += half.get("avel", 0)
-        half["life"] = half.get("life", 0) - 1
+            # remove obstacle (swept after the update loops)
+            obs.dead = True
 
-        # alpha menurun seiring life tersisa
-        if half.get("max_life"):
-            alpha = int(255 * (half["life"] / half["max_life"]))
-        else:
-            alpha = int(255 * (half["life"] / 45))
-        half["alpha"] = max(0, min(255, alpha))
-
-        # gambar rotated dengan alpha
-        rotated = pygame.transform.rotate(half["img"], half["angle"])
-        rotated.set_alpha(half["alpha"])  # set overall transparency
+        # remove obstacle if off-screen
+        if obs.y > height + 120:
+            obs.dead = True
 
-        # pusat gambar (treat half['x'],half['y'] as top-left of original half image)
-        img_w, img_h = half["img"].get_width(), half["img"].get_height()
-        center_x = half["x"] + img_w / 2
-        center_y = half["y"] + img_h / 2
-        rect = rotated.get_rect(center=(center_x, center_y))
-        screen.blit(rotated, rect.topleft)
+    # Update dan gambar potongan buah (halves)
+    for half in halves:
+        for _ in range(sim_steps):
+            half.step()
+
+        # gambar rotated dengan alpha (rotasi diambil dari cache per sudut terkuantisasi)
+        # (render-scale mode rotates the already downscaled half)
+        hx, hy, h_angle = half.draw_pos(sim_alpha)
+        rotated = rotation_cache.rotate(render_scaler.image(half.img), h_angle)
+        rotated.set_alpha(half.alpha)  # set overall transparency
+
+        # pusat gambar (treat half.x, half.y as top-left of original half image)
+        img_w, img_h = half.img.get_width(), half.img.get_height()
+        center_x = hx + img_w / 2
+        center_y = hy + img_h / 2
+        rect = rotated.get_rect(center=render_scaler.pos(center_x, center_y))
+        world.blit(rotated, rect.topleft)
 
         # hapus saat life habis atau sudah jauh ke bawah
-        if half["life"] <= 0 or half["alpha"] <= 0 or half["y"] > height + 120:
-            if half in halves:
-                halves.remove(half)
+        if half.life <= 0 or half.alpha <= 0 or half.y > height + 120:
+            half.dead = True
+
+    # drop everything flagged dead above: one compaction per list, no list.remove
+    sweep(fruits, coins, obstacles, halves)
 
     # Update and draw splashes (streak particles) onto a single alpha surface
     if splashes:
-        splash_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        for s in splashes[:]:
-            try:
-                # physics
-                s["x"] += s["vx"]
-                s["y"] += s["vy"]
-                s["vy"] += 0.3
-                s["age"] += 1
-
-                # append to trail (newest first)
-                s["trail"].insert(0, (s["x"], s["y"]))
-                if len(s["trail"]) > 12:
-                    s["trail"].pop()
-
-                ratio = max(0.0, s["life"] / float(s.get("max_life", 1)))
-
-                # draw tapered segments along the trail with slight curvature (perpendicular wobble)
-                for j in range(len(s["trail"]) - 1):
-                    (x1f, y1f) = s["trail"][j]
-                    (x2f, y2f) = s["trail"][j + 1]
-
-                    # perpendicular wobble based on seed+age+j to make the flow organic
-                    dx = x2f - x1f
-                    dy = y2f - y1f
-                    seg_len = math.hypot(dx, dy) + 1e-6
-                    px = -dy / seg_len
-                    py = dx / seg_len
-                    wobble = math.sin((s["age"] * 0.25) + s.get("seed", 0) + j) * (3.0 * (1 - j / len(s["trail"])))
-                    ox1 = x1f + px * wobble
-                    oy1 = y1f + py * wobble
-                    ox2 = x2f + px * wobble
-                    oy2 = y2f + py * wobble
-
-                    # alpha tapers along the trail
-                    t = 1.0 - (j / float(max(1, len(s["trail"]) - 1)))
-                    alpha = int(255 * ratio * t)
-                    col = (s["color"][0], s["color"][1], s["color"][2], alpha)
-                    thickness = max(1, int(6 * t * ratio))
-                    pygame.draw.line(splash_surf, col, (int(ox1), int(oy1)), (int(ox2), int(oy2)), thickness)
-
-                s["life"] -= 1
-                if s["life"] <= 0:
-                    splashes.remove(s)
-            except Exception:
-                try:
-                    splashes.remove(s)
-                except Exception:
-                    pass
+        splash_surf = overlay_pool.get()
+        try:
+            for _ in range(sim_steps):
+                splashes.update()
+            splashes.draw(splash_surf, render_scaler.scale, effect_quality.settings["splash_trail"])
+        except Exception:
+            splashes.clear()
         # blit all splashes once
-        screen.blit(splash_surf, (0, 0))
+        world.blit(splash_surf, (0, 0))
 
-    # Update and draw small particles (spark / fruit bits)
+    # Update and draw small particles (spark / fruit bits, coin bits homing to the UI)
     if particles:
         try:
-            for p in particles[:]:
-                # particle movement
-                if p.get("to_ui"):
-                    # particles heading to UI: home toward top-right coin icon
-                    target_x = width - 48 - 12
-                    target_y = 12 + 12
-                    dx = target_x - p["x"]
-                    dy = target_y - p["y"]
-                    dist = max(1.0, math.hypot(dx, dy))
-                    # desired speed slows as it approaches
-                    desired_speed = max(2.0, dist * 0.08)
-                    dir_x = dx / dist
-                    dir_y = dy / dist
-                    # gentle steering toward target
-                    p["vx"] = p.get("vx", 0) * 0.86 + dir_x * desired_speed * 0.14
-                    p["vy"] = p.get("vy", 0) * 0.86 + dir_y * desired_speed * 0.14
-                    p["x"] += p.get("vx", 0)
-                    p["y"] += p.get("vy", 0)
-                    p["age"] = p.get("age", 0) + 1
-                    # remove quickly if reached UI
-                    if math.hypot(target_x - p["x"], target_y - p["y"]) < 12:
-                        try:
-                            particles.remove(p)
-                        except Exception:
-                            pass
-                        continue
-                else:
-                    # normal physics (particles scatter)
-                    p["x"] += p.get("vx", 0)
-                    p["y"] += p.get("vy", 0)
-                    # small gravity for bits
-                    p["vy"] = p.get("vy", 0) + 0.18
-                    p["age"] = p.get("age", 0) + 1
-
-                # fade out based on life
-                ratio = max(0.0, p.get("life", 1) / float(max(1, p.get("max_life", 1))))
-                alpha = int(255 * ratio)
-
-                # draw a small circle with alpha onto a temp surface
-                sz = max(1, int(p.get("size", 3)))
-                surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-                col = p.get("color", (255, 255, 255))
-                try:
-                    pygame.draw.circle(surf, (col[0], col[1], col[2], alpha), (sz, sz), sz)
-                    screen.blit(surf, (int(p["x"] - sz), int(p["y"] - sz)))
-                except Exception:
-                    pass
-
-                p["life"] = p.get("life", 0) - 1
-                # normal particles removed when life ends or off-screen
-                if p["life"] <= 0 or p["y"] > height + 240 or p["x"] < -60 or p["x"] > width + 60:
-                    try:
-                        particles.remove(p)
-                    except Exception:
-                        pass
+            for _ in range(sim_steps):
+                particles.update(width, height)
+            particles.draw(world, render_scaler.scale)
         except Exception:
             # defensive: clear if something unexpected happens
-            try:
-                particles.clear()
-            except Exception:
-                pass
+            particles.clear()
 
     # Draw per-slice visual effects (fading cut lines)
     if slice_effects:
-        for ef in slice_effects[:]:
+        for ef in slice_effects:
             try:
-                ef["life"] -= 1
+                ef["life"] -= sim_steps
                 ratio = max(0.0, ef.get("life", 0) / float(max(1, ef.get("max_life", 1))))
                 alpha = int(220 * ratio)
-                length = ef.get("length", 120)
-                thickness = max(2, int(10 * ratio + 2))
+                length = render_scaler.length(ef.get("length", 120))
+                thickness = render_scaler.length(max(2, int(10 * ratio + 2)))
                 # build a small surface for the cut line
                 surf = pygame.Surface((length, thickness * 3), pygame.SRCALPHA)
                 # draw several layered lines for glow
@@ -2135,61 +2166,50 @@ while running:
                 # rotate and blit centered at effect position
                 try:
                     rotated = pygame.transform.rotate(surf, -ef.get("angle", 0))
-                    rect = rotated.get_rect(center=(int(ef.get("x", 0)), int(ef.get("y", 0))))
-                    screen.blit(rotated, rect.topleft)
+                    rect = rotated.get_rect(center=render_scaler.pos(int(ef.get("x", 0)), int(ef.get("y", 0))))
+                    world.blit(rotated, rect.topleft)
                 except Exception:
                     pass
 
-                if ef.get("life", 0) <= 0:
-                    try:
-                        slice_effects.remove(ef)
-                    except Exception:
-                        pass
             except Exception:
-                try:
-                    slice_effects.remove(ef)
-                except Exception:
-                    pass
+                ef["life"] = 0  # broken effect: dropped by the sweep below
+        slice_effects[:] = [ef for ef in slice_effects if ef.get("life", 0) > 0]
 
-    # Draw any full-screen splatter overlays (fade over their life)
+    # Draw any full-screen splatter overlays (fade over their life, one blit for all)
     if screen_splatters:
-        for spl in screen_splatters[:]:
-            try:
-                age = spl.get("age", 0)
-                life = float(max(1, spl.get("life", 1)))
-                t = age / life
-                alpha_mul = max(0.0, 1.0 - t)
-
-                overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-                base_col = spl.get("color", (255, 200, 60))
-
-                # draw precomputed blobs with alpha scaled by remaining life
-                for (bx, by, br, balpha) in spl.get("blobs", []):
-                    a = int(balpha * alpha_mul)
-                    try:
-                        pygame.draw.circle(overlay, (base_col[0], base_col[1], base_col[2], a), (int(bx), int(by)), int(br))
-                    except Exception:
-                        pass
-
-                screen.blit(overlay, (0, 0))
-
-                spl["age"] = age + 1
-                if spl["age"] >= spl.get("life", 1):
-                    try:
-                        screen_splatters.remove(spl)
-                    except Exception:
-                        pass
-            except Exception:
-                try:
-                    screen_splatters.remove(spl)
-                except Exception:
-                    pass
-
-    # Lightning overlay ketika lightning_timer > 0
-    if lightning_timer > 0 and len(finger_trail) > 1:
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        try:
+            screen_splatters.draw(world, sim_steps)
+        except Exception:
+            screen_splatters.clear()
+
+    # Lightning overlay ketika lightning_timer > 0 (per pemain). Both players
+    # share one overlay, and only the area around the trails (jitter + line
+    # width) is cleared and blitted instead of the whole screen.
+    lightning_players = []
+    for player in active_players:
+        if player.lightning_timer <= 0:
+            continue
+        player.lightning_timer -= sim_steps
+        if len(player.trail) >= 2:
+            lightning_players.append(player)
+    lightning_overlay = None
+    if lightning_players:
+        lightning_overlay = overlay_pool.get(clear=False)  # only lightning_area is cleared below
+        pad = render_scaler.length(12)
+        lightning_area = None
+        for player in lightning_players:
+            pts = render_scaler.points(player.trail)
+            xs = [p[0] for p in pts]
+            ys = [p[1] for p in pts]
+            area = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1).inflate(pad * 2, pad * 2)
+            lightning_area = area if lightning_area is None else lightning_area.union(area)
+        lightning_area = lightning_area.clip(lightning_overlay.get_rect())
+        lightning_overlay.fill((0, 0, 0, 0), lightning_area)
+    for player in lightning_players:
+        finger_trail = player.trail
+        overlay = lightning_overlay
         # draw several jittered lines to simulate glow
-        for j in range(3):
+        for j in range(effect_quality.settings["lightning_layers"]):
             alpha = max(40, 200 - j * 70)
             col = (180, 220, 255, alpha)
             width_line = 6 - j * 2
@@ -2200,38 +2220,40 @@ while running:
                 jitter_y = py + random.uniform(-6 + j * 2, 6 - j * 2)
                 points.append((int(jitter_x), int(jitter_y)))
             if len(points) > 1:
-                pygame.draw.lines(overlay, col, False, points, max(1, width_line))
+                pygame.draw.lines(overlay, col, False, render_scaler.points(points), render_scaler.length(max(1, width_line)))
 
         # bright center line
         center_col = (245, 255, 255, 230)
-        pygame.draw.lines(overlay, center_col, False, finger_trail, 2)
-
-        screen.blit(overlay, (0, 0))
-        lightning_timer -= 1
+        pygame.draw.lines(overlay, center_col, False, render_scaler.points(finger_trail), render_scaler.length(2))
+    if lightning_overlay is not None:
+        world.blit(lightning_overlay, lightning_area.topleft, lightning_area)
 
     # Combo-triggered lightning (bigger flash) when combo_lightning_timer > 0
     if combo_lightning_timer > 0:
         try:
-            flash = pygame.Surface((width, height), pygame.SRCALPHA)
+            flash = overlay_pool.get(clear=False)  # fully overwritten by the fill below
             alpha = int(220 * (combo_lightning_timer / 14.0))
             flash.fill((255, 255, 255, alpha))
             # jittered streaks for dramatic effect
-            for i in range(6):
+            for i in range(effect_quality.settings["flash_streaks"]):
                 pts = []
                 x = random.randint(0, width // 4)
                 for sx in range(0, width, max(40, random.randint(30, 80))):
                     pts.append((sx + random.randint(-20, 20), random.randint(0, height)))
                 col = (200, 230, 255, max(20, alpha - i * 30))
-                pygame.draw.lines(flash, col, False, pts, max(1, 6 - i))
-            screen.blit(flash, (0, 0))
+                pygame.draw.lines(flash, col, False, render_scaler.points(pts), render_scaler.length(max(1, 6 - i)))
+            world.blit(flash, (0, 0))
         except Exception:
             pass
-        combo_lightning_timer -= 1
+        combo_lightning_timer -= sim_steps
+
+    # end of the world pass: upscale it once (render-scale mode), then the HUD drawn above
+    render_scaler.present(screen)
 
     # Draw combo popups (animated: pop -> float -> fade) with glow and shadow
     if combo_popups:
-        for p in combo_popups[:]:
-            p["age"] += 1
+        for p in combo_popups:
+            p["age"] += sim_steps
             life = float(p.get("life", 30))
             age = float(p["age"])
             t = age / life
@@ -2245,16 +2267,9 @@ while running:
                 # scale: pop at start then slowly shrink while floating
                 scale = 1.0 + 0.9 * max(0.0, (1.0 - t))
 
-                base_surf = combo_font.render(text, True, (255, 245, 120))
-                # shadow
-                shadow = combo_font.render(text, True, (10, 10, 10))
-
-                # apply scale via smoothscale
-                bw, bh = base_surf.get_size()
-                sw = max(1, int(bw * scale))
-                sh = max(1, int(bh * scale))
-                base_scaled = pygame.transform.smoothscale(base_surf, (sw, sh)).convert_alpha()
-                shadow_scaled = pygame.transform.smoothscale(shadow, (sw, sh)).convert_alpha()
+                # scaled text + shadow from the text cache (rendered / smoothscaled once per size)
+                base_scaled = text_cache.scaled(combo_font, text, (255, 245, 120), scale)
+                shadow_scaled = text_cache.scaled(combo_font, text, (10, 10, 10), scale)
 
                 # set alpha
                 base_scaled.set_alpha(alpha)
@@ -2266,9 +2281,10 @@ while running:
                 cy = int(p.get("y", height // 2)) + y_off
 
                 # draw soft glow by drawing slightly larger translucent layers
-                for glow_i, glow_alpha in ((1, int(alpha * 0.18)), (2, int(alpha * 0.12)), (3, int(alpha * 0.08))):
+                glow_layers = ((1, int(alpha * 0.18)), (2, int(alpha * 0.12)), (3, int(alpha * 0.08)))
+                for glow_i, glow_alpha in glow_layers[:effect_quality.settings["glow_layers"]]:
                     try:
-                        glow = pygame.transform.smoothscale(base_surf, (max(1, int(sw * (1.0 + glow_i * 0.08))), max(1, int(sh * (1.0 + glow_i * 0.08))))).convert_alpha()
+                        glow = text_cache.scaled(combo_font, text, (255, 245, 120), scale * (1.0 + glow_i * 0.08))
                         glow.set_alpha(glow_alpha)
                         gx = cx - glow.get_width() // 2
                         gy = cy - glow.get_height() // 2
@@ -2287,12 +2303,7 @@ while running:
                 screen.blit(base_scaled, (tx, ty))
             except Exception:
                 pass
-
-            if p["age"] >= p.get("life", 30):
-                try:
-                    combo_popups.remove(p)
-                except Exception:
-                    pass
+        combo_popups[:] = [p for p in combo_popups if p["age"] < p.get("life", 30)]
 
     # NOTE: Score and multiplier are drawn only while playing (rendered earlier in the playing branch)
 
@@ -2307,7 +2318,7 @@ while running:
             # blit coin image
             screen.blit(coin_img, (coin_x, coin_y))
             # render count left of coin; center vertically with the coin image
-            cnt_text = font.render(str(coin_count), True, (255, 255, 255))
+            cnt_text = text_cache.render(font, str(coin_count), (255, 255, 255))
             cnt_x = coin_x - 10 - cnt_text.get_width()
             cnt_y = coin_y + (ch - cnt_text.get_height()) // 2
             screen.blit(cnt_text, (cnt_x, cnt_y))
@@ -2316,7 +2327,7 @@ while running:
             coin_x = width - margin - 28
             coin_y = margin
             pygame.draw.circle(screen, (255, 215, 0), (coin_x + 14, coin_y + 14), 14)
-            cnt_text = font.render(str(coin_count), True, (255, 255, 255))
+            cnt_text = text_cache.render(font, str(coin_count), (255, 255, 255))
             cnt_x = coin_x - 10 - cnt_text.get_width()
             cnt_y = coin_y + (28 - cnt_text.get_height()) // 2
             screen.blit(cnt_text, (cnt_x, cnt_y))
@@ -2328,19 +2339,17 @@ while running:
         if game_over_active or game_state == "gameover":
             start = game_over_start_time
             dur = game_over_duration if game_over_duration and game_over_duration > 0 else 5.0
-            elapsed = max(0.0, time.time() - (start or time.time()))
+            elapsed = max(0.0, sim_clock.time - (start or sim_clock.time))
             t = min(max(elapsed / float(max(1e-6, dur)), 0.0), 1.0)
 
             # draw a red overlay that fades out over the duration (no pulsing)
             alpha = int(220 * (1.0 - t))
-            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-            overlay.fill((180, 20, 20, max(32, alpha)))
-            screen.blit(overlay, (0, 0))
+            screen.blit(screen_pool.solid((180, 20, 20, max(32, alpha))), (0, 0))
 
             # GAME OVER text: apply a "jelly" (wobble/squash) text-only effect
             try:
-                go_text = combo_font.render("GAME OVER", True, (255, 255, 255))
-                sub = small_font.render("You hit a bomb!", True, (255, 230, 230))
+                go_text = text_cache.render(combo_font, "GAME OVER", (255, 255, 255))
+                sub = text_cache.render(small_font, "You hit a bomb!", (255, 230, 230))
 
                 # Jelly effect window: from 2.5s until the end of the game-over duration
                 jelly_start = 2.5
@@ -2349,7 +2358,7 @@ while running:
                     t_j = (elapsed - jelly_start) / float(max(1e-6, (dur - jelly_start)))
 
                     # time-based oscillation for organic wobble
-                    now_t = time.time()
+                    now_t = sim_clock.time
                     freq = 10.0 + 14.0 * (1.0 - t_j)  # faster wobble earlier
                     wob = math.sin(now_t * freq) * (1.0 - t_j)
 
@@ -2357,12 +2366,9 @@ while running:
                     scale_x = 1.0 + 0.14 * wob
                     scale_y = 1.0 - 0.14 * wob
 
-                    # prepare scaled surface
-                    bw, bh = go_text.get_size()
-                    sw = max(1, int(bw * scale_x))
-                    sh = max(1, int(bh * scale_y))
+                    # prepare scaled surface (cached per quantized squash)
                     try:
-                        scaled = pygame.transform.smoothscale(go_text, (sw, sh)).convert_alpha()
+                        scaled = text_cache.scaled(combo_font, "GAME OVER", (255, 255, 255), scale_x, scale_y)
                     except Exception:
                         scaled = go_text
 
@@ -2390,7 +2396,7 @@ while running:
                     screen.blit(sub, ((width - sub.get_width()) // 2, rect.bottom + 6))
             except Exception:
                 try:
-                    screen.blit(combo_font.render("GAME OVER", True, (255, 255, 255)), ((width - 300) // 2, height // 2 - 40))
+                    screen.blit(text_cache.render(combo_font, "GAME OVER", (255, 255, 255)), ((width - 300) // 2, height // 2 - 40))
                 except Exception:
                     pass
             # when the animation ends, return to menu and clear gameplay entities
@@ -2413,8 +2419,61 @@ while running:
                     pass
     except Exception:
         pass
+
+    if show_perf_hud:
+        trk = tracker.stats() if tracker is not None else {}
+        hud_lines = [
+            f"FPS {clock.get_fps():.1f}",
+            f"input[{input_source.name}] " + format_stats(input_source.stats()),
+        ]
+        if tracker is not None:
+            hud_lines.append(
+                f"track[{tracker.name}] infer {trk['infer_ms']:.1f}ms latency {trk['latency_ms']:.1f}ms done {trk['completed']} skip {trk['skipped']}"
+            )
+        if tracking_governor is not None:
+            gs = tracking_governor.settings
+            hud_lines.append(
+                f"governor L{tracking_governor.level} complexity {gs['model_complexity']} scale {gs['input_scale']} "
+                f"skip {gs['frame_skip']} avg {tracking_governor.ema_ms:.1f}/{tracking_governor.budget_ms:.1f}ms | "
+                f"{tracking_governor.last_decision}"
+            )
+        hud_lines.append(
+            f"finger conf {players[0].confidence:.2f} predict {players[0].estimator.prediction_age(input_source.clock()) * 1000:.0f}ms"
+            f"/{players[0].estimator.horizon * 1000:.0f}ms"
+        )
+        if "roi_frames" in trk:
+            hud_lines.append(
+                f"roi {trk['roi_frames']} ({trk['roi_ms']:.1f}ms) full {trk['full_frames']} ({trk['full_ms']:.1f}ms) "
+                f"miss {trk['roi_misses']} saved {trk['roi_saved_ms']:.1f}ms/frame"
+            )
+        hud_lines.append("rotation cache " + format_stats(rotation_cache.stats()))
+        hud_lines.append("split atlas " + format_stats(split_atlas.stats()))
+        hud_lines.append(f"particles {len(particles)}  splashes {len(splashes)}  sprites "
+                         + format_stats(particles.sprites.stats()))
+        hud_lines.append("splatters " + format_stats(screen_splatters.stats()))
+        hud_lines.append("text cache " + format_stats(text_cache.stats()))
+        hud_lines.append("overlays " + format_stats(overlay_pool.stats()))
+        hud_lines.append("effects " + format_stats(effect_quality.stats()) + " | " + effect_quality.last_decision)
+        hud_lines.append("sim " + format_stats(sim_clock.stats()))
+        if render_scaler.enabled:
+            hud_lines.append("render scale " + format_stats(render_scaler.stats()))
+        if game_state in ("menu", "settings", "shop"):
+            hud_lines.append("ui layer " + format_stats(ui_layer.stats()))
+        draw_perf_hud(hud_lines)
     pygame.display.flip()
-    clock.tick(30)
+
+    # per-frame work time (before the frame limiter sleeps), for comparing builds on the same replay
+    frame_index += 1
+    work_ms = (time.perf_counter() - frame_start) * 1000.0
+    frame_times.append(work_ms)
+    if frame_log:
+        frame_log.write(f"{frame_index},{work_ms:.3f}\n")
+    if effect_quality.observe(work_ms) is not None:
+        print("Effect quality:", effect_quality.last_decision)
+    if input_source.finished() or (max_frames > 0 and frame_index >= max_frames):
+        running = False
+
+    clock.tick(render_fps)
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -2436,7 +2495,23 @@ while running:
             except Exception:
                 pass
 
-cap.release()
+input_source.release()
+tracker_summary = None
+if tracker is not None:
+    tracker_summary = f"Tracking[{tracker.name}]: " + format_stats(tracker.stats())
+    tracker.close()
+if landmark_recorder is not None:
+    landmark_recorder.close()
+if frame_log:
+    frame_log.close()
+if frame_times and (frame_log_path or input_source.name != "webcam" or max_frames > 0):
+    ordered = sorted(frame_times)
+    print(f"Frames {len(ordered)}: mean {sum(ordered) / len(ordered):.2f} ms, "
+          f"p50 {ordered[len(ordered) // 2]:.2f} ms, p95 {ordered[int(len(ordered) * 0.95)]:.2f} ms, "
+          f"max {ordered[-1]:.2f} ms")
+    if tracker_summary:
+        # same replay with FRUIT_TRACKING_BACKEND=legacy/tasks compares the two backends
+        print(tracker_summary)
 try:
     # final save before exit
     try:
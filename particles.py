@@ -0,0 +1,338 @@
+"""Structure-of-arrays particle systems for sparks, fruit bits and juice streaks.
+
+Particles used to be a list of dicts: every frame touched each dict field by
+field, and dead particles were dropped with ``list.remove`` (O(n) each, so a
+big explosion cost O(n^2)). Here each field is one preallocated NumPy array
+and a frame is a handful of whole-array operations:
+
+- integration, gravity and the homing of coin particles toward the coin icon
+  are vectorized over all live particles
+- dead particles are dropped in bulk by compacting the live ones to the front
+  of the arrays (one boolean-mask copy per field), never one by one
+
+Arrays grow by doubling when an emit does not fit, so steady play never
+allocates. Emitters pass plain lists (or scalars) per field, so spawn code
+can keep drawing its random numbers in the same order as before.
+"""
+import numpy as np
+import pygame
+
+from render_cache import CircleSpriteCache
+
+# coin particles home toward the coin counter in the top-right corner
+UI_MARGIN = 48 + 12
+UI_Y = 12 + 12
+UI_REACHED = 12.0
+
+
+class ParticleSystem:
+    """Sparks / fruit bits, plus coin particles flying to the coin UI.
+
+    Per frame: `update()` moves everything, then `draw()` blits the live
+    particles with sprites shared through a `CircleSpriteCache`. A particle
+    is drawn with the life it had before the update's decrement, and
+    particles whose life ran out (or left the screen) are still drawn that
+    frame, like the old list loop did; they are compacted away at the start
+    of the next `update()`.
+    """
+
+    GRAVITY = 0.18
+    STEER = 0.14  # share of the desired velocity blended in per frame (homing)
+
+    def __init__(self, capacity=1024, sprites=None):
+        self.count = 0
+        self._expired = None  # mask of particles to drop at the next update
+        self.sprites = sprites if sprites is not None else CircleSpriteCache()
+        self._alloc(max(16, int(capacity)))
+
+    def _alloc(self, capacity):
+        old = self.count
+        fields = {}
+        for name, dtype, shape in (("x", np.float32, ()), ("y", np.float32, ()),
+                                   ("vx", np.float32, ()), ("vy", np.float32, ()),
+                                   ("life", np.int32, ()), ("max_life", np.int32, ()),
+                                   ("size", np.int32, ()), ("color", np.uint8, (3,)),
+                                   ("to_ui", np.bool_, ()), ("alpha", np.int32, ())):
+            arr = np.zeros((capacity,) + shape, dtype=dtype)
+            prev = getattr(self, name, None)
+            if prev is not None and old:
+                arr[:old] = prev[:old]
+            fields[name] = arr
+        self.__dict__.update(fields)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def emit(self, x, y, vx, vy, life, size, color, to_ui=False):
+        """Append particles; each argument is a sequence (one value per particle) or a scalar."""
+        n = max(np.size(x), np.size(y), np.size(vx), np.size(vy), np.size(life), np.size(size))
+        if n == 0:
+            return
+        self._compact()
+        if self.count + n > self.capacity:
+            cap = self.capacity
+            while cap < self.count + n:
+                cap *= 2
+            self._alloc(cap)
+        s = slice(self.count, self.count + n)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = vx
+        self.vy[s] = vy
+        self.life[s] = life
+        self.max_life[s] = life
+        self.size[s] = np.maximum(1, np.asarray(size, dtype=np.int32))
+        self.color[s] = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+        self.to_ui[s] = to_ui
+        self.alpha[s] = 255
+        self.count += n
+
+    def _compact(self, keep=None):
+        """Move the particles in `keep` (default: not expired) to the front of every array."""
+        if keep is None:
+            if self._expired is None:
+                return
+            keep = ~self._expired
+            self._expired = None
+        n = int(np.count_nonzero(keep))
+        if n == self.count:
+            return
+        for arr in (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                    self.size, self.color, self.to_ui, self.alpha):
+            arr[:n] = arr[:self.count][keep]
+        self.count = n
+
+    def update(self, width, height):
+        """Advance one frame: homing / gravity, alpha from life, then age and cull."""
+        self._compact()
+        n = self.count
+        if n == 0:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        ui = self.to_ui[:n]
+
+        if ui.any():
+            # particles heading to UI: steer toward the coin icon, slowing as they arrive
+            tx = np.float32(width - UI_MARGIN)
+            ty = np.float32(UI_Y)
+            dx = tx - x[ui]
+            dy = ty - y[ui]
+            dist = np.maximum(1.0, np.hypot(dx, dy))
+            desired = np.maximum(2.0, dist * 0.08)
+            vx[ui] = vx[ui] * (1.0 - self.STEER) + dx / dist * desired * self.STEER
+            vy[ui] = vy[ui] * (1.0 - self.STEER) + dy / dist * desired * self.STEER
+
+        x += vx
+        y += vy
+        # small gravity for the scattering bits only
+        vy[~ui] += self.GRAVITY
+
+        # fade out based on the life left before this frame's decrement
+        life = self.life[:n]
+        ratio = np.clip(life / np.maximum(1, self.max_life[:n]).astype(np.float32), 0.0, None)
+        self.alpha[:n] = (255 * ratio).astype(np.int32)
+
+        # coin particles that reached the UI disappear right away (not drawn)
+        if ui.any():
+            reached = ui & (np.hypot(width - UI_MARGIN - x, UI_Y - y) < UI_REACHED)
+            if reached.any():
+                self._compact(~reached)
+                n = self.count
+                life = self.life[:n]
+                x, y = self.x[:n], self.y[:n]
+
+        life -= 1
+        self._expired = (life <= 0) | (y > height + 240) | (x < -60) | (x > width + 60)
+
+    def draw(self, surface, scale=1.0):
+        """Draw every live particle as an alpha circle: shared sprites, one ``blits`` call.
+
+        `scale` maps screen coordinates onto a smaller render surface.
+        """
+        n = self.count
+        if n == 0:
+            return
+        sizes = self.size[:n]
+        x, y = self.x[:n], self.y[:n]
+        if scale != 1.0:
+            sizes = np.maximum(1, (sizes * scale + 0.5).astype(np.int32))
+            x = x * np.float32(scale)
+            y = y * np.float32(scale)
+        sprites = self.sprites.sprites_for(sizes, self.color[:n], self.alpha[:n])
+        xs = (x - sizes).astype(np.int32).tolist()
+        ys = (y - sizes).astype(np.int32).tolist()
+        surface.blits(list(zip(sprites, zip(xs, ys))), doreturn=False)
+
+    def clear(self):
+        self.count = 0
+        self._expired = None
+
+
+class SplashSystem:
+    """Juice streaks: particles with a short position trail drawn as tapered, wobbling lines.
+
+    The trail is a ring of the last `TRAIL` positions per streak (newest
+    first). Segment endpoints, wobble, alpha and thickness for every streak
+    are computed as arrays; only the final ``pygame.draw.line`` calls remain
+    per segment.
+
+    `update()` is one simulation step; `draw()` may run zero or several
+    times in between. A streak is drawn with the life it had before the
+    step's decrement, so that decrement (and dropping finished streaks) is
+    applied at the start of the next `update()`.
+    """
+
+    TRAIL = 12
+    GRAVITY = 0.3
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self._pending = 0  # streaks [0, _pending) still owe the last step's life decrement
+        self._alloc(max(16, int(capacity)))
+        # segment index j and its share of the trail, reused every frame
+        self._j = np.arange(self.TRAIL - 1, dtype=np.float32)
+
+    def _alloc(self, capacity):
+        old = self.count
+        fields = {}
+        for name, dtype, shape in (("x", np.float32, ()), ("y", np.float32, ()),
+                                   ("vx", np.float32, ()), ("vy", np.float32, ()),
+                                   ("life", np.int32, ()), ("max_life", np.int32, ()),
+                                   ("seed", np.float32, ()), ("age", np.int32, ()),
+                                   ("color", np.uint8, (3,)), ("trail", np.float32, (self.TRAIL, 2)),
+                                   ("trail_len", np.int32, ())):
+            arr = np.zeros((capacity,) + shape, dtype=dtype)
+            prev = getattr(self, name, None)
+            if prev is not None and old:
+                arr[:old] = prev[:old]
+            fields[name] = arr
+        self.__dict__.update(fields)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def emit(self, x, y, vx, vy, life, color, seed):
+        """Append streaks; each argument is a sequence (one value per streak) or a scalar."""
+        n = max(np.size(x), np.size(y), np.size(vx), np.size(vy), np.size(life), np.size(seed))
+        if n == 0:
+            return
+        if self.count + n > self.capacity:
+            cap = self.capacity
+            while cap < self.count + n:
+                cap *= 2
+            self._alloc(cap)
+        s = slice(self.count, self.count + n)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = vx
+        self.vy[s] = vy
+        self.life[s] = life
+        self.max_life[s] = life
+        self.seed[s] = seed
+        self.age[s] = 0
+        self.color[s] = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+        self.trail[s, 0, 0] = self.x[s]
+        self.trail[s, 0, 1] = self.y[s]
+        self.trail_len[s] = 1
+        self.count += n
+
+    def _age(self):
+        """Apply the pending life decrement and drop finished streaks in one compaction."""
+        p = self._pending
+        self._pending = 0
+        if p == 0:
+            return
+        n = self.count
+        life = self.life[:p]
+        life -= 1
+        keep = np.ones(n, dtype=np.bool_)
+        keep[:p] = life > 0
+        k = int(np.count_nonzero(keep))
+        if k != n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                        self.seed, self.age, self.color, self.trail, self.trail_len):
+                arr[:k] = arr[:n][keep]
+            self.count = k
+
+    def update(self):
+        """One simulation step: move, gravity, push the new trail point."""
+        self._age()
+        n = self.count
+        if n == 0:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        x += vx
+        y += vy
+        vy += self.GRAVITY
+        self.age[:n] += 1
+
+        # push the new position at the front of each trail (newest first)
+        trail = self.trail[:n]
+        trail[:, 1:] = trail[:, :-1].copy()
+        trail[:, 0, 0] = x
+        trail[:, 0, 1] = y
+        self.trail_len[:n] = np.minimum(self.trail_len[:n] + 1, self.TRAIL)
+        self._pending = n
+
+    def draw(self, surface, scale=1.0, max_trail=None):
+        """Draw every streak onto `surface` (an SRCALPHA layer).
+
+        `scale` maps screen coordinates onto a smaller render surface; `max_trail`
+        caps the number of trail points drawn per streak (effect quality).
+        """
+        n = self.count
+        if n == 0:
+            return
+        trail = self.trail[:n]
+        tlen = self.trail_len[:n]
+        ratio = np.clip(self.life[:n] / np.maximum(1, self.max_life[:n]).astype(np.float32), 0.0, None)
+
+        # tapered segments along the trail with a perpendicular wobble
+        j = self._j
+        p1 = trail[:, :-1]
+        p2 = trail[:, 1:]
+        d = p2 - p1
+        seg_len = np.hypot(d[..., 0], d[..., 1]) + 1e-6
+        px = -d[..., 1] / seg_len
+        py = d[..., 0] / seg_len
+        if max_trail is not None:
+            tlen = np.minimum(tlen, max(2, int(max_trail)))
+        lenf = tlen[:, None].astype(np.float32)
+        wobble = np.sin(self.age[:n, None] * 0.25 + self.seed[:n, None] + j) * (3.0 * (1.0 - j / lenf))
+        ox = px * wobble
+        oy = py * wobble
+        t = 1.0 - j / np.maximum(1.0, lenf - 1.0)
+        alpha = (255 * ratio[:, None] * t).astype(np.int32)
+        thick = np.maximum(1, (6 * t * ratio[:, None]).astype(np.int32))
+        x1 = p1[..., 0] + ox
+        y1 = p1[..., 1] + oy
+        x2 = p2[..., 0] + ox
+        y2 = p2[..., 1] + oy
+        if scale != 1.0:
+            s = np.float32(scale)
+            x1, y1, x2, y2 = x1 * s, y1 * s, x2 * s, y2 * s
+            thick = np.maximum(1, (thick * scale + 0.5).astype(np.int32))
+        x1, y1 = x1.astype(np.int32), y1.astype(np.int32)
+        x2, y2 = x2.astype(np.int32), y2.astype(np.int32)
+
+        valid = j[None, :] < (lenf - 1.0)
+        rows, cols = np.nonzero(valid)
+        colors = self.color[:n][rows].tolist()
+        line = pygame.draw.line
+        for col, a, ax, ay, bx, by, th in zip(colors, alpha[rows, cols].tolist(),
+                                              x1[rows, cols].tolist(), y1[rows, cols].tolist(),
+                                              x2[rows, cols].tolist(), y2[rows, cols].tolist(),
+                                              thick[rows, cols].tolist()):
+            line(surface, (col[0], col[1], col[2], a), (ax, ay), (bx, by), th)
+
+    def clear(self):
+        self.count = 0
+        self._pending = 0
@@ -0,0 +1,110 @@
+"""Per-player state for local multiplayer.
+
+Both players are tracked by the same inference pass (the tracker simply runs
+with ``max_num_hands=2``); `assign_hands` decides which detected hand belongs
+to which player, and each `Player` keeps its own fingertip estimator, trail,
+combo, streak and score.
+
+Assignment uses MediaPipe's handedness: player 1 slices with a right hand,
+player 2 with a left hand. MediaPipe labels handedness as if the image were
+mirrored, and the game feeds it the raw (non-mirrored) camera frame, so a
+real right hand is reported as "Left". When both hands get the same label (or
+none), the hand further left on screen goes to player 1.
+"""
+import math
+
+from fingertip_filter import FingertipEstimator
+
+PLAYER_COLORS = [(0, 255, 255), (255, 170, 40)]
+# MediaPipe label of each player's hand on a non-mirrored frame
+PLAYER_HAND_LABELS = ["Left", "Right"]
+
+
+class Player:
+    def __init__(self, index):
+        self.index = index
+        self.label = f"P{index + 1}"
+        self.color = PLAYER_COLORS[index % len(PLAYER_COLORS)]
+        self.estimator = FingertipEstimator()
+        self.finger_x = None
+        self.finger_y = None
+        self.finger_count = 0
+        self.confidence = 0.0
+        self.trail = []  # posisi jari sebelumnya (untuk efek garis slice)
+        self.score = 0
+        self.combo_count = 0
+        self.last_slice_time = 0.0
+        self.multiplier = 1
+        self.current_streak = 0
+        self.lightning_timer = 0
+
+    def has_finger(self):
+        return bool(self.finger_x and self.finger_y)
+
+    def lose_finger(self):
+        self.estimator.reset()
+        self.finger_x, self.finger_y = None, None
+        self.finger_count = 0
+        self.trail.clear()
+
+    def track(self, now, lightning_threshold, lightning_duration, max_trail=5):
+        """Update fingertip, trail and lightning timer for this rendered frame."""
+        self.confidence = self.estimator.confidence(now)
+        if self.confidence <= 0.0:
+            self.lose_finger()
+            return
+        px, py = self.estimator.predict(now)
+        self.finger_x, self.finger_y = int(px), int(py)
+        self.trail.append((self.finger_x, self.finger_y))
+        if len(self.trail) > max_trail:
+            self.trail.pop(0)
+
+        # Deteksi gerakan cepat untuk efek lightning
+        if len(self.trail) > 1:
+            x1, y1 = self.trail[-2]
+            x2, y2 = self.trail[-1]
+            if math.hypot(x2 - x1, y2 - y1) > lightning_threshold:
+                # mulai flash singkat (atau perpanjang bila masih cepat)
+                self.lightning_timer = max(self.lightning_timer, lightning_duration)
+
+    def register_slice(self, now, combo_window=0.5):
+        """Combo / multiplier bookkeeping for one slice; returns the multiplier."""
+        if (now - self.last_slice_time) <= combo_window:
+            self.combo_count += 1
+        else:
+            self.combo_count = 1
+        self.last_slice_time = now
+        # multiplier rule: start rewarding from 3+ combos
+        self.multiplier = 2 if self.combo_count >= 3 else 1
+        return self.multiplier
+
+
+def assign_hands(result, player_count):
+    """Return, per player, the index of its hand in `result` (or None).
+
+    `result` is a `tracking.TrackingResult`. With one player the first hand
+    is used, like single-player tracking always did.
+    """
+    slots = [None] * player_count
+    n = len(result.landmarks)
+    if n == 0 or player_count <= 0:
+        return slots
+    if player_count == 1:
+        slots[0] = 0
+        return slots
+    unassigned = []
+    for i in range(n):
+        label = result.handedness[i] if i < len(result.handedness) else ""
+        if label in PLAYER_HAND_LABELS:
+            p = PLAYER_HAND_LABELS.index(label)
+            if p < player_count and slots[p] is None:
+                slots[p] = i
+                continue
+        unassigned.append(i)
+    if unassigned:
+        # mirrored on screen: larger camera x is further left
+        unassigned.sort(key=lambda i: -float(result.landmarks[i, 0, 0]))
+        for p in range(player_count):
+            if slots[p] is None and unassigned:
+                slots[p] = unassigned.pop(0)
+    return slots
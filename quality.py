@@ -0,0 +1,92 @@
+"""Effect quality presets and a frame-budget driven auto mode.
+
+Splashes, particles, boom splatters, lightning and the combo glow used to be
+spawned / layered at fixed counts, so a slow machine paid for the full show
+on every slice. `PRESETS` defines what each quality level spends; main.py
+reads the current level's dict at every spawn and draw site.
+
+`EffectQuality` either pins one preset (``low`` / ``medium`` / ``high``) or,
+in ``auto``, feeds the measured work time per frame into the same
+`governor.HysteresisLadder` the tracking governor uses for inference time:
+a sustained overrun of the frame budget steps one level down right away,
+stepping back up needs a long stretch of headroom, and a step up that has
+to be undone soon after makes the next try wait longer.
+
+Counts change the number of random draws per spawn, so replays with a fixed
+``FRUIT_SEED`` are only reproducible with a fixed preset.
+"""
+from governor import HysteresisLadder
+
+# ordered from the most expensive level down; "high" is the original look
+PRESETS = {
+    "high": {
+        "splash_streaks": 18,     # juice streaks per sliced fruit
+        "splash_trail": 12,       # trail points drawn per streak
+        "particle_share": 1.0,    # share of spark / coin / explosion particles spawned
+        "splatter_share": 1.0,    # share of the blobs in a full-screen boom splatter (80 at 800x600)
+        "lightning_layers": 3,    # jittered glow layers of the finger lightning
+        "flash_streaks": 6,       # streaks in the combo flash
+        "glow_layers": 3,         # glow layers behind combo popups
+    },
+    "medium": {
+        "splash_streaks": 12,
+        "splash_trail": 8,
+        "particle_share": 0.6,
+        "splatter_share": 0.6,
+        "lightning_layers": 2,
+        "flash_streaks": 4,
+        "glow_layers": 1,
+    },
+    "low": {
+        "splash_streaks": 6,
+        "splash_trail": 5,
+        "particle_share": 0.3,
+        "splatter_share": 0.3,
+        "lightning_layers": 1,
+        "flash_streaks": 2,
+        "glow_layers": 0,
+    },
+}
+LEVELS = ["high", "medium", "low"]
+
+
+class EffectQuality(HysteresisLadder):
+    """Current effect preset; ``auto`` adapts it to the frame budget.
+
+    - `observe(frame_ms)` once per frame with the work time (without the
+      frame limiter sleep); returns the new settings dict when the level
+      changed, otherwise None
+    - `settings` is the current preset's dict, `count(n)` scales a
+      particle count by its ``particle_share``
+    """
+
+    def __init__(self, mode, budget_ms, down_after=15, up_after=150, headroom=0.6,
+                 cooldown=2.0, ema_weight=0.1, warmup=30):
+        mode = str(mode).strip().lower()
+        self.mode = mode if mode in PRESETS or mode == "auto" else "auto"
+        # the first frames include asset loading and cache warm-up
+        super().__init__(len(LEVELS), budget_ms, down_after, up_after, headroom, cooldown, ema_weight,
+                         warmup, start=LEVELS.index(self.mode) if self.mode in PRESETS else 0)
+
+    def level_name(self, level):
+        return LEVELS[level]
+
+    @property
+    def name(self):
+        return LEVELS[self.level]
+
+    @property
+    def settings(self):
+        return PRESETS[LEVELS[self.level]]
+
+    def count(self, n):
+        """`n` particles scaled by the current ``particle_share`` (at least 1)."""
+        return max(1, int(round(n * self.settings["particle_share"])))
+
+    def observe(self, frame_ms, now=None):
+        if self.mode != "auto":
+            return None
+        return self.settings if self.measure(frame_ms, now) else None
+
+    def stats(self):
+        return {"mode": self.mode, "level": self.name, "avg_ms": self.ema_ms, "budget_ms": self.budget_ms}
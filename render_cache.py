@@ -0,0 +1,445 @@
+"""Caches for pre-transformed sprites.
+
+Rotating a Surface allocates a new one and resamples every pixel; doing that
+for every sliced half on every frame is what made big combos expensive.
+`RotationCache` hands out rotated copies keyed by the source Surface and a
+quantized angle, so a half spinning through the same few angles is rotated
+once per bucket, not once per frame. `SplitAtlas` does the same for cutting a
+fruit into two halves. `CircleSpriteCache` shares the small alpha circles
+particles are drawn with, `SplatterOverlay` keeps one composited layer for
+the full-screen boom splatters, `TextCache` keeps rendered and scaled text
+and `SurfacePool` recycles screen-sized scratch surfaces.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+
+class RotationCache:
+    """LRU cache of ``pygame.transform.rotate`` results.
+
+    Angles are snapped to `step_deg` buckets (a 3 degree step is not visible
+    on a spinning fruit half). Entries are evicted least-recently-used once
+    their pixel memory passes `max_bytes`. `hits` / `misses` / `evictions`
+    are kept for the perf HUD, to tune the bucket size.
+
+    Returned Surfaces are shared: callers may ``set_alpha()`` right before
+    blitting, but must not draw onto them.
+    """
+
+    def __init__(self, step_deg=3.0, max_bytes=32 * 1024 * 1024):
+        self.step_deg = float(step_deg)
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict()  # (surface, bucket) -> rotated surface
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bucket(self, angle):
+        if self.step_deg <= 0:
+            return angle % 360.0
+        buckets = int(round(360.0 / self.step_deg))
+        return int(round(angle / self.step_deg)) % buckets
+
+    def rotate(self, surface, angle):
+        key = (surface, self.bucket(angle))
+        rotated = self._entries.get(key)
+        if rotated is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rotated
+        self.misses += 1
+        snapped = key[1] * self.step_deg if self.step_deg > 0 else angle
+        rotated = pygame.transform.rotate(surface, snapped)
+        size = rotated.get_width() * rotated.get_height() * rotated.get_bytesize()
+        self._entries[key] = rotated
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.evictions += 1
+        return rotated
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "mb": self.bytes / (1024.0 * 1024.0),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_pct": (100.0 * self.hits / total) if total else 0.0,
+            "evicted": self.evictions,
+        }
+
+
+class SplitAtlas:
+    """Pre-cut fruit halves per fruit image and quantized cut angle.
+
+    Cutting a fruit means rotating it so the swipe is horizontal, copying the
+    top and bottom halves and rotating both back, which is too much work for
+    the collision path. Here each (image, cut angle bucket) is cut once and
+    every later slice is a dictionary lookup.
+
+    A cut at ``a + 180`` gives the same two pieces as ``a`` with top and
+    bottom swapped, so only angles in [0, 180) are stored. `build()` fills
+    the table up front; otherwise entries are made on first use. Surfaces are
+    shared between halves and must not be drawn onto.
+    """
+
+    def __init__(self, step_deg=10.0):
+        self.step_deg = max(1.0, float(step_deg))
+        self.buckets = max(1, int(round(180.0 / self.step_deg)))
+        self._cuts = {}  # (surface, bucket) -> (top, bottom, rotated height)
+        self._vertical = {}  # surface -> (left, right)
+        self.hits = 0
+        self.misses = 0
+
+    def _cut_now(self, img, ang):
+        # rotate so the cut line is horizontal, split, rotate both pieces back
+        rotated = pygame.transform.rotate(img, -ang)
+        rw, rh = rotated.get_width(), rotated.get_height()
+        y_mid = rh // 2
+        top_rot = rotated.subsurface((0, 0, rw, y_mid)).copy()
+        bottom_rot = rotated.subsurface((0, y_mid, rw, rh - y_mid)).copy()
+        return pygame.transform.rotate(top_rot, ang), pygame.transform.rotate(bottom_rot, ang), rh
+
+    def cut(self, img, angle):
+        """Return ``(top, bottom, rotated_height, snapped_angle)`` for a cut along `angle` degrees."""
+        a = float(angle) % 360.0
+        flipped = a >= 180.0
+        if flipped:
+            a -= 180.0
+        bucket = int(round(a / self.step_deg))
+        if bucket >= self.buckets:
+            # e.g. 178 degrees snaps to 180, which is bucket 0 flipped
+            bucket -= self.buckets
+            flipped = not flipped
+        key = (img, bucket)
+        entry = self._cuts.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._cut_now(img, bucket * self.step_deg)
+            self._cuts[key] = entry
+        else:
+            self.hits += 1
+        top, bottom, rh = entry
+        snapped = bucket * self.step_deg
+        if flipped:
+            return bottom, top, rh, snapped + 180.0
+        return top, bottom, rh, snapped
+
+    def vertical(self, img):
+        """Left and right halves (the split used when no swipe angle is known)."""
+        pair = self._vertical.get(img)
+        if pair is None:
+            w, h = img.get_width(), img.get_height()
+            half_w = w // 2
+            left = pygame.Surface((half_w, h), pygame.SRCALPHA)
+            right = pygame.Surface((half_w, h), pygame.SRCALPHA)
+            left.blit(img, (0, 0), (0, 0, half_w, h))
+            right.blit(img, (0, 0), (half_w, 0, half_w, h))
+            pair = (left, right)
+            self._vertical[img] = pair
+        return pair
+
+    def build(self, images):
+        """Cut every image at every angle bucket now (eager mode)."""
+        for img in images:
+            self.vertical(img)
+            for bucket in range(self.buckets):
+                if (img, bucket) not in self._cuts:
+                    self._cuts[(img, bucket)] = self._cut_now(img, bucket * self.step_deg)
+
+    def stats(self):
+        nbytes = 0
+        for top, bottom, _ in self._cuts.values():
+            for surf in (top, bottom):
+                nbytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        return {"cuts": len(self._cuts), "mb": nbytes / (1024.0 * 1024.0), "hits": self.hits, "misses": self.misses}
+
+
+class CircleSpriteCache:
+    """Filled alpha circles for particles, keyed by (radius, color, alpha bucket).
+
+    Drawing a particle used to allocate a small SRCALPHA Surface and draw a
+    circle into it, every particle every frame. Here each (radius, color,
+    alpha rounded to `alpha_step`) circle is drawn once and shared, so a frame
+    of particles is one ``Surface.blits`` call with no allocation once the
+    sprites are warm. The table is simply cleared if it passes `max_entries`
+    (colors come from a handful of fruit images, so that is rare).
+
+    `saved` / `allocs` count the sprites reused / created by the last
+    `sprites_for()` call, i.e. the Surface allocations saved in that frame.
+    """
+
+    def __init__(self, alpha_step=8, max_entries=4096):
+        self.alpha_step = max(1, int(alpha_step))
+        self.max_entries = int(max_entries)
+        self._sprites = {}  # packed key -> Surface
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0
+        self.allocs = 0
+
+    def _make(self, radius, color, alpha):
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (color[0], color[1], color[2], alpha), (radius, radius), radius)
+        return surf
+
+    def sprites_for(self, radii, colors, alphas):
+        """Sprites for arrays of radii (n,), uint8 colors (n, 3) and alphas (n,)."""
+        step = self.alpha_step
+        radii = np.maximum(1, radii).astype(np.int64)
+        buckets = np.minimum(255, np.rint(alphas / float(step)).astype(np.int64) * step)
+        colors = colors.astype(np.int64)
+        keys = ((((radii * 256 + colors[:, 0]) * 256 + colors[:, 1]) * 256 + colors[:, 2]) * 256 + buckets).tolist()
+        if len(self._sprites) > self.max_entries:
+            self._sprites.clear()
+        table = self._sprites
+        out = []
+        allocs = 0
+        for i, key in enumerate(keys):
+            surf = table.get(key)
+            if surf is None:
+                allocs += 1
+                surf = self._make(int(radii[i]), colors[i].tolist(), int(buckets[i]))
+                table[key] = surf
+            out.append(surf)
+        self.allocs = allocs
+        self.saved = len(keys) - allocs
+        self.misses += allocs
+        self.hits += self.saved
+        return out
+
+    def clear(self):
+        self._sprites.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "sprites": len(self._sprites),
+            "saved/frame": self.saved,
+            "allocs/frame": self.allocs,
+            "hit_pct": (100.0 * self.hits / total) if total else 0.0,
+        }
+
+
+class SplatterOverlay:
+    """Full-screen boom splatters, all composited into one shared overlay.
+
+    Each splatter is a set of alpha blobs fading out over its life. Drawing
+    them used to allocate a screen-sized SRCALPHA Surface per splatter per
+    frame and blit each one, and the blit is the expensive part (the circles
+    themselves are cheap). Here a single overlay is allocated once, every
+    live splatter is drawn into it (oldest first, so newer blobs cover older
+    ones) and the screen gets one blit per frame however many booms overlap.
+
+    The fade is quantized to `fade_levels` steps, and the overlay is only
+    redrawn when a splatter changes step, spawns or expires; the other frames
+    are just the blit. ``set_alpha`` on a per-pixel-alpha Surface would avoid
+    the redraw but takes pygame's slow blend path (about 3x a plain blit).
+
+    Blobs are in screen coordinates; `scale` maps them onto a smaller overlay
+    (render-scale mode).
+    """
+
+    def __init__(self, size, fade_levels=32, scale=1.0):
+        self.size = (int(size[0]), int(size[1]))
+        self.fade_levels = max(1, int(fade_levels))
+        self.scale = float(scale)
+        self._splatters = []  # [serial, color, blobs, age, life]
+        self._serial = 0
+        self._drawn = None  # (serial, level) of every splatter in the overlay
+        self.surface = None
+        self.frames = 0
+        self.redraws = 0
+
+    def __len__(self):
+        return len(self._splatters)
+
+    def __bool__(self):
+        return bool(self._splatters)
+
+    def add(self, color, blobs, life):
+        """Add a splatter: `blobs` is a list of ``(x, y, radius, alpha)``."""
+        self._serial += 1
+        self._splatters.append([self._serial, color, blobs, 0, max(1, int(life))])
+
+    def draw(self, screen, steps=1):
+        """Blit the live splatters (one blit), then age them by `steps` simulation steps."""
+        if not self._splatters:
+            return
+        levels = self.fade_levels
+        state = []
+        for serial, _, _, age, life in self._splatters:
+            state.append((serial, int(round(max(0.0, 1.0 - age / float(life)) * levels))))
+        state = tuple(state)
+        if state != self._drawn:
+            if self.surface is None:
+                self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+            overlay = self.surface
+            overlay.fill((0, 0, 0, 0))
+            circle = pygame.draw.circle
+            s = self.scale
+            for (_, level), spl in zip(state, self._splatters):
+                color = spl[1]
+                alpha_mul = level / float(levels)
+                for bx, by, br, balpha in spl[2]:
+                    circle(overlay, (color[0], color[1], color[2], int(balpha * alpha_mul)),
+                           (int(bx * s), int(by * s)), max(1, int(br * s)))
+            self._drawn = state
+            self.redraws += 1
+        screen.blit(self.surface, (0, 0))
+        self.frames += 1
+        for spl in self._splatters:
+            spl[3] += steps
+        self._splatters = [spl for spl in self._splatters if spl[3] < spl[4]]
+
+    def clear(self):
+        self._splatters = []
+        self._drawn = None
+
+    def stats(self):
+        return {"live": len(self._splatters), "redraw_pct": (100.0 * self.redraws / self.frames) if self.frames else 0.0}
+
+
+class TextCache:
+    """Rendered text and its smoothscaled variants, keyed by (font, text, color).
+
+    Combo popups and the GAME OVER wobble re-rendered the same strings and
+    ran ``smoothscale`` for every glow layer on every frame. `render()` keeps
+    each string once; `scaled()` keeps variants with the scale factors
+    snapped to `scale_step`, so an animation passing through the same sizes
+    scales each size once. Least-recently-used entries are dropped past
+    `max_entries`. Surfaces are shared: ``set_alpha()`` right before blitting
+    is fine, drawing onto them is not.
+    """
+
+    def __init__(self, scale_step=0.02, max_entries=512):
+        self.scale_step = max(1e-3, float(scale_step))
+        self.max_entries = int(max_entries)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key):
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return surf
+
+    def _put(self, key, surf):
+        self.misses += 1
+        self._entries[key] = surf
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surf = self._get(key)
+        if surf is None:
+            surf = self._put(key, font.render(text, True, color))
+        return surf
+
+    def scaled(self, font, text, color, scale_x, scale_y=None):
+        """`text` smoothscaled by (`scale_x`, `scale_y`), snapped to the scale step."""
+        if scale_y is None:
+            scale_y = scale_x
+        qx = int(round(scale_x / self.scale_step))
+        qy = int(round(scale_y / self.scale_step))
+        key = (font, text, tuple(color), qx, qy)
+        surf = self._get(key)
+        if surf is None:
+            base = self.render(font, text, color)
+            bw, bh = base.get_size()
+            size = (max(1, int(bw * qx * self.scale_step)), max(1, int(bh * qy * self.scale_step)))
+            surf = pygame.transform.smoothscale(base, size)
+            try:
+                surf = surf.convert_alpha()
+            except Exception:
+                pass
+            surf = self._put(key, surf)
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "hit_pct": (100.0 * self.hits / total) if total else 0.0}
+
+
+class SurfacePool:
+    """Screen-sized scratch surfaces, reused frame after frame.
+
+    Effects such as the lightning overlay or the combo flash each allocated a
+    fresh screen-sized SRCALPHA Surface (1.9 MB at 800x600) every frame they
+    were visible. `get()` hands out a cleared surface from the pool instead;
+    everything handed out is returned by `begin_frame()`, so a surface stays
+    valid until the next frame starts. The pool only grows to the largest
+    number of overlays used in one frame.
+
+    `solid()` is for plain translucent fills (menu dimming, the game-over
+    tint): an opaque surface with surface alpha, filled only when its color
+    changes, which also blits faster than a per-pixel-alpha one.
+
+    `allocs` counts Surfaces created during the current / last frame.
+    """
+
+    def __init__(self, size):
+        self.size = (int(size[0]), int(size[1]))
+        self._free = []
+        self._used = []
+        self._solid = None
+        self._solid_rgb = None
+        self.allocs = 0
+        self.total_allocs = 0
+        self.handed_out = 0
+
+    def begin_frame(self):
+        self._free.extend(self._used)
+        self._used = []
+        self.allocs = 0
+        self.handed_out = 0
+
+    def _alloc(self, flags=0):
+        self.allocs += 1
+        self.total_allocs += 1
+        return pygame.Surface(self.size, flags)
+
+    def get(self, clear=True):
+        """A screen-sized SRCALPHA surface, fully transparent unless `clear` is False."""
+        if self._free:
+            surf = self._free.pop()
+            if clear:
+                surf.fill((0, 0, 0, 0))
+        else:
+            surf = self._alloc(pygame.SRCALPHA)
+        self._used.append(surf)
+        self.handed_out += 1
+        return surf
+
+    def solid(self, color):
+        """A screen-sized fill of ``(r, g, b, a)``, ready to blit at (0, 0)."""
+        if self._solid is None:
+            self._solid = self._alloc()
+        rgb = (color[0], color[1], color[2])
+        if rgb != self._solid_rgb:
+            self._solid.fill(rgb)
+            self._solid_rgb = rgb
+        self._solid.set_alpha(color[3] if len(color) > 3 else 255)
+        self.handed_out += 1
+        return self._solid
+
+    def stats(self):
+        return {"pooled": len(self._free) + len(self._used) + (1 if self._solid is not None else 0),
+                "used/frame": self.handed_out, "allocs/frame": self.allocs, "allocs": self.total_allocs}
@@ -0,0 +1,141 @@
+"""Render-scale mode: draw the game world at a lower resolution, upscale once.
+
+With ``FRUIT_RENDER_SCALE`` below 1 (e.g. 0.5 - 0.75) the camera background,
+fruits, halves, trails and every effect layer are drawn into one offscreen
+surface of ``scale * (width, height)`` pixels. `RenderScaler.present()`
+upscales it onto the screen in a single ``transform.scale`` call. Gameplay
+keeps running in screen coordinates: only the draw calls go through `pos()`,
+`length()`, `points()` and `image()`, which are identities at scale 1, so the
+default path draws exactly what it did before.
+
+The full-screen alpha layers (splash, splatters, lightning, flash) are what
+make slow machines drop frames, and they shrink with the square of the scale.
+The camera frame is resized straight to the small size as well.
+
+UI drawn in the middle of the world pass (score, Home button, menu layer)
+goes through `HudLayer`: at scale 1 it draws immediately, otherwise the
+draws are replayed at native resolution right after the upscale, so text
+stays sharp.
+"""
+import time
+from collections import OrderedDict
+
+import pygame
+
+
+class HudLayer:
+    """Native-resolution draws issued during the world pass.
+
+    Immediate when the world is drawn at full size; deferred until
+    `RenderScaler.present()` when it is drawn smaller.
+    """
+
+    def __init__(self):
+        self.target = None
+        self._deferred = None
+
+    def begin(self, target, defer):
+        self.target = target
+        self._deferred = [] if defer else None
+
+    def blit(self, source, pos, area=None):
+        if self._deferred is None:
+            self.target.blit(source, pos, area)
+        else:
+            self._deferred.append((self.target.blit, (source, pos, area), {}))
+
+    def rect(self, color, rect, width=0, border_radius=0):
+        if self._deferred is None:
+            pygame.draw.rect(self.target, color, rect, width, border_radius=border_radius)
+        else:
+            self._deferred.append((pygame.draw.rect, (self.target, color, pygame.Rect(rect), width),
+                                   {"border_radius": border_radius}))
+
+    def flush(self):
+        if self._deferred:
+            for fn, args, kwargs in self._deferred:
+                fn(*args, **kwargs)
+        if self._deferred is not None:
+            self._deferred = []
+
+
+class RenderScaler:
+    """Offscreen world surface at `scale` of the screen size (scale 1: draw on the screen).
+
+    Per frame::
+
+        world = scaler.begin(screen)   # world pass: world.blit(scaler.image(img), scaler.pos(x, y))
+        scaler.hud.blit(text, (12, 12))
+        scaler.present(screen)         # upscale once, then the deferred HUD draws
+    """
+
+    def __init__(self, size, scale=1.0, max_images=1024):
+        self.native = (int(size[0]), int(size[1]))
+        self.scale = min(1.0, max(0.25, float(scale)))
+        self.size = (max(1, int(round(self.native[0] * self.scale))),
+                     max(1, int(round(self.native[1] * self.scale))))
+        if self.size == self.native:
+            self.scale = 1.0
+        self.enabled = self.scale < 1.0
+        self.max_images = int(max_images)
+        self.surface = None
+        self.hud = HudLayer()
+        self._images = OrderedDict()  # source surface -> scaled copy
+        self.image_misses = 0
+        self.present_ms = 0.0
+
+    def begin(self, screen):
+        """Return the surface the world pass draws on this frame."""
+        self.hud.begin(screen, self.enabled)
+        if not self.enabled:
+            return screen
+        if self.surface is None:
+            # same pixel format as the screen so present() can scale straight into it
+            self.surface = pygame.Surface(self.size, 0, screen)
+        return self.surface
+
+    def pos(self, x, y):
+        if not self.enabled:
+            return (x, y)
+        s = self.scale
+        return (int(x * s), int(y * s))
+
+    def length(self, value, minimum=1):
+        if not self.enabled:
+            return value
+        return max(minimum, int(round(value * self.scale)))
+
+    def points(self, pts):
+        if not self.enabled:
+            return pts
+        s = self.scale
+        return [(int(x * s), int(y * s)) for x, y in pts]
+
+    def image(self, surface):
+        """`surface` scaled by the render scale (cached per source Surface, LRU)."""
+        if not self.enabled:
+            return surface
+        scaled = self._images.get(surface)
+        if scaled is not None:
+            self._images.move_to_end(surface)
+            return scaled
+        self.image_misses += 1
+        w, h = surface.get_size()
+        scaled = pygame.transform.smoothscale(surface, (max(1, int(round(w * self.scale))),
+                                                        max(1, int(round(h * self.scale)))))
+        self._images[surface] = scaled
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        return scaled
+
+    def present(self, screen):
+        """Upscale the world onto `screen`, then replay the deferred HUD draws."""
+        if self.enabled and self.surface is not None:
+            t0 = time.perf_counter()
+            pygame.transform.scale(self.surface, self.native, screen)
+            self.present_ms = (time.perf_counter() - t0) * 1000.0
+        self.hud.flush()
+
+    def stats(self):
+        return {"scale": self.scale, "size": "%dx%d" % self.size, "images": len(self._images),
+                "image_misses": self.image_misses, "present_ms": self.present_ms}
@@ -1,16 +1,28 @@
+import time
+
 import cv2
 
-cap = cv2.VideoCapture(0)
+from camera import open_camera
+
+# buka kamera dengan mode yang dinegosiasikan (MJPG / resolusi / fps / buffer 1 frame)
+cap, mode = open_camera(0)
 if not cap.isOpened():
     print("Kamera tidak terbuka!")
     exit()
+print("Mode kamera:", mode)
 
+last = time.perf_counter()
+fps = 0.0
 while True:
     ret, frame = cap.read()
     if not ret:
         print("Gagal membaca frame!")
         break
 
+    now = time.perf_counter()
+    fps = fps * 0.9 + (1.0 / max(1e-6, now - last)) * 0.1
+    last = now
+    cv2.putText(frame, f"{mode}  {fps:.1f} fps", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
     cv2.imshow("Test Kamera", frame)
     if cv2.waitKey(1) & 0xFF == ord('q'):
         break
@@ -0,0 +1,66 @@
+"""Fixed-timestep simulation clock, decoupled from the render rate.
+
+Game physics and every timer in main.py count simulation steps: gravity is
+"+1 vy per step", halves live 45 steps, splatters 90, a fruit spawns every
+60. Those were tuned as frames of a 30 FPS loop, so the game slowed down
+whenever a frame ran long. `FixedTimestep` accumulates real elapsed time and
+tells the loop how many fixed steps to run this frame (0 when rendering
+faster than the simulation, several after a slow frame), plus the fraction
+of a step left over (`alpha`) so drawing can interpolate between the
+previous and the current simulation state.
+
+``lockstep`` runs exactly one step per rendered frame (alpha 1), which is
+what frame-driven replays (``FRUIT_INPUT=landmarks:`` / ``synthetic``) need
+to stay reproducible. `time` is the simulation time, which main.py uses
+instead of the wall clock for everything that affects the game (combos,
+the forced coin timer, the game-over animation).
+"""
+
+
+class FixedTimestep:
+    """Accumulator for a `hz` simulation, at most `max_steps` steps per frame."""
+
+    def __init__(self, hz, max_steps=5, lockstep=False):
+        self.hz = float(hz)
+        self.dt = 1.0 / self.hz
+        self.max_steps = int(max_steps)
+        self.lockstep = bool(lockstep)
+        self.acc = 0.0
+        self.last = None
+        self.steps = 0
+        self.alpha = 1.0
+        self.frames = 0
+        self.total_steps = 0
+        self.dropped_ms = 0.0  # simulation time given up after very long frames
+
+    def advance(self, now):
+        """Start a rendered frame at time `now` (seconds); return the steps to simulate."""
+        self.frames += 1
+        if self.lockstep or self.last is None:
+            self.last = now
+            self.steps = 1
+            self.alpha = 1.0
+            self.total_steps += 1
+            return 1
+        self.acc += max(0.0, now - self.last)
+        self.last = now
+        steps = int(self.acc / self.dt)
+        if steps > self.max_steps:
+            # a hitch (window drag, breakpoint, camera stall): don't fast-forward through it
+            self.dropped_ms += (steps - self.max_steps) * self.dt * 1000.0
+            self.acc -= (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+        self.acc -= steps * self.dt
+        self.steps = steps
+        self.alpha = min(1.0, self.acc / self.dt)
+        self.total_steps += steps
+        return steps
+
+    @property
+    def time(self):
+        """Simulation time in seconds (steps run so far); the game clock for combos and timers."""
+        return self.total_steps * self.dt
+
+    def stats(self):
+        return {"hz": self.hz, "steps/frame": (self.total_steps / self.frames) if self.frames else 0.0,
+                "alpha": self.alpha, "dropped_ms": self.dropped_ms}
@@ -0,0 +1,665 @@
+"""Hand tracking backends.
+
+Every backend hands the game loop a `TrackingResult` holding plain numpy
+landmark arrays, so the loop does not care whether MediaPipe ran inline or in
+a worker process. Trackers follow a submit/poll pattern: `submit()` a camera
+frame whenever one is available and `poll()` once per game frame for the
+latest finished result; while inference is in flight `poll()` keeps returning
+the last known landmarks.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+INDEX_TIP = 8
+NUM_LANDMARKS = 21
+
+
+class TrackingResult:
+    """Landmarks of the hands found in one camera frame.
+
+    `landmarks` is a float32 array of shape (hands, 21, 3) in normalized image
+    coordinates (x, y in [0, 1], z relative depth); `handedness` lists
+    "Left"/"Right" per hand as reported by MediaPipe. `timestamp` is the
+    `time.perf_counter()` value at which the frame was submitted.
+    """
+
+    def __init__(self, landmarks=None, handedness=None, frame_seq=0, infer_ms=0.0, timestamp=0.0):
+        if landmarks is None:
+            landmarks = np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.landmarks = landmarks
+        self.handedness = list(handedness or [])
+        self.frame_seq = frame_seq
+        self.infer_ms = infer_ms
+        self.timestamp = timestamp
+
+    @property
+    def has_hands(self):
+        return len(self.landmarks) > 0
+
+    @property
+    def tips(self):
+        """Index fingertip (x, y) per hand, shape (hands, 2)."""
+        return self.landmarks[:, INDEX_TIP, :2]
+
+
+def result_from_mediapipe(res, frame_seq=0, infer_ms=0.0):
+    """Convert a `mp.solutions.hands` result into a `TrackingResult`."""
+    hand_list = getattr(res, "multi_hand_landmarks", None) or []
+    if not hand_list:
+        return TrackingResult(frame_seq=frame_seq, infer_ms=infer_ms)
+    arr = np.empty((len(hand_list), NUM_LANDMARKS, 3), dtype=np.float32)
+    for i, hand in enumerate(hand_list):
+        for j, lm in enumerate(hand.landmark):
+            arr[i, j, 0] = lm.x
+            arr[i, j, 1] = lm.y
+            arr[i, j, 2] = lm.z
+    handedness = []
+    for h in getattr(res, "multi_handedness", None) or []:
+        try:
+            handedness.append(h.classification[0].label)
+        except Exception:
+            handedness.append("")
+    return TrackingResult(arr, handedness, frame_seq, infer_ms)
+
+
+class RoiCropper:
+    """Pick a square crop around the last known hand.
+
+    The crop covers the hand's landmark bounding box (which includes the index
+    fingertip) grown by `margin` on every side, and is downsampled so its
+    longer side is at most `max_side` pixels. With no known hand, or when the
+    crop would cover most of the frame anyway, `select()` returns None and the
+    caller searches the full frame.
+    """
+
+    def __init__(self, margin=0.35, max_side=256, full_frame_ratio=0.8):
+        self.margin = margin
+        self.max_side = max_side
+        self.full_frame_ratio = full_frame_ratio
+        self.box = None  # (x0, y0, side) in full-frame pixels
+
+    def select(self, frame_w, frame_h):
+        if self.box is None:
+            return None
+        x0, y0, side = self.box
+        if side >= self.full_frame_ratio * min(frame_w, frame_h):
+            return None
+        return self.box
+
+    def crop(self, bgr, box):
+        """Return the (possibly downsampled) crop for `box`."""
+        x0, y0, side = box
+        roi = bgr[y0:y0 + side, x0:x0 + side]
+        if side > self.max_side:
+            roi = cv2.resize(roi, (self.max_side, self.max_side), interpolation=cv2.INTER_AREA)
+        return roi
+
+    def update(self, landmarks, frame_w, frame_h):
+        """Track the box of the first hand in full-frame normalized `landmarks`."""
+        if landmarks is None or len(landmarks) == 0:
+            self.box = None
+            return
+        xs = landmarks[0, :, 0] * frame_w
+        ys = landmarks[0, :, 1] * frame_h
+        bw = float(xs.max() - xs.min())
+        bh = float(ys.max() - ys.min())
+        side = int(max(bw, bh) * (1.0 + 2.0 * self.margin))
+        side = max(96, min(side, frame_w, frame_h))
+        cx = float(xs.max() + xs.min()) * 0.5
+        cy = float(ys.max() + ys.min()) * 0.5
+        x0 = int(min(max(0, cx - side / 2), frame_w - side))
+        y0 = int(min(max(0, cy - side / 2), frame_h - side))
+        self.box = (x0, y0, side)
+
+
+class LegacyHandsEngine:
+    """Synchronous `mp.solutions.hands.Hands` wrapper taking BGR frames.
+
+    With `roi=True` the frame is cropped around the last known hand (see
+    `RoiCropper`) before color conversion and inference. The crop follows the
+    hand every frame, so crops go to their own ``static_image_mode=True``
+    instance, which does not carry a tracked hand over from the previous
+    image; the video-mode instance only ever sees full frames, so its
+    frame-to-frame tracking stays in one coordinate system. A crop that misses
+    the hand reports no hand for that frame (no second inference) and the next
+    frame is searched in full.
+
+    The static instance runs palm detection on every crop, while the video
+    instance skips it as long as it tracks a hand, and both feed the models a
+    fixed input size, so a crop is not cheaper than a full frame: `stats()`
+    reports the measured time per crop and per full frame and the difference
+    (`roi_saved_ms`, negative when the crop costs more).
+    """
+
+    def __init__(self, max_num_hands=1, model_complexity=1,
+                 min_detection_confidence=0.5, min_tracking_confidence=0.5, roi=False, input_scale=1.0):
+        self.input_scale = input_scale
+        self.options = {
+            "max_num_hands": max_num_hands,
+            "model_complexity": model_complexity,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+        }
+        # imported here so replay/synthetic inputs work on machines without MediaPipe
+        import mediapipe as mp
+        self.hands = mp.solutions.hands.Hands(**self.options)
+        # cropping to one hand would hide the other one in two-hand tracking
+        self._roi_wanted = roi
+        self.roi = RoiCropper() if (roi and max_num_hands == 1) else None
+        self.roi_hands = self._crop_hands() if self.roi is not None else None
+        self._roi_max_side = self.roi.max_side if self.roi is not None else 0
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.roi_misses = 0
+        self._roi_ms = 0.0
+        self._full_ms = 0.0
+
+    def configure(self, model_complexity=None, input_scale=None, max_num_hands=None, **_ignored):
+        """Apply quality settings (see governor.LEVELS) or a new hand count between frames."""
+        rebuild = False
+        if max_num_hands is not None and max_num_hands != self.options["max_num_hands"]:
+            self.options["max_num_hands"] = max_num_hands
+            if max_num_hands != 1:
+                self.roi = None
+            elif self._roi_wanted and self.roi is None:
+                self.roi = RoiCropper()
+                self._roi_max_side = self.roi.max_side
+            rebuild = True
+        if input_scale is not None:
+            self.input_scale = float(input_scale)
+            if self.roi is not None:
+                self.roi.max_side = max(96, int(self._roi_max_side * self.input_scale))
+        if model_complexity is not None and model_complexity != self.options["model_complexity"]:
+            self.options["model_complexity"] = model_complexity
+            rebuild = True
+        if rebuild:
+            import mediapipe as mp
+            self.close()
+            self.hands = mp.solutions.hands.Hands(**self.options)
+            if self.roi is not None:
+                self.roi_hands = self._crop_hands()
+
+    def _run(self, bgr, hands=None):
+        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        return result_from_mediapipe((hands or self.hands).process(rgb))
+
+    def _crop_hands(self):
+        import mediapipe as mp
+        return mp.solutions.hands.Hands(static_image_mode=True, **self.options)
+
+    def _process_full(self, bgr):
+        t0 = time.perf_counter()
+        if self.input_scale < 1.0:
+            # landmarks are normalized, so a smaller input needs no remapping
+            h, w = bgr.shape[:2]
+            size = (max(1, int(w * self.input_scale)), max(1, int(h * self.input_scale)))
+            bgr = cv2.resize(bgr, size, interpolation=cv2.INTER_AREA)
+        res = self._run(bgr)
+        ms = (time.perf_counter() - t0) * 1000.0
+        self._full_ms = ms if self.full_frames == 0 else self._full_ms * 0.9 + ms * 0.1
+        self.full_frames += 1
+        return res
+
+    def process(self, bgr, frame_seq=0):
+        t0 = time.perf_counter()
+        fh, fw = bgr.shape[:2]
+        box = self.roi.select(fw, fh) if self.roi is not None else None
+        if box is not None:
+            t_roi = time.perf_counter()
+            crop = self.roi.crop(bgr, box)
+            res = self._run(crop, self.roi_hands)
+            ms = (time.perf_counter() - t_roi) * 1000.0
+            self._roi_ms = ms if self.roi_frames == 0 else self._roi_ms * 0.9 + ms * 0.1
+            self.roi_frames += 1
+            if res.has_hands:
+                # map crop-normalized coordinates back to the full frame
+                x0, y0, side = box
+                res.landmarks[:, :, 0] = (x0 + res.landmarks[:, :, 0] * side) / fw
+                res.landmarks[:, :, 1] = (y0 + res.landmarks[:, :, 1] * side) / fh
+            else:
+                self.roi_misses += 1  # box cleared below, the next frame is searched in full
+        else:
+            res = self._process_full(bgr)
+        if self.roi is not None:
+            self.roi.update(res.landmarks, fw, fh)
+        res.frame_seq = frame_seq
+        res.infer_ms = (time.perf_counter() - t0) * 1000.0
+        return res
+
+    def stats(self):
+        if self.roi is None:
+            return {}
+        return {
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "roi_misses": self.roi_misses,
+            "roi_ms": self._roi_ms,
+            "full_ms": self._full_ms,
+            "roi_saved_ms": self._full_ms - self._roi_ms if self.roi_frames and self.full_frames else 0.0,
+        }
+
+    def close(self):
+        for hands in (self.hands, self.roi_hands):
+            try:
+                if hands is not None:
+                    hands.close()
+            except Exception:
+                pass
+        self.roi_hands = None
+
+
+class InlineTracker:
+    """Run the engine on the game thread (the original behaviour)."""
+
+    name = "inline"
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._latest = TrackingResult()
+        self._is_new = False
+        self.completed = 0
+        self.latency_ms = 0.0
+
+    def submit(self, frame, frame_seq):
+        t_sub = time.perf_counter()
+        self._latest = self.engine.process(frame, frame_seq)
+        self._latest.timestamp = t_sub
+        self._is_new = True
+        self.completed += 1
+        self.latency_ms = self._latest.infer_ms
+        return True
+
+    def poll(self):
+        is_new = self._is_new
+        self._is_new = False
+        return self._latest, is_new
+
+    def configure(self, **settings):
+        self.engine.configure(**settings)
+
+    def alive(self):
+        return True
+
+    def stats(self):
+        out = {"completed": self.completed, "skipped": 0,
+               "infer_ms": self._latest.infer_ms, "latency_ms": self.latency_ms}
+        out.update(self.engine.stats())
+        return out
+
+    def close(self):
+        self.engine.close()
+
+
+def _tracking_worker(shm_name, frame_shape, requests, results, engine_options):
+    """Worker process: read frames from shared memory, send landmarks back."""
+    # forked child: shares the parent's resource tracker, the parent unlinks the block
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((2,) + tuple(frame_shape), dtype=np.uint8, buffer=shm.buf)
+    engine = LegacyHandsEngine(**engine_options)
+    try:
+        while True:
+            msg = requests.get()
+            if msg is None:
+                break
+            if msg[0] == "config":
+                engine.configure(**msg[1])
+                continue
+            if msg[0] == "frames":
+                # the camera size changed: the parent allocated a new block
+                del frames
+                shm.close()
+                shm = shared_memory.SharedMemory(name=msg[1])
+                frames = np.ndarray((2,) + tuple(msg[2]), dtype=np.uint8, buffer=shm.buf)
+                continue
+            _, slot, frame_seq = msg
+            res = engine.process(frames[slot], frame_seq)
+            results.put((frame_seq, res.landmarks, res.handedness, res.infer_ms, engine.stats()))
+    finally:
+        engine.close()
+        del frames
+        shm.close()
+
+
+class ProcessTracker:
+    """Run MediaPipe in a worker process fed through shared memory.
+
+    Two frame slots live in one `SharedMemory` block: the worker reads the
+    in-flight slot while the game loop copies the newest camera frame into the
+    other one. Only the slot index and a sequence number go through the queue,
+    never the image. Frames arriving while inference is busy replace the
+    pending one (counted in `skipped`), so the worker always gets the freshest
+    frame next.
+
+    The slots are sized from `frame_size`, the negotiated capture size, so
+    frames are copied as they are. Should the camera deliver another size
+    later, a new block of that size replaces the old one (never a resize).
+    """
+
+    name = "process"
+
+    def __init__(self, frame_size=(640, 480), engine_options=None):
+        w, h = frame_size
+        self.frame_shape = (h, w, 3)
+        self.engine_options = dict(engine_options or {})
+        self._shm = None
+        self._frames = None
+        self._proc = None
+        self._requests = None
+        self._results = None
+        self._in_flight = None  # (slot, seq)
+        self._pending = None  # (slot, seq, submit time)
+        self._submit_times = {}
+        self._latest = TrackingResult()
+        self._is_new = False
+        self._engine_stats = {}
+        self.completed = 0
+        self.skipped = 0
+        self.latency_ms = 0.0
+
+    @staticmethod
+    def supported():
+        # the game lives in one top-level script, so a spawned child would
+        # re-run it; only fork-able platforms can host the worker
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def _allocate(self):
+        nbytes = 2 * int(np.prod(self.frame_shape))
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._frames = np.ndarray((2,) + self.frame_shape, dtype=np.uint8, buffer=self._shm.buf)
+
+    def _release_block(self):
+        self._frames = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except Exception:
+                pass
+            self._shm = None
+
+    def start(self):
+        ctx = multiprocessing.get_context("fork")
+        self._allocate()
+        self._requests = ctx.Queue()
+        self._results = ctx.Queue()
+        self._proc = ctx.Process(
+            target=_tracking_worker,
+            args=(self._shm.name, self.frame_shape, self._requests, self._results, self.engine_options),
+            name="hand-tracking",
+            daemon=True,
+        )
+        self._proc.start()
+        return self
+
+    def _resize_slots(self, shape):
+        # the worker keeps its mapping of the old block until it reads the
+        # "frames" message, which comes after any frame already queued
+        self._release_block()
+        self.frame_shape = tuple(shape)
+        self._allocate()
+        self._requests.put(("frames", self._shm.name, self.frame_shape))
+        self._pending = None  # its pixels were in the old block
+
+    def _write_slot(self, slot, frame):
+        if frame.shape != self.frame_shape:
+            self._resize_slots(frame.shape)
+        np.copyto(self._frames[slot], frame)
+
+    def _dispatch(self, slot, frame_seq, t_sub):
+        self._in_flight = (slot, frame_seq)
+        self._submit_times[frame_seq] = t_sub
+        self._requests.put(("frame", slot, frame_seq))
+
+    def submit(self, frame, frame_seq):
+        if self._in_flight is None:
+            self._write_slot(0, frame)
+            self._dispatch(0, frame_seq, time.perf_counter())
+            return True
+        # worker busy: park the frame in the free slot, replacing any older pending one
+        if self._pending is not None:
+            self.skipped += 1
+        free = 1 - self._in_flight[0]
+        self._write_slot(free, frame)
+        self._pending = (free, frame_seq, time.perf_counter())
+        return False
+
+    def poll(self):
+        while True:
+            try:
+                frame_seq, landmarks, handedness, infer_ms, engine_stats = self._results.get_nowait()
+            except queue.Empty:
+                break
+            except Exception:
+                break
+            self._latest = TrackingResult(landmarks, handedness, frame_seq, infer_ms)
+            self._engine_stats = engine_stats
+            self._is_new = True
+            self.completed += 1
+            t_sub = self._submit_times.pop(frame_seq, None)
+            if t_sub is not None:
+                self._latest.timestamp = t_sub
+                self.latency_ms = (time.perf_counter() - t_sub) * 1000.0
+            self._in_flight = None
+            if self._pending is not None:
+                slot, seq, t_sub = self._pending
+                self._pending = None
+                self._dispatch(slot, seq, t_sub)
+        is_new = self._is_new
+        self._is_new = False
+        return self._latest, is_new
+
+    def configure(self, **settings):
+        # handled by the worker between two frames
+        self.engine_options.update({k: v for k, v in settings.items()
+                                    if k in ("model_complexity", "input_scale", "max_num_hands")})
+        self._requests.put(("config", settings))
+
+    def alive(self):
+        return self._proc is not None and self._proc.is_alive()
+
+    def stats(self):
+        out = {"completed": self.completed, "skipped": self.skipped,
+               "infer_ms": self._latest.infer_ms, "latency_ms": self.latency_ms}
+        out.update(self._engine_stats)
+        return out
+
+    def close(self):
+        try:
+            if self._proc is not None and self._proc.is_alive():
+                self._requests.put(None)
+                self._proc.join(timeout=2.0)
+                if self._proc.is_alive():
+                    self._proc.terminate()
+        except Exception:
+            pass
+        self._release_block()
+
+
+class LatestResultSlot:
+    """Single-entry mailbox between a producer thread and the game loop.
+
+    `put()` overwrites whatever is stored (older results are worthless once a
+    newer one exists); `take()` returns the stored value and whether it
+    arrived since the previous `take()`.
+    """
+
+    def __init__(self, value=None):
+        self._lock = threading.Lock()
+        self._value = value
+        self._is_new = False
+        self.overwritten = 0
+
+    def put(self, value):
+        with self._lock:
+            if self._is_new:
+                self.overwritten += 1
+            self._value = value
+            self._is_new = True
+
+    def take(self):
+        with self._lock:
+            is_new = self._is_new
+            self._is_new = False
+            return self._value, is_new
+
+
+class TasksTracker:
+    """MediaPipe Tasks `HandLandmarker` in LIVE_STREAM mode.
+
+    `submit()` hands the frame to `detect_async()` with a strictly increasing
+    millisecond timestamp and returns immediately; MediaPipe runs inference on
+    its own thread and calls `_on_result`, which stores a `TrackingResult` in a
+    `LatestResultSlot` for `poll()`. Frames submitted while the graph is busy
+    are dropped by MediaPipe itself, they show up as `skipped`.
+
+    Needs the ``hand_landmarker.task`` model bundle (not shipped with the
+    mediapipe package).
+    """
+
+    name = "tasks"
+
+    def __init__(self, model_path, max_num_hands=1, min_detection_confidence=0.5,
+                 min_tracking_confidence=0.5, input_scale=1.0, **_ignored):
+        import mediapipe as mp
+        from mediapipe.tasks import python as mp_tasks
+        from mediapipe.tasks.python import vision
+
+        self._mp = mp
+        self.input_scale = input_scale
+        self._slot = LatestResultSlot(TrackingResult())
+        self._latest = TrackingResult()
+        self._lock = threading.Lock()
+        self._submit_times = {}  # timestamp_ms -> (frame_seq, perf_counter at submit)
+        self._last_ts = -1
+        self._t0 = time.perf_counter()
+        self.submitted = 0
+        self.completed = 0
+        self.latency_ms = 0.0
+        self._latency_sum = 0.0
+        self._vision = vision
+        self.options = vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result,
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(self.options)
+
+    def _on_result(self, result, _image, timestamp_ms):
+        # runs on a MediaPipe thread: only touch the slot and locked counters
+        now = time.perf_counter()
+        with self._lock:
+            seq, t_sub = self._submit_times.pop(timestamp_ms, (0, now))
+            # results come back in timestamp order, anything older was dropped
+            for ts in [ts for ts in self._submit_times if ts < timestamp_ms]:
+                del self._submit_times[ts]
+            latency = (now - t_sub) * 1000.0
+            self.completed += 1
+            self._latency_sum += latency
+            self.latency_ms = latency
+        hand_list = result.hand_landmarks or []
+        arr = np.empty((len(hand_list), NUM_LANDMARKS, 3), dtype=np.float32)
+        for i, hand in enumerate(hand_list):
+            for j, lm in enumerate(hand):
+                arr[i, j, 0] = lm.x
+                arr[i, j, 1] = lm.y
+                arr[i, j, 2] = lm.z
+        handedness = []
+        for cats in result.handedness or []:
+            try:
+                handedness.append(cats[0].category_name)
+            except Exception:
+                handedness.append("")
+        # submit-to-callback time: the only inference cost the async API exposes
+        self._slot.put(TrackingResult(arr, handedness, seq, latency, t_sub))
+
+    def submit(self, frame, frame_seq):
+        t_sub = time.perf_counter()
+        ts = int((t_sub - self._t0) * 1000.0)
+        if ts <= self._last_ts:
+            # MediaPipe rejects timestamps that do not increase
+            ts = self._last_ts + 1
+        self._last_ts = ts
+        if self.input_scale < 1.0:
+            h, w = frame.shape[:2]
+            size = (max(1, int(w * self.input_scale)), max(1, int(h * self.input_scale)))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        with self._lock:
+            self._submit_times[ts] = (frame_seq, t_sub)
+        self.submitted += 1
+        self.landmarker.detect_async(self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb), ts)
+        return True
+
+    def poll(self):
+        res, is_new = self._slot.take()
+        if is_new:
+            self._latest = res
+        return self._latest, is_new
+
+    def configure(self, input_scale=None, max_num_hands=None, **_ignored):
+        # the task bundle has a single model, so complexity steps are a no-op here
+        if input_scale is not None:
+            self.input_scale = float(input_scale)
+        if max_num_hands is not None and max_num_hands != self.options.num_hands:
+            self.close()
+            self.options.num_hands = max_num_hands
+            self.landmarker = self._vision.HandLandmarker.create_from_options(self.options)
+
+    def alive(self):
+        return True
+
+    def stats(self):
+        with self._lock:
+            completed = self.completed
+            in_flight = len(self._submit_times)
+            mean = self._latency_sum / completed if completed else 0.0
+            latency = self.latency_ms
+        return {"completed": completed,
+                "skipped": max(0, self.submitted - completed - in_flight) + self._slot.overwritten,
+                "infer_ms": self._latest.infer_ms, "latency_ms": latency, "mean_latency_ms": mean}
+
+    def close(self):
+        try:
+            self.landmarker.close()
+        except Exception:
+            pass
+
+
+def create_tracker(mode="inline", frame_size=(640, 480), backend="legacy", model_path="hand_landmarker.task",
+                   **engine_options):
+    """Build the tracker selected by `backend` and `mode`.
+
+    `backend="tasks"` uses `TasksTracker` (MediaPipe runs asynchronously, so
+    `mode` does not apply); `backend="legacy"` uses `mp.solutions.hands`
+    inline or, with `mode="process"`, in a worker process whose frame slots
+    are `frame_size` (the capture's (width, height); None: 640x480). Falls
+    back to legacy inline tracking when the chosen setup cannot be used here.
+    """
+    if backend == "tasks":
+        if not os.path.exists(model_path):
+            print("Hand landmarker model not found, using legacy tracking:", model_path)
+        else:
+            try:
+                return TasksTracker(model_path, **engine_options)
+            except Exception as e:
+                print("MediaPipe Tasks tracker failed to start, using legacy tracking:", e)
+    if mode == "process":
+        if ProcessTracker.supported():
+            try:
+                return ProcessTracker(frame_size or (640, 480), engine_options).start()
+            except Exception as e:
+                print("Tracking worker failed to start, using inline tracking:", e)
+        else:
+            print("Tracking worker needs fork(); using inline tracking on this platform")
+    return InlineTracker(LegacyHandsEngine(**engine_options))
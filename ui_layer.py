@@ -0,0 +1,92 @@
+"""Retained UI layer for the menu, settings and shop screens.
+
+Those screens used to redraw the dimming overlay, every button, card,
+shadow and label on every frame although only the camera background behind
+them changes. `RetainedLayer` keeps the whole UI in one screen-sized surface
+that is only redrawn when its key changes (hover, a toggle, a purchase, the
+shop scroll offset, ...); every other frame the UI costs one blit on top of
+the camera frame.
+
+pygame's alpha blit onto a translucent destination darkens the result
+(it does not divide by the resulting alpha), which shows on antialiased text
+edges over the dimmed background. `RetainedLayer.blit()` composites with the
+exact "over" formula instead, so blitting the layer gives the same pixels as
+drawing each piece onto the screen directly. That costs a little NumPy work
+per piece, but only when the layer is rebuilt.
+"""
+import numpy as np
+import pygame
+
+
+class RetainedLayer:
+    """One cached screen-sized UI surface, rebuilt when its key changes.
+
+    Per frame::
+
+        if layer.begin(key):     # key changed -> cleared, draw the UI again
+            layer.fill((0, 0, 0, 160))
+            pygame.draw.rect(layer.surface, (30, 30, 30), rect)  # opaque shapes
+            layer.blit(text_surface, pos)                        # alpha surfaces
+        layer.draw(screen)
+    """
+
+    def __init__(self, size):
+        self.size = (int(size[0]), int(size[1]))
+        self.surface = None
+        self.key = None
+        self.frames = 0
+        self.rebuilds = 0
+
+    def begin(self, key):
+        """Return True (and clear the layer) when the UI must be drawn again for `key`."""
+        self.frames += 1
+        if self.surface is not None and key == self.key:
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self.key = key
+        self.rebuilds += 1
+        return True
+
+    def invalidate(self):
+        self.key = None
+
+    def fill(self, color, rect=None):
+        self.surface.fill(color, rect)
+
+    def blit(self, source, pos, area=None):
+        """Alpha-composite `source` onto the layer like ``screen.blit`` would onto the screen."""
+        if not source.get_flags() & pygame.SRCALPHA:
+            self.surface.blit(source, pos, area)
+            return
+        if area is not None:
+            source = source.subsurface(area)
+        dest = pygame.Rect(pos, source.get_size()).clip(self.surface.get_rect())
+        if dest.w <= 0 or dest.h <= 0:
+            return
+        alpha = pygame.surfarray.pixels_alpha(self.surface)[dest.x:dest.right, dest.y:dest.bottom]
+        if alpha.min() == 255:
+            # onto opaque pixels pygame's own blend is already exact
+            del alpha
+            self.surface.blit(source, pos)
+            return
+        sx, sy = dest.x - int(pos[0]), dest.y - int(pos[1])
+        src_rgb = pygame.surfarray.array3d(source)[sx:sx + dest.w, sy:sy + dest.h].astype(np.float32)
+        src_a = pygame.surfarray.array_alpha(source)[sx:sx + dest.w, sy:sy + dest.h].astype(np.float32) / 255.0
+        rgb = pygame.surfarray.pixels3d(self.surface)[dest.x:dest.right, dest.y:dest.bottom]
+        dst_a = alpha.astype(np.float32) / 255.0
+        out_a = src_a + dst_a * (1.0 - src_a)
+        weight = (dst_a * (1.0 - src_a))[..., None]
+        out_rgb = (src_rgb * src_a[..., None] + rgb.astype(np.float32) * weight) / np.maximum(out_a, 1e-6)[..., None]
+        rgb[...] = np.clip(out_rgb + 0.5, 0, 255).astype(np.uint8)
+        alpha[...] = np.clip(out_a * 255.0 + 0.5, 0, 255).astype(np.uint8)
+        del rgb, alpha
+
+    def draw(self, screen):
+        if self.surface is not None:
+            screen.blit(self.surface, (0, 0))
+
+    def stats(self):
+        return {"rebuilds": self.rebuilds,
+                "rebuild_pct": (100.0 * self.rebuilds / self.frames) if self.frames else 0.0}